@@ -11,74 +11,81 @@ An account contains:
 """
 
 from typing import Any
-from cpf_validator import main as verify_cpf, remove_punctuation_from_cpf as format_cpf
+from cpf_validator import (verify_cpf_fast as verify_cpf, remove_punctuation_from_cpf as format_cpf,
+                           normalize_cpf)
 from users import find_user_in_database
-
-def register_account(user_arr: list[dict[str, Any]],
-                     acc_arr: list[dict[str, Any]],
-                     agency_number: str="0001") -> list[dict[str, Any]]:
+from storage import AccountStorage
+from renderers import render_accounts
+from metrics import instrument
+
+@instrument('open_account')
+def open_account(user_arr: list[dict[str, Any]],
+                 acc_arr: list[dict[str, Any]],
+                 owner_cpf: str,
+                 agency_number: str="0001") -> dict[str, Any]:
     """
-    Using a `while` loop, it allows the user to insert a CPF, and, if it's valid,
-    verifies if it's on the user database. If not, refuses the account creation.
+    Opens an account for the user with the given CPF, without any terminal
+    I/O, and returns it. Refuses the account creation, raising `ValueError`,
+    if the user isn't in the user database.
 
     Params:
     @user_arr: list of users registered in the bank app;
-    @acc_arr: list of accounts existing in the bank;
+    @acc_arr: list of accounts existing in the bank (or an `AccountStorage`,
+    such as the `AccountRegistry`, which hands out collision-free IDs);
+    @owner_cpf: the account owner's CPF, with or without punctuation;
     @agency_number: default agency number.
     """
 
-    while True:
-        account_owner_cpf = input("Insira o CPF do dono da conta a ser criada: ")
-
-        is_valid = verify_cpf(account_owner_cpf)
+    owner_cpf = normalize_cpf(owner_cpf)
 
-        if is_valid:
-            account_owner_cpf = format_cpf(account_owner_cpf)
+    if verify_cpf(owner_cpf):
+        owner_cpf = format_cpf(owner_cpf)
 
-        find_user_in_user_db = [user for user in user_arr
-                                if user.get('cpf', None) == account_owner_cpf]
+    find_user_in_user_db = find_user_in_database(user_arr, owner_cpf)
 
-        if len(find_user_in_user_db) == 0:
-            # if a list is returned, then, user exists:
-            raise ValueError('um usuário com este CPF não existe na base de dados.')
+    if len(find_user_in_user_db) == 0:
+        # if a list is returned, then, user exists:
+        raise ValueError('um usuário com este CPF não existe na base de dados.')
 
-        account:dict[str, str|int] = {
-            "id": 1 if acc_arr == [] else len(acc_arr) + 1,
-            "agency": agency_number,
-            "user": account_owner_cpf
-        }
+    if isinstance(acc_arr, AccountStorage):
+        return acc_arr.register(owner_cpf, agency_number)
 
-        acc_arr.append(account)
+    account:dict[str, str|int] = {
+        "id": 1 if acc_arr == [] else len(acc_arr) + 1,
+        "agency": agency_number,
+        "user": owner_cpf
+    }
 
-        print(f"Conta de ID {account.get('id', None)} foi criada para "
-            f"o usuário de CPF {account_owner_cpf}")
+    acc_arr.append(account)
 
-        return acc_arr
+    return account
 
-def print_account_list(acc_database: list, user_database: list):
-    """
-    Prints all account's data on the terminal with adequate formatting
+def register_account(user_arr: list[dict[str, Any]],
+                     acc_arr: list[dict[str, Any]],
+                     agency_number: str="0001") -> list[dict[str, Any]]:
     """
+    Asks the owner's CPF and opens the account with `open_account`.
 
-    formatted_acc_database = []
+    Params:
+    @user_arr: list of users registered in the bank app;
+    @acc_arr: list of accounts existing in the bank (or an `AccountStorage`,
+    such as the `AccountRegistry`, which hands out collision-free IDs);
+    @agency_number: default agency number.
+    """
 
-    if len(acc_database) > 0:
-        for account in acc_database:
-            user_cpf = account.get("user", "Usuário desconhecido")
+    account_owner_cpf = input("Insira o CPF do dono da conta a ser criada: ")
 
-            user_data = find_user_in_database(user_database, user_cpf)
+    account = open_account(user_arr, acc_arr, account_owner_cpf, agency_number)
 
-            if len(user_data) > 0:
-                user_name = user_data[0].get("name", "Usuário desconhecido")
-            else:
-                raise ValueError("Usuário não existe na base de dados!")
+    print(f"Conta de ID {account.get('id', None)} foi criada para "
+        f"o usuário de CPF {account.get('user', None)}")
 
-            formatted_acc_database.append(
-                f'Identificador único:\t{account.get("id", "ID desconhecido")}\n'
-                f'Agência:\t{account.get("agency", "Agência desconhecida")}\n'
-                f'Nome do usuário:\t{user_name}'
-            )
+    return acc_arr
 
-        print('\n'.join(formatted_acc_database))
-    else:
-        print('Nenhuma conta registrada até o momento')
+def print_account_list(acc_database: list, user_database: list):
+    """
+    Prints all account's data on the terminal with adequate formatting,
+    streaming it through `renderers.render_accounts` (the owners' names
+    come from a single pass over the user database)
+    """
+    render_accounts(acc_database, user_database)
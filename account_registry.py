@@ -0,0 +1,239 @@
+"""
+This module contains the `AccountRegistry`, an indexed container for the
+bank's accounts.
+
+Account IDs come from a monotonic sequence, so they never collide, even
+after an account is removed. Accounts are indexed by ID and by the
+owner's CPF, so both lookups cost the same regardless of how many
+accounts exist.
+
+As in the `UserStore`, changes can be tracked for incremental
+checkpoints (see `checkpoint`).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+from collections.abc import Collection
+from typing import Any, Iterable
+
+from storage import AccountStorage
+
+class AccountRegistry(Collection, AccountStorage):
+    """
+    Account database with ID allocation and a per-owner index.
+
+    Iterating over the registry yields the account dicts in ID order,
+    just like the old list of accounts. IDs from the sequence always come
+    last, so the order is kept for free; an account loaded with a smaller
+    ID than the ones already there makes the indexes be re-sorted (once)
+    on the next read.
+
+    Params:
+    @accounts: optional iterable of existing account dicts (with `id`)
+    @start_id: first ID handed out by the sequence
+    @track_changes: if `True`, changes are recorded for `take_changes`
+    """
+
+    def __init__(self, accounts: Iterable[dict[str, Any]] = (), start_id: int = 1,
+                 track_changes: bool = False):
+        self._by_id: dict[int, dict[str, Any]] = {}
+        self._by_owner: dict[str, dict[int, dict[str, Any]]] = {}
+        self._next_id = start_id
+        self._changes: dict[int, dict[str, Any] | None] | None = (
+            {} if track_changes else None)
+        self._sorted = True
+
+        for account in accounts:
+            self._add(account)
+
+    def _add(self, account: dict[str, Any]):
+        """Indexes an account that already has an ID"""
+        acc_id = account['id']
+
+        if acc_id in self._by_id:
+            raise ValueError(f'já existe uma conta com o ID {acc_id}.')
+
+        if self._by_id and acc_id < next(reversed(self._by_id)):
+            self._sorted = False
+
+        self._by_id[acc_id] = account
+        self._by_owner.setdefault(account.get('user', None), {})[acc_id] = account
+
+        if self._changes is not None:
+            self._changes[acc_id] = account
+
+        if acc_id >= self._next_id:
+            self._next_id = acc_id + 1
+
+    def _sort(self):
+        """Puts both indexes back in ID order"""
+        self._by_id = dict(sorted(self._by_id.items()))
+        self._by_owner = {owner_cpf: dict(sorted(owner_accounts.items()))
+                          for owner_cpf, owner_accounts in self._by_owner.items()}
+        self._sorted = True
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self):
+        if not self._sorted:
+            self._sort()
+        return iter(self._by_id.values())
+
+    def __contains__(self, account) -> bool:
+        if isinstance(account, dict):
+            return self._by_id.get(account.get('id', None)) is account
+        return False
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AccountRegistry):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'AccountRegistry({list(self)!r})'
+
+    @property
+    def next_id(self) -> int:
+        """The ID that the next registered account will receive"""
+        return self._next_id
+
+    def register(self, owner_cpf: str, agency_number: str = "0001") -> dict[str, Any]:
+        """
+        Creates a new account for the given owner and returns it.
+
+        The owner is not validated here; that is up to the caller
+        (see `account.register_account`).
+
+        Params:
+        @owner_cpf: the owner's CPF, without punctuation
+        @agency_number: the account's agency
+        """
+        account: dict[str, str|int] = {
+            "id": self._next_id,
+            "agency": agency_number,
+            "user": owner_cpf
+        }
+
+        self._next_id += 1
+        self._by_id[account["id"]] = account
+        self._by_owner.setdefault(owner_cpf, {})[account["id"]] = account
+
+        if self._changes is not None:
+            self._changes[account["id"]] = account
+
+        return account
+
+    def register_many(self, owner_cpfs: Iterable[str],
+                      agency_number: str = "0001") -> list[dict[str, Any]]:
+        """
+        Creates one account per CPF in `owner_cpfs`, in order, and
+        returns the created accounts.
+
+        Params:
+        @owner_cpfs: iterable of owners' CPFs, without punctuation
+        @agency_number: the agency used for every new account
+        """
+        by_id = self._by_id
+        by_owner = self._by_owner
+        next_id = self._next_id
+        created = []
+
+        for owner_cpf in owner_cpfs:
+            account = {"id": next_id, "agency": agency_number, "user": owner_cpf}
+            by_id[next_id] = account
+            owner_accounts = by_owner.get(owner_cpf)
+            if owner_accounts is None:
+                owner_accounts = by_owner[owner_cpf] = {}
+            owner_accounts[next_id] = account
+            created.append(account)
+            next_id += 1
+
+        self._next_id = next_id
+
+        if self._changes is not None:
+            self._changes.update((account["id"], account) for account in created)
+
+        return created
+
+    def get(self, acc_id: int) -> dict[str, Any] | None:
+        """Returns the account with the given ID, or `None`"""
+        return self._by_id.get(acc_id, None)
+
+    def find_by_owner(self, owner_cpf: str) -> list[dict[str, Any]]:
+        """Returns every account owned by the given CPF, in ID order"""
+        if not self._sorted:
+            self._sort()
+        return list(self._by_owner.get(owner_cpf, {}).values())
+
+    def remove(self, acc_id: int) -> dict[str, Any]:
+        """
+        Removes the account with the given ID and returns it. The ID is
+        never handed out again.
+        """
+        account = self._by_id.pop(acc_id, None)
+
+        if account is None:
+            raise ValueError(f'a conta de ID {acc_id} não existe.')
+
+        owner_cpf = account.get('user', None)
+        owner_accounts = self._by_owner[owner_cpf]
+        del owner_accounts[acc_id]
+        if not owner_accounts:
+            del self._by_owner[owner_cpf]
+
+        if self._changes is not None:
+            self._changes[acc_id] = None
+
+        return account
+
+    def load(self, accounts: list[dict[str, Any]]):
+        """
+        Adds many accounts that already have IDs at once, building the
+        indexes in bulk, which is much faster than adding them one by one
+        for large loads (e.g. a snapshot). Repeated IDs are refused.
+
+        Params:
+        @accounts: list of account dicts
+        """
+        by_id = dict(zip([account['id'] for account in accounts], accounts))
+
+        if len(by_id) != len(accounts) or not self._by_id.keys().isdisjoint(by_id):
+            # let `_add` raise on the first repeated ID
+            for account in accounts:
+                self._add(account)
+            return
+
+        ids = list(by_id)
+        if (self._by_id and ids and ids[0] < next(reversed(self._by_id))
+                or any(a > b for a, b in zip(ids, ids[1:]))):
+            self._sorted = False
+
+        self._by_id.update(by_id)
+        by_owner = self._by_owner
+
+        for acc_id, account in by_id.items():
+            owner_accounts = by_owner.get(account.get('user', None))
+            if owner_accounts is None:
+                owner_accounts = by_owner[account.get('user', None)] = {}
+            owner_accounts[acc_id] = account
+
+        if by_id:
+            self._next_id = max(self._next_id, max(by_id) + 1)
+
+        if self._changes is not None:
+            self._changes.update(by_id)
+
+    def take_changes(self) -> dict[int, dict[str, Any] | None]:
+        """
+        Returns the accounts changed since the last call, keyed by ID (`None`
+        for removed accounts), and starts recording again.
+        """
+        if self._changes is None:
+            raise ValueError('o AccountRegistry não está registrando alterações.')
+
+        changes, self._changes = self._changes, {}
+        return changes
@@ -5,8 +5,16 @@ such as withdrawing money, depositing money, and printing the statement.
 @author: Beatriz (beabea)
 @date: 2025-04-05
 """
+
+from storage import StatementStorage
+from errors import DailyLimitError, MinimumValueError, InsufficientBalanceError
+from money import format_cents
+from metrics import instrument
+from renderers import PRETTIFY_NAMES, format_statement_entry, render_statement
+
 LIMIT_PER_WITHDRAWAL = 500 # equivalent to 'limite por saque'
 LIMIT_OF_WITHDRAWALS = 3 # equivalent to 'limitet de saques diários'
+LIMIT_PER_WITHDRAWAL_CENTS = LIMIT_PER_WITHDRAWAL * 100
 
 def convert_str_to_float(value: str) -> float:
     """
@@ -37,6 +45,7 @@ def convert_str_to_float(value: str) -> float:
     except TypeError as te:
         raise ValueError(err_msg) from te
 
+@instrument('withdraw_money')
 def withdraw_money(balance: str, current_withdrawal_number: int,
                    value: float, statement: list) -> tuple:
     """
@@ -68,18 +77,29 @@ def withdraw_money(balance: str, current_withdrawal_number: int,
         statement = add_to_statement('withdrawal', value, balance, statement)
         return balance, current_withdrawal_number, statement
 
+    raise_withdrawal_error(below_max_daily_withdrawals, value_is_500_or_more,
+                           saldo_bigger_than_value)
+
+    return balance, current_withdrawal_number, statement
+
+def raise_withdrawal_error(below_max_daily_withdrawals: bool, value_is_500_or_more: bool,
+                           saldo_bigger_than_value: bool):
+    """
+    Raises the `ValueError` (one of `errors`) explaining why a withdrawal was
+    refused, checking the rules in the same order for every withdrawal path.
+    """
     if not below_max_daily_withdrawals:
-        raise ValueError('você já excedeu o número máximo de saques diários')
+        raise DailyLimitError('você já excedeu o número máximo de saques diários')
 
     if not value_is_500_or_more:
-        raise ValueError(f'o valor mínimo para realizar o saque é R$ {LIMIT_PER_WITHDRAWAL}, '
+        raise MinimumValueError(f'o valor mínimo para realizar o saque é R$ {LIMIT_PER_WITHDRAWAL}, '
             'por favor, repita a operação inserindo um valor de saque maior ou igual ao limite')
 
     if not saldo_bigger_than_value:
-        raise ValueError('o saldo disponível na conta é insuficiente para realizar o saque.')
-
-    return balance, current_withdrawal_number, statement
+        raise InsufficientBalanceError('o saldo disponível na conta é insuficiente '
+                                       'para realizar o saque.')
 
+@instrument('deposit_money')
 def deposit_money(balance: str, value: float, statement: list) -> tuple:
     """
     Deposits money to the user's own account.
@@ -105,6 +125,56 @@ def deposit_money(balance: str, value: float, statement: list) -> tuple:
 
     return balance, changed_statement
 
+def withdraw_cents(balance: int, current_withdrawal_number: int,
+                   value: int, statement: StatementStorage) -> tuple:
+    """
+    Same as `withdraw_money`, with the `balance` and `value` in integer cents
+    (see `money`), registering the operation on a `StatementStorage` (e.g.
+    a `CompactStatement`).
+
+    Params:
+    @balance: the account's total balance, in cents
+    @current_withdrawal_number: the number of withdrawals the user made in the current day
+    @value: the amount of money to be withdrawn, in cents
+    @statement: the user's account statement
+    """
+
+    below_max_daily_withdrawals = current_withdrawal_number < LIMIT_OF_WITHDRAWALS
+    value_is_500_or_more = value >= LIMIT_PER_WITHDRAWAL_CENTS
+    saldo_bigger_than_value = balance >= value
+
+    if below_max_daily_withdrawals and value_is_500_or_more and saldo_bigger_than_value:
+        balance -= value
+        current_withdrawal_number += 1
+        print(f'O saque de R$ {format_cents(value)} foi realizado com sucesso!')
+        statement.append_cents('withdrawal', value, balance)
+        return balance, current_withdrawal_number, statement
+
+    raise_withdrawal_error(below_max_daily_withdrawals, value_is_500_or_more,
+                           saldo_bigger_than_value)
+
+    return balance, current_withdrawal_number, statement
+
+def deposit_cents(balance: int, value: int, statement: StatementStorage) -> tuple:
+    """
+    Same as `deposit_money`, with the `balance` and `value` in integer cents
+    (see `money`), registering the operation on a `StatementStorage` (e.g.
+    a `CompactStatement`).
+
+    Params:
+    @balance: the account's total balance, in cents
+    @value: the amount of money to be deposited, in cents
+    @statement: the user's account statement
+    """
+    if value > 0:
+        balance += value
+        print(f'O depósito de R$ {format_cents(value)} foi realizado com sucesso!')
+        statement.append_cents('deposit', value, balance)
+    else:
+        raise ValueError('o valor para depósito deve ser maior que zero.')
+
+    return balance, statement
+
 def add_to_statement(operation_type: str, value: float,
                      balance: float, statement: list) -> list:
     """
@@ -127,10 +197,10 @@ def add_to_statement(operation_type: str, value: float,
     else:
         raise TypeError(f"o saldo deve ser numérico, e não {type(value)}")
 
-    if isinstance(statement, list):
+    if isinstance(statement, (list, StatementStorage)):
         pass
     else:
-        raise TypeError("o extrato deve ser uma lista (tipo `list`)")
+        raise TypeError("o extrato deve ser uma lista (tipo `list` ou `StatementStorage`)")
 
     if isinstance(operation_type, str):
         pass
@@ -152,21 +222,7 @@ def add_to_statement(operation_type: str, value: float,
 
 def print_statement(statement: list):
     """
-    Prints the account's statement on the terminal with adequate formatting
+    Prints the account's statement on the terminal with adequate formatting,
+    streaming it through `renderers.render_statement`
     """
-
-    prettify_names = {
-        'withdrawal': 'saque',
-        'deposit': 'depósito'
-    }
-
-    if len(statement) > 0:
-        formatted_statement = [
-            f'Operação: {prettify_names.get(ext.get("operation_type", {}), "N/A")}\n'
-            f'Valor da operação:\tR$ {ext.get("value", 0):.2f}\n'
-            f'Saldo após a operação:\tR$ {ext.get("saldo_after_operation", 0):.2f}'
-            for ext in statement
-        ]
-        print('\n'.join(formatted_statement))
-    else:
-        print('Nenhuma operação feita até o momento')
+    render_statement(statement)
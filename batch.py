@@ -0,0 +1,425 @@
+"""
+This module contains the batch settlement: it applies a file of deposits
+and withdrawals (e.g. an end-of-day file) to the `Ledger`, following the
+same rules as `banking_methods.deposit_money` and
+`banking_methods.withdraw_money`.
+
+The file is read as a stream (CSV or JSONL) and processed in chunks, so
+memory depends on the chunk size, not on the file size. Each operation's
+result (accepted, with the new balance, or rejected, with the reason)
+is written incrementally to a results CSV, and the counters and the
+throughput are reported at the end.
+
+With `--workers N`, the operations are partitioned by account ID across
+N processes (see `settle_file_sharded`).
+
+Input columns/keys: `acc_id`, `operation_type` ('deposit' or 'withdrawal')
+and `value` (in reais, with comma or dot as the decimal separator).
+
+Usage:
+    python batch.py transactions.csv [--results results.csv] [--journal banking_journal.bin]
+                    [--open-accounts] [--chunk-size 10000] [--workers 1]
+                    [--profile [PREFIX]] [--profile-top 20]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import argparse
+import csv
+import heapq
+import json
+import marshal
+import os
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Iterator, NamedTuple
+
+from journal import Journal
+from ledger import Ledger, check_account_id
+from money import parse_cents, format_cents
+from profiling import add_profile_arguments, profile_session
+
+RESULT_COLUMNS = ['line', 'acc_id', 'operation_type', 'value', 'status', 'detail']
+
+class Transaction(NamedTuple):
+    """One operation read from a batch file, still unvalidated"""
+    line: int
+    acc_id: Any
+    operation_type: Any
+    value: Any
+
+class BatchReport:
+    """Counters of a batch run"""
+    PROCESSED_LABEL = 'Operações processadas'
+    RATE_LABEL = 'operações/s'
+
+    def __init__(self):
+        self.accepted = 0
+        self.rejected = 0
+        self.rejections: Counter[str] = Counter()
+        self.elapsed = 0.0
+
+    @property
+    def total(self) -> int:
+        """Number of operations read"""
+        return self.accepted + self.rejected
+
+    @property
+    def ops_per_second(self) -> float:
+        """Throughput of the run"""
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        """Formats the report for the terminal"""
+        lines = [
+            f'{self.PROCESSED_LABEL}:\t{self.total}',
+            f'Aceitas:\t{self.accepted}',
+            f'Rejeitadas:\t{self.rejected}',
+        ]
+        lines += [f'\t{count}x {reason}' for reason, count in self.rejections.most_common()]
+        lines.append(f'Tempo:\t{self.elapsed:.3f} s ({self.ops_per_second:,.0f} {self.RATE_LABEL})')
+
+        return '\n'.join(lines)
+
+def read_transactions(path: str) -> Iterator[Transaction]:
+    """
+    Streams the operations of a CSV (with header) or JSONL file; the
+    format is picked by the file extension.
+
+    Params:
+    @path: the batch file
+    """
+    with open(path, encoding='utf-8', newline='') as batch_file:
+        if path.endswith(('.jsonl', '.ndjson')):
+            for line, raw in enumerate(batch_file, start=1):
+                if not raw.strip():
+                    continue
+                try:
+                    record = json.loads(raw)
+                except json.JSONDecodeError:
+                    record = {}
+                if not isinstance(record, dict):
+                    record = {}
+                yield Transaction(line, record.get('acc_id'), record.get('operation_type'),
+                                  record.get('value'))
+        else:
+            reader = csv.reader(batch_file)
+            header = next(reader, [])
+            columns = [header.index(name) if name in header else None
+                       for name in ('acc_id', 'operation_type', 'value')]
+
+            if None in columns:
+                raise ValueError(f'o arquivo {path} deve ter as colunas acc_id, '
+                                 'operation_type e value.')
+
+            acc_id_col, operation_type_col, value_col = columns
+            width = max(columns) + 1
+
+            for line, row in enumerate(reader, start=2):
+                if len(row) < width:
+                    if not row:
+                        continue
+                    row += [None] * (width - len(row))
+                yield Transaction(line, row[acc_id_col], row[operation_type_col],
+                                  row[value_col])
+
+def apply_transaction(ledger: Ledger, transaction: Transaction,
+                      open_accounts: bool = False) -> tuple[int, int]:
+    """
+    Validates and applies one operation, returning (account ID, new balance).
+    Raises `ValueError` with the reason when the operation is refused,
+    including IDs and amounts too large for the journal's records.
+
+    Params:
+    @ledger: the ledger holding the accounts
+    @transaction: the operation read from the batch file
+    @open_accounts: if `True`, unknown accounts are opened with a zero balance
+    """
+    acc_id = transaction.acc_id
+    if acc_id.__class__ is str and acc_id.isdecimal():
+        acc_id = int(acc_id)
+    elif acc_id.__class__ is not int:
+        raise ValueError('o ID da conta deve ser um número inteiro.')
+    check_account_id(acc_id)
+
+    if transaction.value is None:
+        raise ValueError('o valor da operação não foi informado.')
+    value = parse_cents(transaction.value)
+
+    operation_type = transaction.operation_type
+    if operation_type != 'deposit' and operation_type != 'withdrawal':
+        raise ValueError('o tipo de operação é inválido.')
+
+    if open_accounts and acc_id not in ledger:
+        ledger.open_account(acc_id)
+
+    if operation_type == 'deposit':
+        return acc_id, ledger.deposit(acc_id, value)
+    return acc_id, ledger.withdraw(acc_id, value)
+
+def settle_file(input_path: str, ledger: Ledger, results_path: str | None = None,
+                chunk_size: int = 10000, open_accounts: bool = False) -> BatchReport:
+    """
+    Applies every operation of a batch file to the ledger, in file order.
+
+    Params:
+    @input_path: the CSV or JSONL batch file
+    @ledger: the ledger holding the accounts
+    @results_path: optional CSV where each operation's result is written
+    @chunk_size: number of operations read and written at a time
+    @open_accounts: if `True`, unknown accounts are opened with a zero balance
+    """
+    report = BatchReport()
+    transactions = read_transactions(input_path)
+    results_file = None
+    writer = None
+
+    if results_path is not None:
+        results_file = open(results_path, 'w', encoding='utf-8', newline='',
+                            buffering=1024 * 1024)
+        writer = csv.writer(results_file)
+        writer.writerow(RESULT_COLUMNS)
+
+    start = time.perf_counter()
+
+    try:
+        while True:
+            chunk = list(islice(transactions, chunk_size))
+            if not chunk:
+                break
+
+            results = settle_chunk(ledger, chunk, report, open_accounts)
+
+            if writer is not None:
+                writer.writerows(results)
+    finally:
+        report.elapsed = time.perf_counter() - start
+        if results_file is not None:
+            results_file.close()
+
+    return report
+
+def settle_chunk(ledger: Ledger, chunk: list[Transaction], report: BatchReport,
+                 open_accounts: bool = False) -> list[tuple]:
+    """
+    Applies a chunk of operations, updating the report's counters, and
+    returns one result row (see `RESULT_COLUMNS`) per operation.
+    """
+    results = []
+
+    for transaction in chunk:
+        try:
+            acc_id, balance = apply_transaction(ledger, transaction, open_accounts)
+        except ValueError as e:
+            report.rejected += 1
+            report.rejections[str(e)] += 1
+            results.append((transaction.line, transaction.acc_id,
+                            transaction.operation_type, transaction.value,
+                            'rejected', str(e)))
+        else:
+            report.accepted += 1
+            results.append((transaction.line, acc_id, transaction.operation_type,
+                            transaction.value, 'accepted', format_cents(balance)))
+
+    return results
+
+def shard_of(acc_id: Any, shards: int) -> int:
+    """
+    Returns the shard owning the account; invalid IDs go to shard 0, where
+    they are rejected like in `settle_file`.
+    """
+    if acc_id.__class__ is str and acc_id.isdecimal():
+        acc_id = int(acc_id)
+    if acc_id.__class__ is int:
+        return acc_id % shards
+    return 0
+
+def _dump_frames(path: str, frames: Iterator[list]):
+    """Writes lists of tuples to a temporary file, one `marshal` frame each"""
+    with open(path, 'wb') as frames_file:
+        for frame in frames:
+            marshal.dump(frame, frames_file)
+
+def _load_frames(path: str) -> Iterator[tuple]:
+    """Reads back, item by item, the frames written by `_dump_frames`"""
+    with open(path, 'rb') as frames_file:
+        while True:
+            try:
+                yield from marshal.load(frames_file)
+            except EOFError:
+                return
+
+def _partition(input_path: str, shard_paths: list[str], chunk_size: int):
+    """
+    Splits the batch file into one file per shard, keeping the input order
+    inside each shard. At most `chunk_size` operations per shard are kept
+    in memory.
+    """
+    shard_files = [open(path, 'wb') for path in shard_paths]
+    buffers = [[] for _ in shard_paths]
+
+    try:
+        for transaction in read_transactions(input_path):
+            shard = shard_of(transaction.acc_id, len(shard_paths))
+            buffer = buffers[shard]
+            buffer.append(tuple(transaction))
+
+            if len(buffer) >= chunk_size:
+                marshal.dump(buffer, shard_files[shard])
+                buffer.clear()
+
+        for shard_file, buffer in zip(shard_files, buffers):
+            if buffer:
+                marshal.dump(buffer, shard_file)
+    finally:
+        for shard_file in shard_files:
+            shard_file.close()
+
+def _settle_shard(shard_path: str, results_path: str, accounts: dict[int, tuple[int, int]],
+                  chunk_size: int, open_accounts: bool, keep_statements: bool) -> tuple:
+    """
+    Worker of `settle_file_sharded`: applies one shard's operations to a
+    ledger holding only that shard's accounts.
+
+    Returns the report's counters and, for each account, its final balance,
+    number of withdrawals and the statement of the operations applied.
+    """
+    ledger = Ledger(keep_statements=keep_statements)
+    for acc_id, (balance, withdrawals) in accounts.items():
+        ledger.merge_account(acc_id, balance, withdrawals)
+
+    report = BatchReport()
+    transactions = (Transaction(*transaction) for transaction in _load_frames(shard_path))
+
+    def settled_chunks():
+        while True:
+            chunk = list(islice(transactions, chunk_size))
+            if not chunk:
+                return
+            yield settle_chunk(ledger, chunk, report, open_accounts)
+
+    _dump_frames(results_path, settled_chunks())
+
+    final_accounts = {acc_id: (ledger.balance(acc_id), ledger.withdrawals(acc_id),
+                               ledger.statement(acc_id))
+                      for acc_id in ledger}
+
+    return report.accepted, report.rejected, dict(report.rejections), final_accounts
+
+def settle_file_sharded(input_path: str, ledger: Ledger, workers: int,
+                        results_path: str | None = None, chunk_size: int = 10000,
+                        open_accounts: bool = False) -> BatchReport:
+    """
+    Same as `settle_file`, spreading the work over `workers` processes.
+
+    The operations are partitioned by account ID, so each worker owns a
+    shard of the accounts and applies its operations in input order. The
+    shards' balances, statements (and journal records, if the ledger has a
+    journal) are then merged into `ledger` in account ID order, and the
+    results file is merged back into input order, so the outcome doesn't
+    depend on which worker finishes first.
+
+    Params:
+    @input_path: the CSV or JSONL batch file
+    @ledger: the ledger holding the accounts
+    @workers: number of worker processes (and shards)
+    @results_path: optional CSV where each operation's result is written
+    @chunk_size: number of operations read and written at a time
+    @open_accounts: if `True`, unknown accounts are opened with a zero balance
+    """
+    if workers < 1:
+        raise ValueError('o número de processos deve ser maior que zero.')
+
+    report = BatchReport()
+    start = time.perf_counter()
+    keep_statements = ledger.keep_statements or ledger.journal is not None
+
+    with tempfile.TemporaryDirectory(prefix='settlement-') as shard_dir:
+        shard_paths = [os.path.join(shard_dir, f'shard-{shard}.bin')
+                       for shard in range(workers)]
+        shard_results = [os.path.join(shard_dir, f'results-{shard}.bin')
+                         for shard in range(workers)]
+        shard_accounts = [{} for _ in range(workers)]
+
+        for acc_id in ledger:
+            shard_accounts[shard_of(acc_id, workers)][acc_id] = (ledger.balance(acc_id),
+                                                                 ledger.withdrawals(acc_id))
+
+        _partition(input_path, shard_paths, chunk_size)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_settle_shard, shard_paths[shard], shard_results[shard],
+                                   shard_accounts[shard], chunk_size, open_accounts,
+                                   keep_statements)
+                       for shard in range(workers)]
+            shard_outcomes = [future.result() for future in futures]
+
+        for accepted, rejected, rejections, accounts in shard_outcomes:
+            report.accepted += accepted
+            report.rejected += rejected
+            report.rejections.update(rejections)
+
+            for acc_id in sorted(accounts):
+                balance, withdrawals, statement = accounts[acc_id]
+                ledger.merge_account(acc_id, balance, withdrawals, statement)
+
+        if results_path is not None:
+            with open(results_path, 'w', encoding='utf-8', newline='',
+                      buffering=1024 * 1024) as results_file:
+                writer = csv.writer(results_file)
+                writer.writerow(RESULT_COLUMNS)
+                merged = heapq.merge(*(_load_frames(path) for path in shard_results),
+                                     key=itemgetter(0))
+                while True:
+                    rows = list(islice(merged, chunk_size))
+                    if not rows:
+                        break
+                    writer.writerows(rows)
+
+    report.elapsed = time.perf_counter() - start
+
+    return report
+
+def main(argv: list[str] | None = None):
+    """
+    Runs the batch settlement from the command line, printing the report
+    """
+    parser = argparse.ArgumentParser(description='Liquidação em lote de depósitos e saques')
+    parser.add_argument('input', help='arquivo CSV ou JSONL com as operações')
+    parser.add_argument('--results', help='arquivo CSV onde os resultados são gravados')
+    parser.add_argument('--journal', help='journal usado para restaurar e gravar os saldos')
+    parser.add_argument('--open-accounts', action='store_true',
+                        help='abre automaticamente contas desconhecidas')
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='número de processos; as contas são divididas entre eles')
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    journal = Journal(args.journal, 'close') if args.journal else None
+
+    try:
+        with profile_session(args.profile, args.profile_top):
+            ledger = Ledger(journal, keep_statements=False)
+            if journal is not None:
+                ledger.load_journal(args.journal)
+
+            if args.workers > 1:
+                report = settle_file_sharded(args.input, ledger, args.workers, args.results,
+                                             args.chunk_size, args.open_accounts)
+            else:
+                report = settle_file(args.input, ledger, args.results, args.chunk_size,
+                                     args.open_accounts)
+    finally:
+        if journal is not None:
+            journal.close()
+
+    print(report.summary())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark of the checkpoints (`checkpoint` module): for growing numbers
+of users (each with one account), measures the snapshot size, the time
+to write it, the time to load it back and the time of a small
+incremental save.
+
+Usage:
+    python benchmarks/bench_checkpoint.py [largest_number_of_users]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import datetime
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from checkpoint import Checkpoint
+
+CITIES = [('Recife', 'PE'), ('São Paulo', 'SP'), ('Salvador', 'BA'), ('Manaus', 'AM')]
+
+def make_users(amount: int) -> list[dict]:
+    """Builds `amount` users shaped like the ones of `users.create_user`"""
+    first_day = datetime.date(1950, 1, 1).toordinal()
+    users = []
+
+    for number in range(amount):
+        city, state_uf = CITIES[number % len(CITIES)]
+        users.append({
+            'cpf': f'{number:011d}', 'name': f'Usuário {number}',
+            'birth_date': datetime.date.fromordinal(first_day + number % 20000),
+            'house_number': str(number % 1000), 'address': f'Rua {number % 500}',
+            'neighbourhood': 'Centro', 'city': city, 'state_uf': state_uf,
+            'full_address': f'Rua {number % 500} - {number % 1000} - Centro - {city}/{state_uf}'
+        })
+
+    return users
+
+def main(largest: int = 1_000_000):
+    """Runs the benchmark for 1k, 10k... up to `largest` users"""
+    amount = 1000
+
+    while amount <= largest:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'checkpoint.bin')
+
+            checkpoint = Checkpoint(path)
+            checkpoint.users.load(make_users(amount))
+            checkpoint.accounts.register_many(user['cpf'] for user in checkpoint.users)
+
+            start = time.perf_counter()
+            checkpoint.compact()
+            compact_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            loaded = Checkpoint.load(path)
+            load_elapsed = time.perf_counter() - start
+
+            for user in make_users(amount + 100)[amount:]:
+                loaded.users.append(user)
+            start = time.perf_counter()
+            loaded.save()
+            save_elapsed = time.perf_counter() - start
+
+            print(f'{amount:>9} users  {os.path.getsize(path) / 2**20:8.1f} MiB  '
+                  f'compact {compact_elapsed:7.3f} s  load {load_elapsed:7.3f} s  '
+                  f'save 100 changes {save_elapsed * 1000:7.2f} ms')
+
+        amount *= 10
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,77 @@
+"""
+Benchmark for the CPF validation paths: the scalar `verify_last_digits`
+and `main`, their fast counterparts and the batch `validate_many`.
+
+Usage:
+    python benchmarks/bench_cpf_validator.py [number_of_cpfs]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+import cpf_validator
+from cpf_validator import (main as verify_cpf, verify_last_digits, validate_many,
+                           multiply_from_arr, generate_verification_digit,
+                           verify_cpf_fast, verify_cpf_cached, verify_last_digits_fast)
+
+def generate_cpfs(amount: int, seed: int = 42) -> list[str]:
+    """
+    Generates `amount` formatted CPFs; roughly one in ten has a wrong
+    last digit, so both outcomes are measured.
+    """
+    rng = random.Random(seed)
+    cpfs = []
+
+    for _ in range(amount):
+        digits = [rng.randrange(10) for _ in range(9)]
+        digits.append(generate_verification_digit(multiply_from_arr(digits)))
+        digits.append(generate_verification_digit(multiply_from_arr(digits)))
+        if rng.random() < 0.1:
+            digits[10] = (digits[10] + 1) % 10
+        cpf = ''.join(map(str, digits))
+        cpfs.append(f'{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}')
+
+    return cpfs
+
+def measure(label: str, func, amount: int):
+    """Runs `func` once and prints the total and per-CPF cost"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:<40} {elapsed:8.3f} s  {elapsed / amount * 1e9:10.1f} ns/CPF')
+
+def main(amount: int = 1_000_000):
+    """Runs every CPF validation path over the same generated data"""
+    cpfs = generate_cpfs(amount)
+    digits_only = [cpf_validator.remove_punctuation_from_cpf(cpf) for cpf in cpfs]
+
+    print(f'{amount} CPFs, NumPy '
+          f'{"available" if cpf_validator.np is not None else "not installed"}')
+
+    measure('verify_last_digits (scalar, digits only)',
+            lambda: [verify_last_digits(cpf) for cpf in digits_only], amount)
+    measure('verify_last_digits_fast',
+            lambda: [verify_last_digits_fast(cpf) for cpf in digits_only], amount)
+    measure('main (scalar, formatted)', lambda: [verify_cpf(cpf) for cpf in cpfs], amount)
+    measure('verify_cpf_fast', lambda: [verify_cpf_fast(cpf) for cpf in cpfs], amount)
+    measure('verify_cpf_cached (cold)', lambda: [verify_cpf_cached(cpf) for cpf in cpfs], amount)
+    hot = cpfs[:cpf_validator.CPF_CACHE_SIZE] * (amount // cpf_validator.CPF_CACHE_SIZE + 1)
+    measure('verify_cpf_cached (hot set)',
+            lambda: [verify_cpf_cached(cpf) for cpf in hot[:amount]], amount)
+    measure('validate_many', lambda: validate_many(cpfs), amount)
+    measure('validate_many(with_reasons=True)',
+            lambda: validate_many(cpfs, with_reasons=True), amount)
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,68 @@
+"""
+Benchmark of the `Ledger` in a tight loop of deposits and withdrawals
+spread over many accounts, with and without in-memory statements and
+with the withdrawal limits engine (`limits`).
+
+Usage:
+    python benchmarks/bench_ledger.py [number_of_operations] [number_of_accounts]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from ledger import Ledger
+from limits import LimitsEngine, WithdrawalLimits
+
+def main(amount: int = 1_000_000, accounts: int = 10_000):
+    """Runs the same operations on differently configured ledgers"""
+    rng = random.Random(42)
+    operations = [(rng.randrange(1, accounts + 1),
+                   'deposit' if rng.random() < 0.7 else 'withdrawal',
+                   rng.randrange(100, 200000))
+                  for _ in range(amount)]
+
+    print(f'{amount} operations over {accounts} accounts')
+
+    configurations = [
+        ('keep_statements=False', lambda: Ledger(keep_statements=False)),
+        ('keep_statements=True', lambda: Ledger(keep_statements=True)),
+        ('limits (daily)', lambda: Ledger(keep_statements=False, limits=LimitsEngine())),
+        ('limits (7 day window)', lambda: Ledger(
+            keep_statements=False,
+            limits=LimitsEngine(WithdrawalLimits(window_days=7, max_per_window=10,
+                                                 max_amount_per_window=10_000_000)))),
+    ]
+
+    for label, make_ledger in configurations:
+        ledger = make_ledger()
+        for acc_id in range(1, accounts + 1):
+            ledger.open_account(acc_id)
+
+        start = time.perf_counter()
+        deposit, withdraw = ledger.deposit, ledger.withdraw
+        for acc_id, operation_type, value in operations:
+            if operation_type == 'deposit':
+                deposit(acc_id, value)
+            else:
+                try:
+                    withdraw(acc_id, value)
+                except ValueError:
+                    pass
+        elapsed = time.perf_counter() - start
+
+        print(f'{label:<22} {elapsed:7.3f} s  '
+              f'{amount / elapsed:12,.0f} ops/s')
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,60 @@
+"""
+Benchmark of the instrumentation (`metrics` module): the cost it adds to
+`cpf_validator.verify_cpf_fast` and `Ledger.deposit` when disabled (the
+function itself) and when enabled (timed, counted and bucketed on every
+call).
+
+Usage:
+    python benchmarks/bench_metrics.py [number_of_calls]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+import cpf_validator
+from ledger import Ledger
+from metrics import Metrics, instrument
+
+def timed(function, args: tuple, amount: int) -> float:
+    """Returns the seconds taken by `amount` calls of `function(*args)`"""
+    start = time.perf_counter()
+    for _ in range(amount):
+        function(*args)
+    return time.perf_counter() - start
+
+def main(amount: int = 200_000):
+    """Runs the benchmark with `amount` calls of each function"""
+    ledger = Ledger(keep_statements=False)
+    ledger.open_account(1)
+    deposit = getattr(Ledger.deposit, '__wrapped__', Ledger.deposit)
+    validate = getattr(cpf_validator.verify_cpf_fast, '__wrapped__',
+                       cpf_validator.verify_cpf_fast)
+
+    print(f'{amount} calls')
+
+    for label, function, args in (('verify_cpf_fast', validate, ('529.982.247-25',)),
+                                  ('Ledger.deposit', deposit, (ledger, 1, 100))):
+        metrics = Metrics()
+        disabled = timed(instrument(label, metrics=metrics, enabled=False)(function),
+                         args, amount)
+        enabled = timed(instrument(label, metrics=metrics, enabled=True)(function),
+                        args, amount)
+        histogram = metrics.latency(label)
+
+        print(f'{label:<20} disabled {disabled / amount * 1e9:8.0f} ns/call   '
+              f'enabled {enabled / amount * 1e9:8.0f} ns/call   '
+              f'overhead {(enabled - disabled) / amount * 1e9:6.0f} ns   '
+              f'p50 {histogram.percentile(50)} ns  p99 {histogram.percentile(99)} ns')
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,122 @@
+"""
+Benchmark of the money representations on a replay of deposits and
+withdrawals: `float` (as in `deposit_money`), `decimal.Decimal` and
+integer cents (as in `deposit_cents`).
+
+Each replay parses the amounts typed by the user and applies them to a
+single balance, reporting the elapsed time and the drift of the final
+balance against the exact result. The arithmetic is then timed alone,
+over amounts parsed beforehand.
+
+Usage:
+    python benchmarks/bench_money.py [number_of_operations]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from banking_methods import convert_str_to_float
+from money import parse_cents, format_cents
+
+def generate_operations(amount: int, seed: int = 42) -> list[tuple[bool, str]]:
+    """Generates (is_deposit, typed value) pairs, mixing comma and dot"""
+    rng = random.Random(seed)
+    operations = []
+
+    for _ in range(amount):
+        reais, cents = rng.randrange(0, 2000), rng.randrange(100)
+        separator = rng.choice(',.')
+        operations.append((rng.random() < 0.6, f'{reais}{separator}{cents:02d}'))
+
+    return operations
+
+def replay_float(operations) -> float:
+    """Replays the operations on a `float` balance"""
+    balance = 0.0
+    for is_deposit, typed in operations:
+        value = convert_str_to_float(typed)
+        if is_deposit:
+            balance += value
+        elif balance >= value:
+            balance -= value
+    return balance
+
+def replay_decimal(operations) -> Decimal:
+    """Replays the operations on a `Decimal` balance"""
+    balance = Decimal(0)
+    for is_deposit, typed in operations:
+        value = Decimal(typed.replace(',', '.'))
+        if is_deposit:
+            balance += value
+        elif balance >= value:
+            balance -= value
+    return balance
+
+def replay_cents(operations) -> int:
+    """Replays the operations on an `int` cents balance"""
+    balance = 0
+    for is_deposit, typed in operations:
+        value = parse_cents(typed)
+        if is_deposit:
+            balance += value
+        elif balance >= value:
+            balance -= value
+    return balance
+
+def apply(operations, balance):
+    """Applies already-parsed operations to a balance of any numeric type"""
+    for is_deposit, value in operations:
+        if is_deposit:
+            balance += value
+        elif balance >= value:
+            balance -= value
+    return balance
+
+def main(amount: int = 1_000_000):
+    """Runs the three replays over the same operations"""
+    operations = generate_operations(amount)
+    exact = None
+
+    print(f'{amount} operations')
+
+    for label, replay in [('Decimal', replay_decimal), ('int cents', replay_cents),
+                          ('float', replay_float)]:
+        start = time.perf_counter()
+        balance = replay(operations)
+        elapsed = time.perf_counter() - start
+
+        if exact is None:
+            exact = Decimal(balance)
+        if label == 'int cents':
+            balance = Decimal(format_cents(balance))
+
+        print(f'{label:<10} {elapsed:7.3f} s  {elapsed / amount * 1e9:8.1f} ns/op  '
+              f'drift: {Decimal(balance) - exact}')
+
+    print('\narithmetic only (amounts parsed beforehand)')
+
+    for label, parse, zero in [('Decimal', lambda v: Decimal(v.replace(',', '.')), Decimal(0)),
+                               ('int cents', parse_cents, 0),
+                               ('float', convert_str_to_float, 0.0)]:
+        parsed = [(is_deposit, parse(typed)) for is_deposit, typed in operations]
+
+        start = time.perf_counter()
+        apply(parsed, zero)
+        elapsed = time.perf_counter() - start
+
+        print(f'{label:<10} {elapsed:7.3f} s  {elapsed / amount * 1e9:8.1f} ns/op')
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,94 @@
+"""
+Benchmark of the streaming renderers (`renderers` module) against the
+old way of printing (formatting every row and joining them in a single
+string): total time, time to first byte and peak memory, exporting a
+generated statement to `/dev/null`.
+
+Usage:
+    python benchmarks/bench_renderers.py [number_of_rows] [text|csv|json]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from renderers import format_statement_entry, render_statement
+
+MEMORY_ROWS = 200_000 # rows of the (slower) peak memory runs
+
+class TimedOutput:
+    """Text stream discarding what is written, but noting when the first write happened"""
+
+    def __init__(self):
+        self.first_write = None
+        self._null = open(os.devnull, 'w', encoding='utf-8')
+
+    def write(self, text: str):
+        if self.first_write is None:
+            self.first_write = time.perf_counter()
+        return self._null.write(text)
+
+    def flush(self):
+        self._null.flush()
+
+    def close(self):
+        self._null.close()
+
+def statement(rows: int):
+    """Yields `rows` statement dicts"""
+    for number in range(rows):
+        yield {'operation_type': 'deposit' if number % 3 else 'withdrawal',
+               'value': 10.5, 'saldo_after_operation': number * 10.5}
+
+def joined(rows, out):
+    """The old `print_statement`: one string with every formatted row"""
+    formatted_statement = [
+        format_statement_entry(ext.get("operation_type", None), ext.get("value", 0),
+                               ext.get("saldo_after_operation", 0))
+        for ext in rows
+    ]
+    out.write('\n'.join(formatted_statement) + '\n')
+
+def streamed(rows, out, output_format: str = 'text'):
+    """The streaming renderer"""
+    render_statement(rows, out, output_format)
+
+def measure(label: str, function, rows: int, *args):
+    """Prints the total time, time to first byte and peak memory of `function`"""
+    out = TimedOutput()
+    start = time.perf_counter()
+    function(statement(rows), out, *args)
+    elapsed = time.perf_counter() - start
+    first_byte = out.first_write - start
+    out.close()
+
+    memory_rows = min(rows, MEMORY_ROWS)
+    out = TimedOutput()
+    tracemalloc.start()
+    function(statement(memory_rows), out, *args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    out.close()
+
+    print(f'{label:<16} {elapsed:8.3f} s  {rows / elapsed:12,.0f} rows/s  '
+          f'first byte {first_byte * 1000:9.3f} ms  '
+          f'peak ({memory_rows} rows) {peak / 2**20:8.2f} MiB')
+
+def main(rows: int = 1_000_000, output_format: str = 'text'):
+    """Runs the benchmark with `rows` statement operations"""
+    if output_format == 'text':
+        measure('join (old)', joined, rows)
+    measure(f'stream ({output_format})', streamed, rows, output_format)
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]), *sys.argv[2:3])
@@ -0,0 +1,130 @@
+"""
+Load generator for the JSON lines server (`server` module).
+
+Each connection keeps up to `pipeline` requests in flight (deposits and
+balance checks on its own account) and the latency of every request is
+measured from the moment it's written until its response is read. At
+the end, the requests per second and the p50/p99 latencies are printed.
+
+Without `--port`, a server is started in this process (on a free port);
+with it, an already running server is used.
+
+Usage:
+    python benchmarks/bench_server.py [--requests 100000] [--connections 8]
+                                      [--pipeline 32] [--host 127.0.0.1] [--port 8765]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from server import BankingService, start_server
+
+USER = {'op': 'register_user', 'cpf': '529.982.247-25', 'name': 'Carga',
+        'birth_date': '01-01-1990', 'address': 'Rua A', 'house_number': '1',
+        'neighbourhood': 'Centro', 'city': 'São Paulo', 'state_uf': 'SP'}
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Returns the given percentile of an already sorted list"""
+    position = round(percent / 100 * (len(sorted_values) - 1))
+    return sorted_values[position]
+
+async def call(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+               request: dict) -> dict:
+    """Sends a single request and waits for its response"""
+    writer.write(json.dumps(request).encode() + b'\n')
+    return json.loads(await reader.readline())
+
+async def run_connection(host: str, port: int, requests: int, pipeline: int,
+                         latencies: list[float]):
+    """
+    Opens an account and sends `requests` requests on one connection,
+    keeping at most `pipeline` of them unanswered.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    account = await call(reader, writer, {'op': 'register_account', 'cpf': USER['cpf']})
+    acc_id = account['result']['id']
+
+    deposit = (json.dumps({'op': 'deposit', 'acc_id': acc_id, 'value': '10,00'})
+               .encode() + b'\n')
+    balance = json.dumps({'op': 'balance', 'acc_id': acc_id}).encode() + b'\n'
+    in_flight = asyncio.Semaphore(pipeline)
+    sent_at = deque()
+
+    async def read_responses():
+        for _ in range(requests):
+            if not await reader.readline():
+                raise ConnectionError('o servidor encerrou a conexão.')
+            latencies.append(time.perf_counter() - sent_at.popleft())
+            in_flight.release()
+
+    receiver = asyncio.create_task(read_responses())
+
+    for number in range(requests):
+        await in_flight.acquire()
+        sent_at.append(time.perf_counter())
+        writer.write(balance if number % 4 == 3 else deposit)
+        await writer.drain()
+
+    await receiver
+    writer.close()
+    await writer.wait_closed()
+
+async def run(host: str, port: int | None, requests: int, connections: int, pipeline: int):
+    """Runs the load, starting a local server if no port is given"""
+    server = None
+
+    if port is None:
+        server = await start_server(BankingService(), host, 0)
+        port = server.sockets[0].getsockname()[1]
+
+    reader, writer = await asyncio.open_connection(host, port)
+    await call(reader, writer, USER)
+    writer.close()
+
+    latencies = []
+    per_connection = requests // connections
+    start = time.perf_counter()
+
+    await asyncio.gather(*(run_connection(host, port, per_connection, pipeline, latencies)
+                           for _ in range(connections)))
+
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    print(f'{len(latencies)} requests, {connections} connections, pipeline {pipeline}')
+    print(f'{len(latencies) / elapsed:12,.0f} req/s')
+    print(f'p50 {percentile(latencies, 50) * 1000:8.3f} ms')
+    print(f'p99 {percentile(latencies, 99) * 1000:8.3f} ms')
+
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+def main(argv: list[str] | None = None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--requests', type=int, default=100_000)
+    parser.add_argument('--connections', type=int, default=8)
+    parser.add_argument('--pipeline', type=int, default=32)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int)
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args.host, args.port, args.requests, args.connections, args.pipeline))
+
+if __name__ == '__main__':
+    main()
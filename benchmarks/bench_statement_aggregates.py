@@ -0,0 +1,112 @@
+"""
+Benchmark of the statement aggregates (`statement_aggregates` module):
+the cost of appending to an `AggregatedStatement` against a plain
+`CompactStatement`, and the time of "total deposited in a month" and
+"balance at a moment" queries against walking the statement.
+
+Usage:
+    python benchmarks/bench_statement_aggregates.py [number_of_operations]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from compact_statement import CompactStatement
+from statement_aggregates import AggregatedStatement
+
+QUERIES = 1000
+START = datetime.datetime(2020, 1, 1).timestamp()
+
+def operations(amount: int) -> list[tuple[str, int, int, float]]:
+    """Builds `amount` operations, one minute apart"""
+    rng = random.Random(42)
+    balance = 0
+    result = []
+
+    for number in range(amount):
+        value = rng.randrange(100, 100000)
+        if rng.random() < 0.4 and balance >= value:
+            balance -= value
+            result.append(('withdrawal', value, balance, START + number * 60))
+        else:
+            balance += value
+            result.append(('deposit', value, balance, START + number * 60))
+
+    return result
+
+def walk_total(ops, since: float, until: float) -> int:
+    """Total deposited in [since, until), walking every operation"""
+    return sum(value for operation_type, value, _, timestamp in ops
+               if operation_type == 'deposit' and since <= timestamp < until)
+
+def walk_balance(ops, moment: float) -> int:
+    """Balance at a moment, walking the operations up to it"""
+    balance = 0
+    for _, _, balance_after, timestamp in ops:
+        if timestamp > moment:
+            break
+        balance = balance_after
+    return balance
+
+def main(amount: int = 1_000_000):
+    """Runs the benchmark with `amount` operations"""
+    ops = operations(amount)
+    print(f'{amount} operations')
+
+    for label, statement in (('CompactStatement', CompactStatement()),
+                             ('AggregatedStatement', AggregatedStatement())):
+        append = statement.append_cents
+        start = time.perf_counter()
+        if isinstance(statement, AggregatedStatement):
+            for operation_type, value, balance, timestamp in ops:
+                append(operation_type, value, balance, timestamp)
+        else:
+            for operation_type, value, balance, _ in ops:
+                append(operation_type, value, balance)
+        elapsed = time.perf_counter() - start
+        print(f'append {label:<20} {elapsed:8.3f} s  {amount / elapsed:12,.0f} ops/s')
+
+    end = START + amount * 60
+    rng = random.Random(7)
+    months = [rng.uniform(START, end) for _ in range(QUERIES)]
+
+    walked = 10
+    start = time.perf_counter()
+    expected = [walk_total(ops, since, since + 30 * 86400) for since in months[:walked]]
+    walk_elapsed = (time.perf_counter() - start) / walked
+
+    start = time.perf_counter()
+    totals = [statement.total_between('deposit', since, since + 30 * 86400)
+              for since in months]
+    view_elapsed = (time.perf_counter() - start) / QUERIES
+    assert totals[:walked] == expected
+
+    print(f'month total    walk {walk_elapsed * 1000:10.3f} ms   '
+          f'aggregates {view_elapsed * 1e6:10.3f} us')
+
+    start = time.perf_counter()
+    expected = [walk_balance(ops, moment) for moment in months[:walked]]
+    walk_elapsed = (time.perf_counter() - start) / walked
+
+    start = time.perf_counter()
+    balances = [statement.balance_at(moment) for moment in months]
+    view_elapsed = (time.perf_counter() - start) / QUERIES
+    assert balances[:walked] == expected
+
+    print(f'balance at     walk {walk_elapsed * 1000:10.3f} ms   '
+          f'aggregates {view_elapsed * 1e6:10.3f} us')
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
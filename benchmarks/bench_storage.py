@@ -0,0 +1,70 @@
+"""
+Benchmark of the storage engines: the in-memory ones (`UserStore`,
+`AccountRegistry`, `CompactStatement`) against the SQLite ones
+(`sqlite_storage`), measuring a bulk user insert, CPF lookups, account
+registration and statement appends.
+
+Usage:
+    python benchmarks/bench_storage.py [number_of_users]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from account_registry import AccountRegistry
+from bench_checkpoint import make_users
+from compact_statement import CompactStatement
+from sqlite_storage import (ConnectionPool, SQLiteUserStore, SQLiteAccountRegistry,
+                            SQLiteStatement)
+from user_store import UserStore
+
+LOOKUPS = 10_000
+STATEMENT_OPERATIONS = 10_000
+
+def timed(label: str, amount: int, function):
+    """Runs `function` once and prints its time and rate"""
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f'  {label:<28} {elapsed:8.3f} s  {amount / elapsed:12,.0f} ops/s')
+
+def run(name: str, users, accounts, statement, amount: int):
+    """Measures one storage engine"""
+    records = make_users(amount)
+    cpfs = [user['cpf'] for user in records]
+    lookups = random.Random(42).choices(cpfs, k=LOOKUPS)
+    owners = cpfs[:LOOKUPS]
+
+    print(name)
+    timed(f'bulk insert of {amount} users', amount, lambda: users.extend(records))
+    timed(f'{LOOKUPS} CPF lookups', LOOKUPS, lambda: [users.get(cpf) for cpf in lookups])
+    timed(f'{LOOKUPS} accounts, one by one', LOOKUPS,
+          lambda: [accounts.register(cpf) for cpf in owners])
+    timed(f'{LOOKUPS} accounts, bulk', LOOKUPS, lambda: accounts.register_many(owners))
+    timed(f'{STATEMENT_OPERATIONS} statement appends', STATEMENT_OPERATIONS,
+          lambda: [statement.append_cents('deposit', 100, 100 * (number + 1))
+                   for number in range(STATEMENT_OPERATIONS)])
+
+def main(amount: int = 100_000):
+    """Runs the benchmark with `amount` users"""
+    run('in memory', UserStore(), AccountRegistry(), CompactStatement(), amount)
+
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            ConnectionPool(os.path.join(tmp_dir, 'bank.db')) as pool:
+        run('sqlite', SQLiteUserStore(pool), SQLiteAccountRegistry(pool),
+            SQLiteStatement(pool, 1), amount)
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
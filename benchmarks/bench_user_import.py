@@ -0,0 +1,68 @@
+"""
+Throughput benchmark of the bulk user importer (`user_import` module):
+writes a CSV file of random users, about 1% of them invalid or
+repeated, and imports it with one and with many workers.
+
+Usage:
+    python benchmarks/bench_user_import.py [number_of_rows] [workers]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from bench_users import FIELDS, random_cpf
+from user_import import import_users
+
+def write_rows(path: str, amount: int):
+    """Writes `amount` user rows, with some bad CPFs, dates and UFs"""
+    rng = random.Random(42)
+
+    with open(path, 'w', encoding='utf-8', newline='') as users_file:
+        writer = csv.writer(users_file)
+        writer.writerow(FIELDS)
+
+        for number in range(amount):
+            cpf = random_cpf(rng)
+            birth_date = (f'{rng.randrange(1, 29):02d}-{rng.randrange(1, 13):02d}-'
+                          f'{rng.randrange(1940, 2008)}')
+            state_uf = 'PE'
+
+            match rng.randrange(400):
+                case 0:
+                    cpf = cpf[:-1] + str((int(cpf[-1]) + 1) % 10)
+                case 1:
+                    birth_date = '31-02-1990'
+                case 2:
+                    state_uf = 'XX'
+                case 3:
+                    cpf = '529.982.247-25'
+
+            writer.writerow([cpf, f'Usuário {number}', birth_date, 'Rua A', str(number),
+                             'Centro', 'Recife', state_uf])
+
+def main(amount: int = 1_000_000, workers: int = os.cpu_count() or 1):
+    """Imports `amount` rows sequentially and with `workers` processes"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'users.csv')
+        write_rows(path, amount)
+
+        for pool_size in sorted({1, workers}):
+            _, report = import_users(path, rejects_path=os.path.join(tmp_dir, 'rejects.csv'),
+                                     workers=pool_size)
+            print(f'workers={pool_size}')
+            print(report.summary())
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
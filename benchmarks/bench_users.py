@@ -0,0 +1,90 @@
+"""
+Benchmark of the non-interactive user registration: writes a CSV file
+of random valid users, then registers them all with `users.create_user`
+and opens one account each with `account.open_account`.
+
+Usage:
+    python benchmarks/bench_users.py [number_of_users]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from account import open_account
+from account_registry import AccountRegistry
+from user_store import UserStore
+from users import create_user
+
+FIELDS = ['cpf', 'name', 'birth_date', 'address', 'house_number',
+          'neighbourhood', 'city', 'state_uf']
+
+def random_cpf(rng: random.Random) -> str:
+    """Returns a random CPF with valid check digits, in the XXX.XXX.XXX-XX format"""
+    digits = [rng.randrange(10) for _ in range(9)]
+
+    for length in (9, 10):
+        remainder = sum(digit * weight for digit, weight
+                        in zip(digits, range(length + 1, 1, -1))) % 11
+        digits.append(0 if remainder < 2 else 11 - remainder)
+
+    cpf = ''.join(map(str, digits))
+    return f'{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}'
+
+def write_users(path: str, amount: int):
+    """Writes `amount` users with distinct CPFs to a CSV file"""
+    rng = random.Random(42)
+    cpfs = set()
+
+    while len(cpfs) < amount:
+        cpfs.add(random_cpf(rng))
+
+    with open(path, 'w', encoding='utf-8', newline='') as users_file:
+        writer = csv.writer(users_file)
+        writer.writerow(FIELDS)
+        for number, cpf in enumerate(sorted(cpfs)):
+            writer.writerow([cpf, f'Usuário {number}',
+                             f'{rng.randrange(1, 29):02d}-{rng.randrange(1, 13):02d}-'
+                             f'{rng.randrange(1940, 2008)}',
+                             'Rua A', str(number), 'Centro', 'Recife', 'PE'])
+
+def main(amount: int = 100_000):
+    """Registers `amount` users read from a CSV file, and one account for each"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'users.csv')
+        write_users(path, amount)
+
+        users = UserStore()
+        accounts = AccountRegistry()
+
+        with open(path, encoding='utf-8', newline='') as users_file:
+            records = list(csv.DictReader(users_file))
+
+        start = time.perf_counter()
+        for record in records:
+            create_user(users, record)
+        users_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for record in records:
+            open_account(users, accounts, record['cpf'])
+        accounts_elapsed = time.perf_counter() - start
+
+    print(f'{amount} users')
+    print(f'create_user  {users_elapsed:7.3f} s  {amount / users_elapsed:12,.0f} users/s')
+    print(f'open_account {accounts_elapsed:7.3f} s  {amount / accounts_elapsed:12,.0f} accounts/s')
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,286 @@
+"""
+Benchmark suite covering the hot paths of the project, each at several
+data sizes (except the statement appends, whose cost doesn't depend on
+the data), with a regression check against a stored baseline.
+
+Every case is timed with `timeit` (the number of calls is picked by
+`Timer.autorange`, and the best of `--repeat` rounds is kept) and the
+result is the time per operation. The results are printed, optionally
+written as JSON (`--output`), and compared with the baseline
+(`benchmarks/baseline.json` by default): a case more than `--tolerance`
+slower than its baseline is a regression, and the runner exits with
+status 1.
+
+The baseline depends on the machine: after changing machines (or after
+an intended slowdown), record a new one with `--save-baseline`.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--sizes 100 1000 10000] [--repeat 5]
+                                        [-k filter] [--output results.json]
+                                        [--baseline benchmarks/baseline.json]
+                                        [--tolerance 0.5] [--save-baseline]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import argparse
+import builtins
+import contextlib
+import datetime
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+from typing import Any, Callable
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from account import register_account, print_account_list
+from account_registry import AccountRegistry
+from banking_methods import (convert_str_to_float, deposit_money, withdraw_money,
+                             add_to_statement)
+from bench_checkpoint import make_users
+from bench_users import random_cpf
+from cpf_validator import main as validate_cpf, verify_last_digits, remove_punctuation_from_cpf
+from user_store import UserStore
+from users import find_user_in_database
+
+DEFAULT_SIZES = (100, 1_000, 10_000)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# a case builds, for a data size, the function to be timed, the number
+# of operations each call of it makes and, optionally, a function run
+# before each round, outside the timed region, to undo what the calls
+# changed; contexts it needs (patched `input`...) are entered in the
+# given stack
+Case = Callable[[int, contextlib.ExitStack],
+                tuple[Callable[[], Any], int] | tuple[Callable[[], Any], int, Callable[[], Any]]]
+
+def _cpfs(size: int) -> list[str]:
+    """Returns `size` valid CPFs, in the XXX.XXX.XXX-XX format"""
+    rng = random.Random(size)
+    return [random_cpf(rng) for _ in range(size)]
+
+def _users(size: int) -> list[dict[str, Any]]:
+    """Returns `size` users with valid CPFs"""
+    users = make_users(size)
+    for user, cpf in zip(users, _cpfs(size)):
+        user['cpf'] = remove_punctuation_from_cpf(cpf)
+    return users
+
+def case_cpf_validator_main(size, _stack):
+    cpfs = _cpfs(size)
+    return lambda: [validate_cpf(cpf) for cpf in cpfs], size
+
+def case_verify_last_digits(size, _stack):
+    cpfs = [remove_punctuation_from_cpf(cpf) for cpf in _cpfs(size)]
+    return lambda: [verify_last_digits(cpf) for cpf in cpfs], size
+
+def case_convert_str_to_float(size, _stack):
+    rng = random.Random(size)
+    values = [f'{rng.randrange(100000)},{rng.randrange(100):02d}' if number % 2
+              else f'{rng.randrange(100000)}.{rng.randrange(100):02d}'
+              for number in range(size)]
+    return lambda: [convert_str_to_float(value) for value in values], size
+
+# the statement cases append to a list, whatever its size, so they run
+# once (see `UNSIZED_CASES`), emptying the statement between rounds
+
+def case_deposit_money(_size, _stack):
+    statement = []
+    return lambda: deposit_money(1000.0, 10.0, statement), 1, statement.clear
+
+def case_withdraw_money(_size, _stack):
+    statement = []
+    return lambda: withdraw_money(1000.0, 0, 500.0, statement), 1, statement.clear
+
+def case_add_to_statement(_size, _stack):
+    statement = []
+    return lambda: add_to_statement('deposit', 10.0, 1000.0, statement), 1, statement.clear
+
+def _lookups(cpfs: list[str]):
+    """Cycles through the given CPFs in a random order"""
+    cpfs = list(cpfs)
+    random.Random(len(cpfs)).shuffle(cpfs)
+    return itertools.cycle(cpfs)
+
+def case_find_user_in_database_list(size, _stack):
+    users = _users(size)
+    lookups = _lookups(user['cpf'] for user in users)
+    return lambda: find_user_in_database(users, next(lookups)), 1
+
+def case_find_user_in_database_store(size, _stack):
+    users = _users(size)
+    lookups = _lookups(user['cpf'] for user in users)
+    store = UserStore(users)
+    return lambda: find_user_in_database(store, next(lookups)), 1
+
+def _register_account_case(size, stack, users, accounts):
+    """Runs `register_account` with `input` answering the users' CPFs"""
+    lookups = _lookups(_cpfs(size))
+    stack.enter_context(_patched_input(lambda _prompt='': next(lookups)))
+    return lambda: register_account(users, accounts), 1
+
+def case_register_account_list(size, stack):
+    return _register_account_case(size, stack, _users(size), [])
+
+def case_register_account_store(size, stack):
+    users = _users(size)
+    return _register_account_case(size, stack, UserStore(users), AccountRegistry())
+
+def case_print_account_list(size, _stack):
+    users = _users(size)
+    accounts = [{'id': number, 'agency': '0001', 'user': user['cpf']}
+                for number, user in enumerate(users, start=1)]
+    return lambda: print_account_list(accounts, users), size
+
+CASES: dict[str, Case] = {
+    'cpf_validator.main': case_cpf_validator_main,
+    'verify_last_digits': case_verify_last_digits,
+    'convert_str_to_float': case_convert_str_to_float,
+    'deposit_money': case_deposit_money,
+    'withdraw_money': case_withdraw_money,
+    'add_to_statement': case_add_to_statement,
+    'find_user_in_database[list]': case_find_user_in_database_list,
+    'find_user_in_database[UserStore]': case_find_user_in_database_store,
+    'register_account[list]': case_register_account_list,
+    'register_account[UserStore]': case_register_account_store,
+    'print_account_list': case_print_account_list,
+}
+UNSIZED_CASES = {'deposit_money', 'withdraw_money', 'add_to_statement'}
+
+@contextlib.contextmanager
+def _patched_input(function):
+    """Replaces the builtin `input` while the case runs"""
+    original = builtins.input
+    builtins.input = function
+    try:
+        yield
+    finally:
+        builtins.input = original
+
+def measure(case: Case, size: int | None, repeat: int) -> float:
+    """Returns the best time per operation, in seconds, of a case"""
+    with contextlib.ExitStack() as stack:
+        function, operations, *reset = case(size, stack)
+        timer = timeit.Timer(function, *reset)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number))
+
+    return best / number / operations
+
+def run(sizes: list[int], repeat: int, pattern: str | None = None) -> dict[str, Any]:
+    """Runs the cases (those whose name contains `pattern`) at every size"""
+    results = {}
+
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        for name, case in CASES.items():
+            if pattern is not None and pattern not in name:
+                continue
+
+            for size in [None] if name in UNSIZED_CASES else sizes:
+                with contextlib.redirect_stdout(devnull):
+                    seconds = measure(case, size, repeat)
+
+                key = name if size is None else f'{name}@{size}'
+                results[key] = {'case': name, 'size': size, 'seconds_per_op': seconds}
+                print(f'{name:<34} {"-" if size is None else size:>8}  '
+                      f'{seconds * 1e6:12.3f} us/op  '
+                      f'{1 / seconds:14,.0f} ops/s', flush=True)
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        },
+        'results': results,
+    }
+
+def compare(current: dict[str, Any], baseline: dict[str, Any],
+            tolerance: float) -> list[str]:
+    """
+    Prints how each result compares with the baseline and returns the
+    keys of the regressions (more than `tolerance` slower).
+    """
+    regressions = []
+
+    if baseline['meta'].get('python') != current['meta']['python']:
+        print(f"warning: baseline recorded with Python {baseline['meta'].get('python')}, "
+              f"running {current['meta']['python']}")
+
+    print(f'\n{"case":<43} {"baseline":>12} {"current":>12} {"ratio":>7}')
+
+    for key, result in current['results'].items():
+        reference = baseline['results'].get(key)
+
+        if reference is None:
+            print(f'{key:<43} {"-":>12} {result["seconds_per_op"] * 1e6:10.3f}us    new')
+            continue
+
+        ratio = result['seconds_per_op'] / reference['seconds_per_op']
+        regressed = ratio > 1 + tolerance
+        if regressed:
+            regressions.append(key)
+
+        print(f'{key:<43} {reference["seconds_per_op"] * 1e6:10.3f}us '
+              f'{result["seconds_per_op"] * 1e6:10.3f}us {ratio:7.2f}'
+              f'{"  REGRESSION" if regressed else ""}')
+
+    return regressions
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point; returns the exit status"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('-k', dest='pattern', help='only run the cases containing this text')
+    parser.add_argument('--output', help='JSON file where the results are written')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='allowed slowdown before failing (0.5 = 50%% slower)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='record the results as the new baseline')
+    args = parser.parse_args(argv)
+
+    current = run(args.sizes, args.repeat, args.pattern)
+
+    if args.output is not None:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(current, output_file, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as baseline_file:
+            json.dump(current, baseline_file, indent=2)
+            baseline_file.write('\n')
+        print(f'\nbaseline written to {args.baseline}')
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f'\nno baseline at {args.baseline}; record one with --save-baseline')
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)
+
+    regressions = compare(current, baseline, args.tolerance)
+
+    if regressions:
+        print(f'\n{len(regressions)} regression(s) over {args.tolerance:.0%}: '
+              + ', '.join(regressions))
+        return 1
+
+    print(f'\nno regressions over {args.tolerance:.0%}')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,350 @@
+"""
+This module contains the checkpoints of the user and account databases,
+so they survive restarts.
+
+A checkpoint is made of two files:
+- the snapshot (`path`), with every user and account;
+- the delta log (`path + '.delta'`), with the changes made since the
+  snapshot, one frame per `Checkpoint.save`.
+
+Saving only appends the users and accounts changed since the last save
+(the stores track them, see `UserStore.take_changes`), and `compact`
+rewrites the snapshot and empties the delta log.
+
+Both files hold `marshal` frames, protected by a CRC32. Users are stored
+column by column, with the birth dates as ordinals and the repeated
+values (cities, UFs...) shared, which keeps the files small and lets a
+snapshot be read back without parsing each user.
+
+Both files carry a generation number: the delta log only applies to the
+snapshot of the same generation, so a crash in the middle of `compact`
+never replays old changes over a newer snapshot.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import datetime
+import gc
+import marshal
+import os
+import struct
+import zlib
+from contextlib import contextmanager
+from operator import itemgetter
+from typing import Any, Iterable
+
+from account_registry import AccountRegistry
+from storage import USER_COLUMNS, ACCOUNT_COLUMNS
+from user_store import UserStore
+
+CHECKPOINT_MAGIC = b'BKCKPT01'
+HEADER = struct.Struct('<Q') # generation
+FRAME_HEADER = struct.Struct('<II') # payload size, crc32
+MARSHAL_VERSION = 4
+MIN_COMPACT_SIZE = 1024 * 1024 # delta log size (bytes) before `save` compacts
+
+SHARED_USER_COLUMNS = ('address', 'neighbourhood', 'city', 'state_uf')
+
+_USER_KEYS = frozenset(USER_COLUMNS)
+_ACCOUNT_KEYS = frozenset(ACCOUNT_COLUMNS)
+
+@contextmanager
+def _gc_paused():
+    """
+    Pauses the cyclic garbage collector while millions of user dicts are
+    built or encoded: they hold no reference cycles, so the collections
+    it would trigger on the way are pure overhead.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+def _shared(column: list) -> list:
+    """Makes equal values of a column the same object, so they're stored once"""
+    seen = {}
+    return [seen.setdefault(value, value) for value in column]
+
+def _encode_users(users: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Splits the users in columns (`USER_COLUMNS`); users with other keys,
+    or whose birth date isn't a `datetime.date`, are kept as dicts.
+    """
+    regular = []
+    other = []
+
+    for user in users:
+        if user.keys() == _USER_KEYS and user['birth_date'].__class__ is datetime.date:
+            regular.append(user)
+        else:
+            other.append(user)
+
+    columns = dict(zip(USER_COLUMNS,
+                       map(list, zip(*map(itemgetter(*USER_COLUMNS), regular)))))
+
+    if columns:
+        columns['birth_date'] = [birth_date.toordinal() for birth_date in columns['birth_date']]
+        for key in SHARED_USER_COLUMNS:
+            columns[key] = _shared(columns[key])
+
+    return {'columns': columns, 'other': other}
+
+def _decode_users(encoded: dict[str, Any]) -> list[dict[str, Any]]:
+    """Rebuilds the user dicts of `_encode_users`, in the same order"""
+    columns = encoded['columns']
+    users = []
+
+    if columns:
+        from_ordinal = datetime.date.fromordinal
+        dates = {ordinal: from_ordinal(ordinal) for ordinal in set(columns['birth_date'])}
+
+        users = [
+            {'cpf': cpf, 'name': name, 'birth_date': birth_date,
+             'house_number': house_number, 'address': address,
+             'neighbourhood': neighbourhood, 'city': city, 'state_uf': state_uf,
+             'full_address': full_address}
+            for cpf, name, birth_date, house_number, address, neighbourhood, city,
+                state_uf, full_address
+            in zip(columns['cpf'], columns['name'],
+                   map(dates.__getitem__, columns['birth_date']),
+                   columns['house_number'], columns['address'], columns['neighbourhood'],
+                   columns['city'], columns['state_uf'], columns['full_address'])
+        ]
+
+    return users + encoded['other']
+
+def _encode_accounts(accounts: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Same as `_encode_users`, for the accounts (`ACCOUNT_COLUMNS`)"""
+    regular = []
+    other = []
+
+    for account in accounts:
+        (regular if account.keys() == _ACCOUNT_KEYS else other).append(account)
+
+    columns = dict(zip(ACCOUNT_COLUMNS,
+                       map(list, zip(*map(itemgetter(*ACCOUNT_COLUMNS), regular)))))
+
+    if columns:
+        columns['agency'] = _shared(columns['agency'])
+
+    return {'columns': columns, 'other': other}
+
+def _decode_accounts(encoded: dict[str, Any]) -> list[dict[str, Any]]:
+    """Rebuilds the account dicts of `_encode_accounts`, in the same order"""
+    columns = encoded['columns']
+    accounts = []
+
+    if columns:
+        accounts = [{'id': acc_id, 'agency': agency, 'user': user}
+                    for acc_id, agency, user
+                    in zip(columns['id'], columns['agency'], columns['user'])]
+
+    return accounts + encoded['other']
+
+def _encode_frame(users: Iterable[dict[str, Any]], deleted_users: list[str],
+                  accounts: Iterable[dict[str, Any]], deleted_accounts: list[int],
+                  next_id: int) -> bytes:
+    """Builds a frame (size, CRC32 and payload) with the given changes"""
+    payload = marshal.dumps({
+        'users': _encode_users(users),
+        'deleted_users': deleted_users,
+        'accounts': _encode_accounts(accounts),
+        'deleted_accounts': deleted_accounts,
+        'next_id': next_id
+    }, MARSHAL_VERSION)
+
+    return FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+def _read_frames(path: str) -> tuple[int, list[dict[str, Any]], int]:
+    """
+    Reads a checkpoint file, returning its generation, its frames and the
+    size of its valid part; reading stops at the first torn or corrupted
+    frame.
+    """
+    with open(path, 'rb') as checkpoint_file:
+        data = checkpoint_file.read()
+
+    if (data[:len(CHECKPOINT_MAGIC)] != CHECKPOINT_MAGIC
+            or len(data) < len(CHECKPOINT_MAGIC) + HEADER.size):
+        raise ValueError(f'o arquivo {path} não é um checkpoint válido.')
+
+    generation, = HEADER.unpack_from(data, len(CHECKPOINT_MAGIC))
+    position = len(CHECKPOINT_MAGIC) + HEADER.size
+    frames = []
+
+    while position + FRAME_HEADER.size <= len(data):
+        size, crc = FRAME_HEADER.unpack_from(data, position)
+        start = position + FRAME_HEADER.size
+        payload = data[start:start + size]
+
+        if len(payload) != size or zlib.crc32(payload) != crc:
+            break
+
+        frames.append(marshal.loads(payload))
+        position = start + size
+
+    return generation, frames, position
+
+def _write_file(path: str, generation: int, frames: Iterable[bytes] = ()):
+    """Atomically replaces `path` with a checkpoint file holding `frames`"""
+    tmp_path = path + '.tmp'
+
+    with open(tmp_path, 'wb') as checkpoint_file:
+        checkpoint_file.write(CHECKPOINT_MAGIC + HEADER.pack(generation))
+        for frame in frames:
+            checkpoint_file.write(frame)
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+
+    os.replace(tmp_path, path)
+
+class Checkpoint:
+    """
+    Snapshot and delta log of a user and an account database, both with
+    change tracking on.
+
+    Params:
+    @path: the snapshot file (the delta log is `path + '.delta'`)
+    @users: the user database (a new one if not given)
+    @accounts: the account database (a new one if not given)
+    """
+
+    def __init__(self, path: str, users: UserStore | None = None,
+                 accounts: AccountRegistry | None = None):
+        self.path = path
+        self.delta_path = path + '.delta'
+        self.users = users if users is not None else UserStore(track_changes=True)
+        self.accounts = (accounts if accounts is not None
+                         else AccountRegistry(track_changes=True))
+        self._generation = 0
+        self._saved_next_id = None
+
+    @classmethod
+    def load(cls, path: str, start_id: int = 1) -> 'Checkpoint':
+        """
+        Loads the databases saved at `path` (empty ones if there is no
+        checkpoint yet). A torn tail of the delta log is truncated.
+
+        Params:
+        @path: the snapshot file
+        @start_id: lowest ID the account sequence may continue from
+        """
+        with _gc_paused():
+            users: list[dict[str, Any]] = []
+            accounts: list[dict[str, Any]] = []
+            next_id = start_id
+            generation = 0
+            deltas = []
+
+            if os.path.exists(path):
+                generation, frames, _ = _read_frames(path)
+                if not frames:
+                    raise ValueError(f'o checkpoint {path} está corrompido.')
+                users = _decode_users(frames[0]['users'])
+                accounts = _decode_accounts(frames[0]['accounts'])
+                next_id = max(next_id, frames[0]['next_id'])
+
+            if os.path.exists(path + '.delta'):
+                delta_generation, deltas, valid_size = _read_frames(path + '.delta')
+
+                if delta_generation != generation:
+                    deltas = []
+                elif valid_size != os.path.getsize(path + '.delta'):
+                    with open(path + '.delta', 'r+b') as delta_file:
+                        delta_file.truncate(valid_size)
+
+            if deltas:
+                users_by_cpf = {user.get('cpf', None): user for user in users}
+                accounts_by_id = {account['id']: account for account in accounts}
+
+                for delta in deltas:
+                    for user_cpf in delta['deleted_users']:
+                        users_by_cpf.pop(user_cpf, None)
+                    for user in _decode_users(delta['users']):
+                        users_by_cpf[user.get('cpf', None)] = user
+                    for acc_id in delta['deleted_accounts']:
+                        accounts_by_id.pop(acc_id, None)
+                    for account in _decode_accounts(delta['accounts']):
+                        accounts_by_id[account['id']] = account
+                    next_id = max(next_id, delta['next_id'])
+
+                users = list(users_by_cpf.values())
+                accounts = list(accounts_by_id.values())
+
+            checkpoint = cls(path, UserStore(track_changes=True),
+                             AccountRegistry(start_id=next_id, track_changes=True))
+            checkpoint.users.load(users)
+            checkpoint.accounts.load(accounts)
+            checkpoint.users.take_changes()
+            checkpoint.accounts.take_changes()
+            checkpoint._generation = generation
+            checkpoint._saved_next_id = checkpoint.accounts.next_id
+
+        return checkpoint
+
+    def save(self) -> int:
+        """
+        Appends the changes made since the last save to the delta log and
+        returns how many users and accounts were written. When the delta
+        log grows larger than the snapshot, the checkpoint is compacted.
+        """
+        user_changes = self.users.take_changes()
+        account_changes = self.accounts.take_changes()
+        next_id = self.accounts.next_id
+
+        if not user_changes and not account_changes and next_id == self._saved_next_id:
+            return 0
+
+        frame = _encode_frame(
+            [user for user in user_changes.values() if user is not None],
+            [cpf for cpf, user in user_changes.items() if user is None],
+            [account for account in account_changes.values() if account is not None],
+            [acc_id for acc_id, account in account_changes.items() if account is None],
+            next_id)
+
+        if not self._delta_matches():
+            _write_file(self.delta_path, self._generation)
+
+        with open(self.delta_path, 'ab') as delta_file:
+            delta_file.write(frame)
+            delta_file.flush()
+            os.fsync(delta_file.fileno())
+
+        self._saved_next_id = next_id
+
+        snapshot_size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if os.path.getsize(self.delta_path) > max(snapshot_size, MIN_COMPACT_SIZE):
+            self.compact()
+
+        return len(user_changes) + len(account_changes)
+
+    def compact(self):
+        """
+        Writes every user and account to a new snapshot and empties the
+        delta log.
+        """
+        self.users.take_changes()
+        self.accounts.take_changes()
+
+        generation = self._generation + 1
+        with _gc_paused():
+            frame = _encode_frame(self.users, [], self.accounts, [], self.accounts.next_id)
+        _write_file(self.path, generation, [frame])
+        self._generation = generation
+        self._saved_next_id = self.accounts.next_id
+
+        _write_file(self.delta_path, generation)
+
+    def _delta_matches(self) -> bool:
+        """Checks if the delta log exists and belongs to the current snapshot"""
+        try:
+            with open(self.delta_path, 'rb') as delta_file:
+                header = delta_file.read(len(CHECKPOINT_MAGIC) + HEADER.size)
+        except FileNotFoundError:
+            return False
+
+        return header == CHECKPOINT_MAGIC + HEADER.pack(self._generation)
@@ -0,0 +1,152 @@
+"""
+This module contains the `CompactStatement`, a columnar account statement.
+
+Instead of one dict per operation, the statement keeps three typed
+arrays: the operation code (`uint8`), the value and the balance after
+the operation (both `int64`, in cents). That is 17 bytes per operation,
+against 200+ bytes for a dict holding two floats.
+
+Reading it still looks like the old list of dicts, so `print_statement`
+and any code iterating the statement keeps working.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+from array import array
+from typing import Any, Iterable
+
+from journal import OPERATION_CODES, OPERATION_TYPES
+from storage import StatementStorage
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional, the aggregates fall back to builtins
+    np = None
+
+class CompactStatement(StatementStorage):
+    """
+    Array-backed account statement with a list-like read interface.
+
+    Params:
+    @operations: optional iterable of statement dicts to load
+    """
+
+    def __init__(self, operations: Iterable[dict[str, Any]] = ()):
+        self.op_codes = array('B')
+        self.values = array('q')
+        self.balances = array('q')
+
+        for operation in operations:
+            self.append(operation)
+
+    def append(self, operation: dict[str, Any]):
+        """
+        Appends an operation given as a statement dict (values in reais),
+        as done by `add_to_statement`.
+        """
+        self.append_cents(operation['operation_type'],
+                          round(operation['value'] * 100),
+                          round(operation['saldo_after_operation'] * 100))
+
+    def append_cents(self, operation_type: str, value_cents: int, balance_cents: int,
+                     timestamp: float | None = None):
+        """
+        Appends an operation with its amounts already in cents.
+
+        Params:
+        @operation_type: must be either 'withdrawal' or 'deposit'
+        @value_cents: the amount of money used in the operation, in cents
+        @balance_cents: the account's balance after the operation, in cents
+        @timestamp: when the operation happened; not kept here, only by
+        statements that track times (`AggregatedStatement`)
+        """
+        op_code = OPERATION_CODES.get(operation_type)
+
+        if op_code is None:
+            raise ValueError('o tipo de operação é inválido.')
+
+        self.op_codes.append(op_code)
+        self.values.append(value_cents)
+        self.balances.append(balance_cents)
+
+    def append_code(self, op_code: int, value_cents: int, balance_cents: int):
+        """
+        Appends an operation given by its code (see `journal.OPERATION_CODES`),
+        skipping the name lookup; meant for hot paths such as the `Ledger`.
+        """
+        self.op_codes.append(op_code)
+        self.values.append(value_cents)
+        self.balances.append(balance_cents)
+
+    def extend_statement(self, statement: 'CompactStatement'):
+        """Appends every operation of another statement, in order"""
+        self.op_codes.extend(statement.op_codes)
+        self.values.extend(statement.values)
+        self.balances.extend(statement.balances)
+
+    def _as_dict(self, position: int) -> dict[str, Any]:
+        """Builds the statement dict of the operation in the given position"""
+        return {
+            'operation_type': OPERATION_TYPES[self.op_codes[position]],
+            'value': self.values[position] / 100,
+            'saldo_after_operation': self.balances[position] / 100
+        }
+
+    def __len__(self) -> int:
+        return len(self.op_codes)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._as_dict(position) for position in range(len(self))[item]]
+        return self._as_dict(range(len(self))[item])
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self._as_dict(position)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompactStatement):
+            return (self.op_codes == other.op_codes and self.values == other.values
+                    and self.balances == other.balances)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'CompactStatement({list(self)!r})'
+
+    def __sizeof__(self) -> int:
+        return (object.__sizeof__(self) + self.op_codes.__sizeof__()
+                + self.values.__sizeof__() + self.balances.__sizeof__())
+
+    def total(self, operation_type: str) -> int:
+        """Returns the sum, in cents, of every operation of the given type"""
+        op_code = OPERATION_CODES.get(operation_type)
+
+        if op_code is None:
+            raise ValueError('o tipo de operação é inválido.')
+
+        if np is not None and len(self) > 0:
+            op_codes = np.frombuffer(self.op_codes, dtype=np.uint8)
+            values = np.frombuffer(self.values, dtype=np.int64)
+            return int(values[op_codes == op_code].sum())
+
+        return sum(value for code, value in zip(self.op_codes, self.values)
+                   if code == op_code)
+
+    def min_balance(self) -> int | None:
+        """Returns the lowest balance, in cents, after any operation"""
+        if len(self) == 0:
+            return None
+        if np is not None:
+            return int(np.frombuffer(self.balances, dtype=np.int64).min())
+        return min(self.balances)
+
+    def max_balance(self) -> int | None:
+        """Returns the highest balance, in cents, after any operation"""
+        if len(self) == 0:
+            return None
+        if np is not None:
+            return int(np.frombuffer(self.balances, dtype=np.int64).max())
+        return max(self.balances)
@@ -7,6 +7,25 @@ be used to register an user and/or bank account.
 """
 
 import re
+from functools import lru_cache
+from typing import Any, Iterable
+
+from errors import InvalidCPFError
+from metrics import instrument
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional, `validate_many` falls back to pure Python
+    np = None
+
+CPF_PATTERN = re.compile(r'\d{3}.\d{3}.\d{3}-\d{2}')
+CPF_CACHE_SIZE = 4096 # recent results kept by `verify_cpf_cached`
+VALIDATION_CHUNK_SIZE = 65536 # CPFs checked per vectorized batch in `validate_many`
+INVALID_DIGITS_REASON = 'CPF inválido. Os dígitos verificadores não conferem.'
+
+if np is not None:
+    _D1_WEIGHTS = np.arange(10, 1, -1, dtype=np.int64)
+    _D2_WEIGHTS = np.arange(11, 1, -1, dtype=np.int64)
 
 def remove_punctuation_from_cpf(user_cpf: str) -> str:
     """
@@ -15,30 +34,184 @@ def remove_punctuation_from_cpf(user_cpf: str) -> str:
     """
     return user_cpf.replace('.', '').replace('-', '')
 
-def main(user_cpf: str) -> bool:
+def normalize_cpf(user_cpf: str) -> str:
     """
-    Allows the user to input their CPF and validates it to ensure
-    data quality.
+    Prepares a typed CPF for the validators: bare 11-digit CPFs get the
+    XXX.XXX.XXX-XX punctuation, anything else is returned as is. Raises
+    `ValueError` if the CPF isn't a string.
     """
-    if re.match(r'\d{3}.\d{3}.\d{3}-\d{2}', user_cpf):
+    if not isinstance(user_cpf, str):
+        raise InvalidCPFError("CPF inválido. Deve preencher o campo de CPF"
+                              " com a numeração XXX.XXX.XXX-XX")
+
+    if len(user_cpf) == 11 and user_cpf.isdigit():
+        return f'{user_cpf[:3]}.{user_cpf[3:6]}.{user_cpf[6:9]}-{user_cpf[9:]}'
+
+    return user_cpf
+
+def check_cpf_format(user_cpf: str) -> str:
+    """
+    Checks if the CPF follows the XXX.XXX.XXX-XX format and returns it
+    without punctuation. Raises `ValueError` when the format is invalid.
+    """
+    if CPF_PATTERN.match(user_cpf):
         user_cpf = remove_punctuation_from_cpf(user_cpf)
         is_digit = user_cpf.isdigit()
         is_eleven_digits_long = len(user_cpf) == 11
 
         if is_digit and is_eleven_digits_long:
-            return verify_last_digits(user_cpf)
+            return user_cpf
 
         if not is_digit:
-            raise ValueError('o CPF fornecido possui caracteres inválidos.')
+            raise InvalidCPFError('o CPF fornecido possui caracteres inválidos.')
 
         if not is_eleven_digits_long:
-            raise ValueError('o CPF fornecido possui mais do que 11 caracteres.')
+            raise InvalidCPFError('o CPF fornecido possui mais do que 11 caracteres.')
+
+        raise InvalidCPFError("CPF inválido. O CPF inserido não passou nos "
+                              "critérios de avaliação necessários.")
 
-        raise ValueError("CPF inválido. O CPF inserido não passou nos "
-                        "critérios de avaliação necessários.")
+    raise InvalidCPFError("CPF inválido. Deve preencher o campo de CPF"
+                          " com a numeração XXX.XXX.XXX-XX")
 
-    raise ValueError("CPF inválido. Deve preencher o campo de CPF"
-                        " com a numeração XXX.XXX.XXX-XX")
+def main(user_cpf: str) -> bool:
+    """
+    Allows the user to input their CPF and validates it to ensure
+    data quality.
+    """
+    return verify_last_digits(check_cpf_format(user_cpf))
+
+@instrument('cpf_validator.verify_cpf_fast', invalid_result=False)
+def verify_cpf_fast(user_cpf: str) -> bool:
+    """
+    Same as `main`, but without intermediate lists: the check digits are
+    computed straight from the CPF's bytes. Invalid formats go through
+    `main`, so the raised errors are exactly the same.
+    """
+    if CPF_PATTERN.match(user_cpf):
+        cpf_digits = user_cpf.replace('.', '').replace('-', '')
+
+        if len(cpf_digits) == 11 and cpf_digits.isdigit() and cpf_digits.isascii():
+            return _check_digits_match(cpf_digits.encode('ascii'))
+
+    return main(user_cpf)
+
+def verify_last_digits_fast(cpf: str) -> bool:
+    """
+    Same as `verify_last_digits`, computing the check digits straight
+    from the CPF's bytes.
+
+    Params:
+    @cpf: the evaluated CPF, without punctuation
+    """
+    if isinstance(cpf, str) and len(cpf) == 11 and cpf.isdigit() and cpf.isascii():
+        return _check_digits_match(cpf.encode('ascii'))
+
+    return verify_last_digits(cpf)
+
+@lru_cache(maxsize=CPF_CACHE_SIZE)
+def verify_cpf_cached(user_cpf: str) -> bool:
+    """
+    `verify_cpf_fast` with a bounded LRU memo of the latest results, for
+    paths where the same CPFs are checked over and over.
+    """
+    return verify_cpf_fast(user_cpf)
+
+def _check_digits_match(cpf_bytes: bytes) -> bool:
+    """
+    Checks both verification digits of an 11-byte ASCII CPF.
+
+    Each byte is the digit plus 48 (`ord('0')`), so the weighted sums
+    are taken over the raw bytes and corrected by 48 times the sum of
+    the weights (54 for the first digit, 65 for the second).
+    """
+    c0, c1, c2, c3, c4, c5, c6, c7, c8, c9, c10 = cpf_bytes
+
+    mod_eleven = (10 * c0 + 9 * c1 + 8 * c2 + 7 * c3 + 6 * c4
+                  + 5 * c5 + 4 * c6 + 3 * c7 + 2 * c8 - 2592) % 11
+    if c9 - 48 != (0 if mod_eleven < 2 else 11 - mod_eleven):
+        return False
+
+    mod_eleven = (11 * c0 + 10 * c1 + 9 * c2 + 8 * c3 + 7 * c4 + 6 * c5
+                  + 5 * c6 + 4 * c7 + 3 * c8 + 2 * c9 - 3120) % 11
+    return c10 - 48 == (0 if mod_eleven < 2 else 11 - mod_eleven)
+
+def validate_many(user_cpfs: Iterable[Any],
+                  with_reasons: bool = False) -> list[bool] | list[str | None]:
+    """
+    Validates a batch of CPFs with the same rules as `main`.
+
+    The format checks run per CPF, while the check digits are computed
+    for a whole chunk at once with NumPy (when installed); without NumPy
+    each CPF goes through `verify_last_digits_fast`.
+
+    Params:
+    @user_cpfs: iterable of CPFs, formatted as XXX.XXX.XXX-XX
+    @with_reasons: if `True`, returns the rejection reason for each CPF
+    (`None` when it is valid) instead of a `bool`
+
+    Returns:
+    list: one item per CPF, in the given order
+    """
+    reasons: list[str | None] = []
+    chunk = []
+
+    for user_cpf in user_cpfs:
+        chunk.append(user_cpf)
+        if len(chunk) == VALIDATION_CHUNK_SIZE:
+            reasons.extend(_validate_chunk(chunk))
+            chunk = []
+
+    if chunk:
+        reasons.extend(_validate_chunk(chunk))
+
+    if with_reasons:
+        return reasons
+    return [reason is None for reason in reasons]
+
+def _validate_chunk(user_cpfs: list[Any]) -> list[str | None]:
+    """
+    Validates one chunk of `validate_many`, returning the rejection
+    reason for each CPF (`None` when valid).
+    """
+    reasons: list[str | None] = [None] * len(user_cpfs)
+    positions = []
+    digit_strings = []
+
+    for position, user_cpf in enumerate(user_cpfs):
+        try:
+            cpf_digits = check_cpf_format(user_cpf)
+        except (TypeError, ValueError) as e:
+            reasons[position] = str(e)
+            continue
+
+        if np is not None and cpf_digits.isascii():
+            positions.append(position)
+            digit_strings.append(cpf_digits)
+            continue
+
+        try:
+            if not verify_last_digits_fast(cpf_digits):
+                reasons[position] = INVALID_DIGITS_REASON
+        except ValueError as e:
+            reasons[position] = str(e)
+
+    if positions:
+        matrix = np.frombuffer(''.join(digit_strings).encode('ascii'), dtype=np.uint8)
+        matrix = matrix.reshape(-1, 11).astype(np.int64) - 48
+
+        mod_d1 = (matrix[:, :9] @ _D1_WEIGHTS) % 11
+        mod_d2 = (matrix[:, :10] @ _D2_WEIGHTS) % 11
+        generated_d1 = np.where(mod_d1 < 2, 0, 11 - mod_d1)
+        generated_d2 = np.where(mod_d2 < 2, 0, 11 - mod_d2)
+
+        is_valid = (generated_d1 == matrix[:, 9]) & (generated_d2 == matrix[:, 10])
+
+        for position, valid in zip(positions, is_valid.tolist()):
+            if not valid:
+                reasons[position] = INVALID_DIGITS_REASON
+
+    return reasons
 
 def multiply_from_arr(int_arr: list[int]):
     """
@@ -0,0 +1,35 @@
+"""
+This module contains the exceptions raised when an operation is refused
+for one of the reasons the instrumentation counts (see `metrics`).
+
+They are `ValueError`s, so the existing handlers keep catching them, and
+their messages are the same as before; `reason` names the rejection in
+the metrics.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+class RejectedOperation(ValueError):
+    """An operation refused by the bank's rules"""
+    reason = 'other'
+
+class DailyLimitError(RejectedOperation):
+    """The account already reached its daily withdrawal limit"""
+    reason = 'daily_limit'
+
+class WithdrawalLimitError(RejectedOperation):
+    """The withdrawal exceeds the per-withdrawal or rolling window limits"""
+    reason = 'withdrawal_limit'
+
+class MinimumValueError(RejectedOperation):
+    """The withdrawal is below the minimum amount"""
+    reason = 'min_value'
+
+class InsufficientBalanceError(RejectedOperation):
+    """The account's balance doesn't cover the withdrawal"""
+    reason = 'insufficient_balance'
+
+class InvalidCPFError(RejectedOperation):
+    """The CPF is malformed or its check digits don't match"""
+    reason = 'invalid_cpf'
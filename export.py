@@ -0,0 +1,83 @@
+"""
+This module exports the users or accounts of a checkpoint, or an
+account's statement from the journal, to a file or to the standard
+output (so it can be piped), in any of the `renderers.OUTPUT_FORMATS`.
+
+Usage:
+    python export.py users|accounts --checkpoint bank.ckpt
+                     [--format text|csv|json] [--output users.csv]
+    python export.py statement --journal bank.journal --account 1
+                     [--format text|csv|json] [--output statement.csv]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import argparse
+import os
+import sys
+from typing import Any, Iterator
+
+from checkpoint import Checkpoint
+from renderers import OUTPUT_FORMATS, render_users, render_accounts, render_statement
+from statement_reader import StatementReader
+
+def journal_statement(path: str, acc_id: int) -> Iterator[dict[str, Any]]:
+    """
+    Streams an account's statement dicts from the journal.
+
+    Params:
+    @path: the journal file
+    @acc_id: the account's ID
+    """
+    if not os.path.exists(path):
+        return
+
+    with StatementReader(path, acc_id) as reader:
+        for record in reader.iter_records():
+            yield {'operation_type': record.operation_type,
+                   'value': record.value_cents / 100,
+                   'saldo_after_operation': record.balance_cents / 100}
+
+def main(argv: list[str] | None = None):
+    """
+    Runs the export from the command line
+    """
+    parser = argparse.ArgumentParser(description='Exportação de usuários, contas e extratos')
+    parser.add_argument('kind', choices=('users', 'accounts', 'statement'))
+    parser.add_argument('--checkpoint', help='checkpoint com os usuários e as contas')
+    parser.add_argument('--journal', help='journal com as operações')
+    parser.add_argument('--account', type=int, help='ID da conta do extrato')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='text')
+    parser.add_argument('--output', help='arquivo de saída (saída padrão se omitido)')
+    args = parser.parse_args(argv)
+
+    if args.kind == 'statement' and (args.journal is None or args.account is None):
+        parser.error('o extrato precisa de --journal e --account.')
+    if args.kind != 'statement' and args.checkpoint is None:
+        parser.error('a listagem de usuários e contas precisa de --checkpoint.')
+
+    out = sys.stdout
+    if args.output is not None:
+        out = open(args.output, 'w', encoding='utf-8', newline='', buffering=1024 * 1024)
+
+    try:
+        if args.kind == 'statement':
+            render_statement(journal_statement(args.journal, args.account), out, args.format)
+        else:
+            checkpoint = Checkpoint.load(args.checkpoint)
+            if args.kind == 'users':
+                render_users(checkpoint.users, out, args.format)
+            else:
+                render_accounts(checkpoint.accounts, checkpoint.users, out, args.format)
+        out.flush()
+    except BrokenPipeError:
+        # the reader of the pipe (`head`...) stopped early: keep Python from
+        # failing again when flushing the standard output at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+"""
+This module contains the transaction journal: a durable, append-only
+file where every deposit and withdrawal is recorded, so balances survive
+restarts.
+
+Each operation is stored as a fixed-width binary record (see `RECORD`),
+protected by a CRC32. Writes are grouped in memory and flushed together
+(group commit), with three durability modes:
+- `always`: every operation is written and fsync'ed before returning;
+- `interval`: buffered operations are fsync'ed every `interval_ms`;
+- `close`: the journal is only fsync'ed when it is closed.
+
+On startup the journal is recovered: a torn or corrupted tail (left by a
+crash in the middle of a write) is truncated, and the remaining records
+can be replayed into balances.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Iterator, NamedTuple
+
+JOURNAL_MAGIC = b'BKJRNL01'
+
+# seq, timestamp, account id, operation code, value (cents), balance (cents), crc32
+RECORD = struct.Struct('<QdIBqqI')
+RECORD_BODY = struct.Struct('<QdIBqq')
+MAX_ACCOUNT_ID = 2 ** 32 - 1 # the account id is stored as uint32
+
+OPERATION_CODES = {
+    'deposit': 1,
+    'withdrawal': 2
+}
+OPERATION_TYPES = {code: name for name, code in OPERATION_CODES.items()}
+
+DURABILITY_MODES = ('always', 'interval', 'close')
+WRITE_BUFFER_SIZE = 64 * 1024 # bytes buffered before a write, when not syncing
+
+class JournalRecord(NamedTuple):
+    """One operation read back from the journal"""
+    seq: int
+    timestamp: float
+    acc_id: int
+    operation_type: str
+    value_cents: int
+    balance_cents: int
+
+class Journal:
+    """
+    Append-only journal of banking operations.
+
+    Params:
+    @path: the journal file; created if it doesn't exist
+    @durability: one of `DURABILITY_MODES`
+    @interval_ms: the maximum time between fsyncs, in `interval` mode
+    """
+
+    def __init__(self, path: str, durability: str = 'interval', interval_ms: int = 10):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f'modo de durabilidade inválido: {durability}. '
+                             f'Use um entre {", ".join(DURABILITY_MODES)}.')
+
+        self.path = path
+        self.durability = durability
+        self.interval = interval_ms / 1000
+
+        self._next_seq = recover(path) + 1
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._flusher = None
+
+        if os.fstat(self._fd).st_size == 0:
+            os.write(self._fd, JOURNAL_MAGIC)
+            os.fsync(self._fd)
+
+        if durability == 'interval':
+            self._stop_flusher = threading.Event()
+            self._flusher = threading.Thread(target=self._flush_periodically,
+                                             name='journal-flusher', daemon=True)
+            self._flusher.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.close()
+
+    def append(self, acc_id: int, operation_type: str, value_cents: int,
+               balance_cents: int, timestamp: float | None = None) -> int:
+        """
+        Records one operation and returns its sequence number.
+
+        Params:
+        @acc_id: the account's ID
+        @operation_type: must be either 'withdrawal' or 'deposit'
+        @value_cents: the amount of money used in the operation, in cents
+        @balance_cents: the account's balance after the operation, in cents
+        @timestamp: when the operation happened (defaults to now)
+        """
+        op_code = OPERATION_CODES.get(operation_type)
+
+        if op_code is None:
+            raise ValueError('o tipo de operação é inválido.')
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        with self._lock:
+            if self._closed:
+                raise ValueError('o journal já foi fechado.')
+
+            seq = self._next_seq
+            self._next_seq += 1
+
+            body = RECORD_BODY.pack(seq, timestamp, acc_id, op_code,
+                                    value_cents, balance_cents)
+            self._buffer += body
+            self._buffer += zlib.crc32(body).to_bytes(4, 'little')
+
+            if self.durability == 'always':
+                self._flush(sync=True)
+            elif len(self._buffer) >= WRITE_BUFFER_SIZE:
+                self._flush(sync=False)
+
+        return seq
+
+    def sync(self):
+        """Writes every buffered operation and fsyncs the journal"""
+        with self._lock:
+            if not self._closed:
+                self._flush(sync=True)
+
+    def close(self):
+        """Syncs and closes the journal; further appends are refused"""
+        if self._flusher is not None:
+            self._stop_flusher.set()
+            self._flusher.join()
+            self._flusher = None
+
+        with self._lock:
+            if self._closed:
+                return
+            self._flush(sync=True)
+            os.close(self._fd)
+            self._closed = True
+
+    def _flush(self, sync: bool):
+        """Writes the buffer in a single call; must hold the lock"""
+        if self._buffer:
+            os.write(self._fd, self._buffer)
+            self._buffer.clear()
+            if sync:
+                os.fsync(self._fd)
+
+    def _flush_periodically(self):
+        """Background group commit used in `interval` mode"""
+        while not self._stop_flusher.wait(self.interval):
+            with self._lock:
+                if self._closed:
+                    return
+                self._flush(sync=True)
+
+def read_records(path: str) -> Iterator[JournalRecord]:
+    """
+    Reads the journal's records in order, stopping at the first torn or
+    corrupted record. A missing journal yields nothing.
+    """
+    try:
+        journal_file = open(path, 'rb')
+    except FileNotFoundError:
+        return
+
+    with journal_file:
+        magic = journal_file.read(len(JOURNAL_MAGIC))
+        if len(magic) < len(JOURNAL_MAGIC) and JOURNAL_MAGIC.startswith(magic):
+            return # empty journal, or a crash while it was being created
+        if magic != JOURNAL_MAGIC:
+            raise ValueError(f'o arquivo {path} não é um journal válido.')
+
+        while True:
+            raw = journal_file.read(RECORD.size)
+            if len(raw) < RECORD.size:
+                return
+
+            seq, timestamp, acc_id, op_code, value, balance, crc = RECORD.unpack(raw)
+
+            if zlib.crc32(raw[:RECORD_BODY.size]) != crc or op_code not in OPERATION_TYPES:
+                return
+
+            yield JournalRecord(seq, timestamp, acc_id, OPERATION_TYPES[op_code],
+                                value, balance)
+
+def recover(path: str) -> int:
+    """
+    Truncates the journal right after its last valid record and returns
+    that record's sequence number (0 if there is none).
+    """
+    if not os.path.exists(path):
+        return 0
+
+    size = os.path.getsize(path)
+    valid_size = len(JOURNAL_MAGIC) if size >= len(JOURNAL_MAGIC) else 0
+    last_seq = 0
+
+    for record in read_records(path):
+        last_seq = record.seq
+        valid_size += RECORD.size
+
+    if size > valid_size:
+        with open(path, 'r+b') as journal_file:
+            journal_file.truncate(valid_size)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+    return last_seq
+
+def replay_balances(path: str) -> dict[int, int]:
+    """
+    Replays the journal and returns each account's latest balance,
+    in cents, keyed by account ID.
+    """
+    balances = {}
+
+    for record in read_records(path):
+        balances[record.acc_id] = record.balance_cents
+
+    return balances
@@ -0,0 +1,389 @@
+"""
+This module contains the `Ledger`, which keeps the balance, the number of
+withdrawals of the day and the statement of many accounts, keyed by the
+account's ID.
+
+Amounts are integer cents (see `money`), and deposits and withdrawals
+follow the same rules as `banking_methods.deposit_cents` and
+`banking_methods.withdraw_cents`, without printing anything, so the
+ledger can be driven in tight loops.
+
+Statements are `CompactStatement`s, or any subclass given as
+`statement_class`, e.g. the `statement_aggregates.AggregatedStatement`,
+whose totals and checkpoints then follow every operation of the ledger.
+
+With a `limits.LimitsEngine`, withdrawals are checked against its
+limits instead of the fixed ones, and the daily counters roll over by
+themselves at the engine's midnight.
+
+The `ConcurrentLedger` can be shared by many threads: it uses lock
+striping, so operations on different accounts run in parallel while the
+checks and updates of each account stay atomic.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import datetime
+import threading
+from typing import Iterable, Iterator
+
+from banking_methods import (LIMIT_OF_WITHDRAWALS, LIMIT_PER_WITHDRAWAL_CENTS,
+                             raise_withdrawal_error)
+from compact_statement import CompactStatement
+from journal import Journal, MAX_ACCOUNT_ID, OPERATION_CODES, OPERATION_TYPES, read_records
+from limits import LimitsEngine
+from metrics import instrument
+from money import MAX_CENTS
+
+DEPOSIT_CODE = OPERATION_CODES['deposit']
+WITHDRAWAL_CODE = OPERATION_CODES['withdrawal']
+
+def check_account_id(acc_id: int):
+    """Refuses account IDs that don't fit in the journal's records"""
+    if acc_id.__class__ is not int or not 0 <= acc_id <= MAX_ACCOUNT_ID:
+        raise ValueError(f'o ID de conta {acc_id} está fora do intervalo aceito.')
+
+class AccountState:
+    """The ledger's data for a single account"""
+    __slots__ = ('balance', 'withdrawals', 'statement')
+
+    def __init__(self, balance: int = 0,
+                 statement_class: type[CompactStatement] | None = CompactStatement):
+        self.balance = balance
+        self.withdrawals = 0
+        self.statement = statement_class() if statement_class is not None else None
+
+class Ledger:
+    """
+    Balances, daily withdrawal counters and statements of many accounts.
+
+    Params:
+    @journal: optional `Journal` where every operation is recorded
+    @keep_statements: if `False`, statements are not kept in memory
+    (e.g. when they are read back from the journal instead)
+    @limits: optional `LimitsEngine` keeping the withdrawal counters; without
+    it, the fixed daily limit applies until `reset_daily_withdrawals`
+    @statement_class: the `CompactStatement` subclass of the statements
+    """
+
+    def __init__(self, journal: Journal | None = None, keep_statements: bool = True,
+                 limits: LimitsEngine | None = None,
+                 statement_class: type[CompactStatement] = CompactStatement):
+        self.journal = journal
+        self.keep_statements = keep_statements
+        self.limits = limits
+        self.statement_class = statement_class
+        self._statement_class = statement_class if keep_statements else None
+        self._accounts: dict[int, AccountState] = {}
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+    def __contains__(self, acc_id: int) -> bool:
+        return acc_id in self._accounts
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._accounts)
+
+    def open_account(self, acc_id: int, balance: int = 0):
+        """
+        Starts keeping the given account, with an initial balance in cents.
+        Opening an account twice is refused.
+        """
+        if acc_id in self._accounts:
+            raise ValueError(f'a conta de ID {acc_id} já existe no livro-razão.')
+        check_account_id(acc_id)
+
+        self._accounts[acc_id] = AccountState(balance, self._statement_class)
+
+    def merge_account(self, acc_id: int, balance: int, withdrawals: int,
+                      statement: CompactStatement | None = None):
+        """
+        Sets an account's balance and withdrawal counter to the result of
+        operations applied elsewhere (e.g. by a settlement worker), appending
+        those operations to the account's statement and journal. Unknown
+        accounts are opened.
+
+        Params:
+        @acc_id: the account's ID
+        @balance: the account's new balance, in cents
+        @withdrawals: the account's new number of withdrawals in the day
+        @statement: the operations applied elsewhere, in order
+        """
+        state = self._accounts.get(acc_id)
+        if state is None:
+            check_account_id(acc_id)
+            state = self._accounts[acc_id] = AccountState(0, self._statement_class)
+
+        if self.limits is not None:
+            amount = self.limits.amount_today(acc_id)
+            if statement is not None:
+                amount += sum(value for op_code, value in zip(statement.op_codes,
+                                                              statement.values)
+                              if op_code == WITHDRAWAL_CODE)
+            self.limits.set_today(acc_id, withdrawals, amount)
+
+        state.balance = balance
+        state.withdrawals = withdrawals
+
+        if statement is None:
+            return
+
+        if state.statement is not None:
+            state.statement.extend_statement(statement)
+
+        if self.journal is not None:
+            for operation in range(len(statement)):
+                self.journal.append(acc_id, OPERATION_TYPES[statement.op_codes[operation]],
+                                    statement.values[operation],
+                                    statement.balances[operation])
+
+    def _get(self, acc_id: int) -> AccountState:
+        """Returns the account's state, refusing unknown accounts"""
+        try:
+            return self._accounts[acc_id]
+        except KeyError:
+            raise ValueError(f'a conta de ID {acc_id} não existe.') from None
+
+    def balance(self, acc_id: int) -> int:
+        """Returns the account's balance, in cents"""
+        return self._get(acc_id).balance
+
+    def withdrawals(self, acc_id: int) -> int:
+        """Returns the number of withdrawals the account made in the current day"""
+        state = self._get(acc_id)
+        if self.limits is not None:
+            return self.limits.withdrawals_today(acc_id)
+        return state.withdrawals
+
+    def statement(self, acc_id: int) -> CompactStatement | None:
+        """Returns the account's statement (`None` if statements aren't kept)"""
+        return self._get(acc_id).statement
+
+    def balances(self) -> dict[int, int]:
+        """Returns every account's balance, in cents, keyed by account ID"""
+        return {acc_id: state.balance for acc_id, state in self._accounts.items()}
+
+    def reset_daily_withdrawals(self):
+        """Zeroes every account's withdrawal counter, at the start of a new day"""
+        for state in self._accounts.values():
+            state.withdrawals = 0
+        if self.limits is not None:
+            self.limits.reset()
+
+    @instrument('Ledger.deposit')
+    def deposit(self, acc_id: int, amount: int) -> int:
+        """
+        Deposits `amount` cents into the account and returns the new balance.
+        The operation is recorded before the balance changes, so a failure
+        leaves the account as it was.
+
+        Params:
+        @acc_id: the account's ID
+        @amount: the amount of money to be deposited, in cents
+        """
+        state = self._accounts.get(acc_id)
+
+        if state is None:
+            state = self._get(acc_id)
+        if amount <= 0:
+            raise ValueError('o valor para depósito deve ser maior que zero.')
+
+        balance = state.balance + amount
+        if balance > MAX_CENTS:
+            raise ValueError('o depósito excede o saldo máximo aceito pelo sistema.')
+
+        if self.journal is not None:
+            self.journal.append(acc_id, 'deposit', amount, balance)
+        if state.statement is not None:
+            state.statement.append_code(DEPOSIT_CODE, amount, balance)
+
+        state.balance = balance
+        return balance
+
+    @instrument('Ledger.withdraw')
+    def withdraw(self, acc_id: int, amount: int) -> int:
+        """
+        Withdraws `amount` cents from the account and returns the new balance.
+
+        Params:
+        @acc_id: the account's ID
+        @amount: the amount of money to be withdrawn, in cents
+        """
+        state = self._accounts.get(acc_id)
+
+        if state is None:
+            state = self._get(acc_id)
+
+        if self.limits is not None:
+            return self._withdraw_with_limits(acc_id, state, amount)
+
+        if (state.withdrawals < LIMIT_OF_WITHDRAWALS and amount >= LIMIT_PER_WITHDRAWAL_CENTS
+                and state.balance >= amount):
+            balance = state.balance - amount
+        else:
+            raise_withdrawal_error(state.withdrawals < LIMIT_OF_WITHDRAWALS,
+                                   amount >= LIMIT_PER_WITHDRAWAL_CENTS,
+                                   state.balance >= amount)
+
+        if self.journal is not None:
+            self.journal.append(acc_id, 'withdrawal', amount, balance)
+        if state.statement is not None:
+            state.statement.append_code(WITHDRAWAL_CODE, amount, balance)
+
+        state.balance = balance
+        state.withdrawals += 1
+        return balance
+
+    def _withdraw_with_limits(self, acc_id: int, state: AccountState, amount: int) -> int:
+        """`withdraw`, with the limits and counters of the `LimitsEngine`"""
+        now = self.limits.clock()
+        self.limits.check_withdrawal(acc_id, amount, now)
+
+        if state.balance < amount:
+            raise_withdrawal_error(True, True, False)
+
+        balance = state.balance - amount
+
+        if self.journal is not None:
+            self.journal.append(acc_id, 'withdrawal', amount, balance, now)
+        if state.statement is not None:
+            state.statement.append_code(WITHDRAWAL_CODE, amount, balance)
+
+        state.balance = balance
+        state.withdrawals += 1
+        self.limits.record_withdrawal(acc_id, amount, now)
+        return balance
+
+    def apply_many(self, operations: Iterable[tuple[int, str, int]]) -> tuple[int, int]:
+        """
+        Applies (account ID, 'deposit' or 'withdrawal', amount in cents)
+        operations in order, skipping the ones refused by the rules, and
+        returns how many were (accepted, rejected).
+        """
+        deposit = self.deposit
+        withdraw = self.withdraw
+        accepted = rejected = 0
+
+        for acc_id, operation_type, amount in operations:
+            try:
+                if operation_type == 'deposit':
+                    deposit(acc_id, amount)
+                elif operation_type == 'withdrawal':
+                    withdraw(acc_id, amount)
+                else:
+                    raise ValueError('o tipo de operação é inválido.')
+                accepted += 1
+            except ValueError:
+                rejected += 1
+
+        return accepted, rejected
+
+    def load_journal(self, path: str):
+        """
+        Restores the balances (and statements, if kept) from a journal written
+        by previous sessions, counting today's withdrawals (or, with a
+        `LimitsEngine`, the withdrawals of its rolling window). Accounts found
+        in the journal are opened automatically.
+
+        Params:
+        @path: the journal file
+        """
+        today = datetime.date.today()
+
+        for record in read_records(path):
+            state = self._accounts.get(record.acc_id)
+            if state is None:
+                state = self._accounts[record.acc_id] = AccountState(0, self._statement_class)
+
+            state.balance = record.balance_cents
+
+            if state.statement is not None:
+                state.statement.append_cents(record.operation_type, record.value_cents,
+                                             record.balance_cents, record.timestamp)
+
+            if record.operation_type != 'withdrawal':
+                continue
+
+            if self.limits is not None:
+                self.limits.record_withdrawal(record.acc_id, record.value_cents,
+                                              record.timestamp)
+            elif datetime.date.fromtimestamp(record.timestamp) == today:
+                state.withdrawals += 1
+
+class ConcurrentLedger(Ledger):
+    """
+    Thread-safe `Ledger`, using a fixed pool of locks (stripes) picked by
+    account ID. Each deposit or withdrawal holds its account's stripe for
+    the whole check-then-update, including the `LimitsEngine`'s check and
+    counters, so balances never go negative and the withdrawal limits
+    hold, however many threads share an account.
+
+    Params:
+    @journal: optional `Journal` where every operation is recorded
+    @keep_statements: if `False`, statements are not kept in memory
+    @stripes: number of locks in the pool
+    @limits: optional `LimitsEngine` keeping the withdrawal counters
+    @statement_class: the `CompactStatement` subclass of the statements
+    """
+
+    def __init__(self, journal: Journal | None = None, keep_statements: bool = True,
+                 stripes: int = 64, limits: LimitsEngine | None = None,
+                 statement_class: type[CompactStatement] = CompactStatement):
+        super().__init__(journal, keep_statements, limits, statement_class)
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        self._accounts_lock = threading.Lock()
+
+    def _stripe(self, acc_id: int) -> threading.Lock:
+        """Returns the lock guarding the given account"""
+        return self._stripes[hash(acc_id) % len(self._stripes)]
+
+    def _all_stripes(self):
+        """Acquires every stripe, in order, for operations spanning all accounts"""
+        for stripe in self._stripes:
+            stripe.acquire()
+
+    def _release_all_stripes(self):
+        """Releases the stripes taken by `_all_stripes`"""
+        for stripe in reversed(self._stripes):
+            stripe.release()
+
+    def open_account(self, acc_id: int, balance: int = 0):
+        with self._accounts_lock:
+            super().open_account(acc_id, balance)
+
+    def merge_account(self, acc_id: int, balance: int, withdrawals: int,
+                      statement: CompactStatement | None = None):
+        with self._accounts_lock, self._stripe(acc_id):
+            super().merge_account(acc_id, balance, withdrawals, statement)
+
+    def deposit(self, acc_id: int, amount: int) -> int:
+        with self._stripe(acc_id):
+            return super().deposit(acc_id, amount)
+
+    def withdraw(self, acc_id: int, amount: int) -> int:
+        with self._stripe(acc_id):
+            return super().withdraw(acc_id, amount)
+
+    def balances(self) -> dict[int, int]:
+        self._all_stripes()
+        try:
+            return super().balances()
+        finally:
+            self._release_all_stripes()
+
+    def reset_daily_withdrawals(self):
+        self._all_stripes()
+        try:
+            super().reset_daily_withdrawals()
+        finally:
+            self._release_all_stripes()
+
+    def load_journal(self, path: str):
+        with self._accounts_lock:
+            self._all_stripes()
+            try:
+                super().load_journal(path)
+            finally:
+                self._release_all_stripes()
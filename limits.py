@@ -0,0 +1,231 @@
+"""
+This module contains the withdrawal limits engine, which keeps, for each
+account, the number and the amount (in cents) of the withdrawals of each
+day, so the daily limit no longer depends on a counter that someone has
+to reset.
+
+Days follow a configurable timezone: a day starts at local midnight, and
+the counters roll over by themselves. Each account keeps a small ring of
+day buckets (one per day of the rolling window), indexed by the day's
+ordinal modulo the ring size; a bucket holding an older day is stale and
+is simply overwritten the next time it's used, so nothing has to expire
+the old days. Every check reads at most one bucket per day of the
+window, whatever the account's history.
+
+Besides the rules of `banking_methods` (withdrawals per day and minimum
+amount), `WithdrawalLimits` can cap the amount per withdrawal, the
+amount per day and the number and amount of withdrawals in a rolling
+window of days.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import datetime
+import time
+from typing import Callable, NamedTuple
+
+from banking_methods import (LIMIT_OF_WITHDRAWALS, LIMIT_PER_WITHDRAWAL_CENTS,
+                             raise_withdrawal_error)
+from errors import DailyLimitError, MinimumValueError, WithdrawalLimitError
+from money import format_cents
+
+ONE_DAY = datetime.timedelta(days=1)
+
+class WithdrawalLimits(NamedTuple):
+    """
+    The withdrawal limits; amounts are in cents, and `None` means no limit.
+
+    Params:
+    @max_per_day: number of withdrawals per day
+    @min_amount: minimum amount of a withdrawal
+    @max_amount: maximum amount of a withdrawal
+    @max_amount_per_day: total amount withdrawn per day
+    @window_days: length, in days (today included), of the rolling window
+    @max_per_window: number of withdrawals in the rolling window
+    @max_amount_per_window: total amount withdrawn in the rolling window
+    """
+    max_per_day: int | None = LIMIT_OF_WITHDRAWALS
+    min_amount: int = LIMIT_PER_WITHDRAWAL_CENTS
+    max_amount: int | None = None
+    max_amount_per_day: int | None = None
+    window_days: int = 1
+    max_per_window: int | None = None
+    max_amount_per_window: int | None = None
+
+class DayRing:
+    """One account's day buckets: the day ordinal, count and amount of each"""
+    __slots__ = ('days', 'counts', 'amounts')
+
+    def __init__(self, size: int):
+        self.days = [0] * size
+        self.counts = [0] * size
+        self.amounts = [0] * size
+
+class LimitsEngine:
+    """
+    Per-account, per-day withdrawal counters checked against the limits.
+
+    Params:
+    @limits: the limits enforced
+    @timezone: the timezone whose midnight starts each day (the system's
+    local time if not given)
+    @clock: returns the current time as a Unix timestamp
+    """
+
+    def __init__(self, limits: WithdrawalLimits = WithdrawalLimits(),
+                 timezone: datetime.tzinfo | None = None,
+                 clock: Callable[[], float] = time.time):
+        if limits.window_days < 1:
+            raise ValueError('a janela de limites deve ter ao menos um dia.')
+
+        self.limits = limits
+        self.timezone = timezone
+        self.clock = clock
+        self._ring_size = limits.window_days
+        self._accounts: dict[int, DayRing] = {}
+        # (start, end, ordinal) of the last day looked up, replaced as a
+        # whole so threads never see a torn value
+        self._cached_day = (0.0, 0.0, 0)
+
+    def day(self, timestamp: float | None = None) -> int:
+        """
+        Returns the ordinal of the day (in the engine's timezone) of the
+        given timestamp, or of now.
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+
+        start, end, ordinal = self._cached_day
+        if start <= timestamp < end:
+            return ordinal
+
+        date = datetime.datetime.fromtimestamp(timestamp, self.timezone).date()
+        midnight = datetime.datetime.combine(date, datetime.time(), tzinfo=self.timezone)
+        start = midnight.timestamp()
+        end = datetime.datetime.combine(date + ONE_DAY, datetime.time(),
+                                        tzinfo=self.timezone).timestamp()
+
+        self._cached_day = (start, end, date.toordinal())
+        return date.toordinal()
+
+    def _ring(self, acc_id: int) -> DayRing:
+        """Returns the account's ring, creating it on first use"""
+        ring = self._accounts.get(acc_id)
+        if ring is None:
+            ring = self._accounts.setdefault(acc_id, DayRing(self._ring_size))
+        return ring
+
+    def _day_totals(self, acc_id: int, day: int) -> tuple[int, int]:
+        """Returns the (count, amount) of a single day, reading only its bucket"""
+        ring = self._accounts.get(acc_id)
+        if ring is None:
+            return 0, 0
+
+        slot = day % self._ring_size
+        if ring.days[slot] != day:
+            return 0, 0
+        return ring.counts[slot], ring.amounts[slot]
+
+    def _window_totals(self, acc_id: int, today: int) -> tuple[int, int]:
+        """Returns the (count, amount) of the rolling window ending today"""
+        ring = self._accounts.get(acc_id)
+        if ring is None:
+            return 0, 0
+
+        count = amount = 0
+        for slot in range(self._ring_size):
+            if today - self._ring_size < ring.days[slot] <= today:
+                count += ring.counts[slot]
+                amount += ring.amounts[slot]
+
+        return count, amount
+
+    def withdrawals_today(self, acc_id: int, timestamp: float | None = None) -> int:
+        """Returns the number of withdrawals the account made in the day"""
+        return self._day_totals(acc_id, self.day(timestamp))[0]
+
+    def amount_today(self, acc_id: int, timestamp: float | None = None) -> int:
+        """Returns the amount, in cents, the account withdrew in the day"""
+        return self._day_totals(acc_id, self.day(timestamp))[1]
+
+    def window_totals(self, acc_id: int, timestamp: float | None = None) -> tuple[int, int]:
+        """Returns the (count, amount in cents) of the rolling window's withdrawals"""
+        return self._window_totals(acc_id, self.day(timestamp))
+
+    def check_withdrawal(self, acc_id: int, amount: int, timestamp: float | None = None):
+        """
+        Raises `ValueError`, explaining which limit, if withdrawing `amount`
+        cents now (or at `timestamp`) would break any limit. The balance is
+        the caller's business.
+        """
+        limits = self.limits
+        today = self.day(timestamp)
+        count, amount_today = self._day_totals(acc_id, today)
+
+        if limits.max_per_day is not None and count >= limits.max_per_day:
+            raise_withdrawal_error(False, True, True)
+
+        if amount < limits.min_amount:
+            if limits.min_amount == LIMIT_PER_WITHDRAWAL_CENTS:
+                raise_withdrawal_error(True, False, True)
+            raise MinimumValueError('o valor mínimo para realizar o saque é '
+                                    f'R$ {format_cents(limits.min_amount)}.')
+
+        if limits.max_amount is not None and amount > limits.max_amount:
+            raise WithdrawalLimitError('o valor máximo por saque é '
+                                       f'R$ {format_cents(limits.max_amount)}.')
+
+        if (limits.max_amount_per_day is not None
+                and amount_today + amount > limits.max_amount_per_day):
+            raise DailyLimitError('o saque excede o limite diário de '
+                                  f'R$ {format_cents(limits.max_amount_per_day)}.')
+
+        if limits.max_per_window is None and limits.max_amount_per_window is None:
+            return
+
+        count, amount_in_window = self._window_totals(acc_id, today)
+
+        if limits.max_per_window is not None and count >= limits.max_per_window:
+            raise WithdrawalLimitError('você já excedeu o número máximo de saques '
+                                       f'em {self._ring_size} dias.')
+
+        if (limits.max_amount_per_window is not None
+                and amount_in_window + amount > limits.max_amount_per_window):
+            raise WithdrawalLimitError(f'o saque excede o limite de '
+                                       f'R$ {format_cents(limits.max_amount_per_window)} '
+                                       f'em {self._ring_size} dias.')
+
+    def record_withdrawal(self, acc_id: int, amount: int, timestamp: float | None = None):
+        """
+        Counts a withdrawal of `amount` cents, made now or at `timestamp`.
+        Withdrawals older than the rolling window are ignored.
+        """
+        day = self.day(timestamp)
+        ring = self._ring(acc_id)
+        slot = day % self._ring_size
+
+        if ring.days[slot] != day:
+            if ring.days[slot] > day:
+                return
+            ring.days[slot] = day
+            ring.counts[slot] = 0
+            ring.amounts[slot] = 0
+
+        ring.counts[slot] += 1
+        ring.amounts[slot] += amount
+
+    def set_today(self, acc_id: int, count: int, amount: int,
+                  timestamp: float | None = None):
+        """Sets the number and amount of the account's withdrawals in the day"""
+        day = self.day(timestamp)
+        ring = self._ring(acc_id)
+        slot = day % self._ring_size
+
+        ring.days[slot] = day
+        ring.counts[slot] = count
+        ring.amounts[slot] = amount
+
+    def reset(self):
+        """Forgets every account's withdrawals"""
+        self._accounts.clear()
@@ -6,9 +6,25 @@ made for DIO's Python Developer Bootcamp challenge.
 @date: 2025-04-05
 """
 
-from banking_methods import deposit_money, withdraw_money, print_statement, convert_str_to_float
-from users import main as create_user, print_user_list
+import argparse
+import os
+import zoneinfo
+from money import parse_cents, format_cents
+from users import main as register_user, print_user_list
 from account import register_account, print_account_list
+from checkpoint import Checkpoint
+from journal import Journal
+from ledger import Ledger
+from limits import LimitsEngine
+from metrics import dump as dump_metrics
+from profiling import TOP_N as PROFILE_TOP_N, add_profile_arguments, profile_session
+from statement_reader import print_statement_from_journal, close_statement_readers
+
+JOURNAL_PATH = os.environ.get('BANKING_JOURNAL', 'banking_journal.bin')
+JOURNAL_DURABILITY = os.environ.get('BANKING_JOURNAL_DURABILITY', 'interval')
+CHECKPOINT_PATH = os.environ.get('BANKING_CHECKPOINT', 'banking_checkpoint.bin')
+# timezone whose midnight starts a new day of withdrawals (system time if unset)
+TIMEZONE = os.environ.get('BANKING_TIMEZONE')
 
 # Pre-made template start
 
@@ -27,15 +43,65 @@ MENU = """
 
 # Pre-made template end
 
-def main():
+def ask_account_id(ledger: Ledger) -> int:
+    """
+    Asks the ID of the account being operated, refusing accounts that
+    don't exist.
+
+    Params:
+    @ledger: the ledger holding the bank's accounts
+    """
+    acc_id = input('Insira o ID da conta: ').strip()
+
+    if not acc_id.isdecimal():
+        raise ValueError('o ID da conta deve ser um número inteiro.')
+
+    acc_id = int(acc_id)
+
+    if acc_id not in ledger:
+        raise ValueError(f'a conta de ID {acc_id} não existe.')
+
+    return acc_id
+
+def main(profile: str | None = None, profile_top: int = PROFILE_TOP_N):
     """
     Holds the main logic for the module
+
+    Params:
+    @profile: path prefix of the session's profile (see `profiling`), if
+    the session is profiled
+    @profile_top: number of functions listed in the profile's summary
     """
-    acc_balance = 0 # equivalent to 'saldo'
-    acc_daily_withdrawals = 0 # equivalent to 'saques diários'
-    acc_statement = [] # equivalent to 'extrato'
-    user_database = []
-    account_database = []
+    journal = Journal(JOURNAL_PATH, JOURNAL_DURABILITY)
+
+    try:
+        with profile_session(profile, profile_top):
+            run_menu(journal)
+    finally:
+        close_statement_readers()
+        journal.close()
+        dump_metrics()
+
+def run_menu(journal: Journal):
+    """
+    Runs the interactive menu, recording every deposit and withdrawal
+    in the given `journal`. Users and accounts are saved in a checkpoint
+    (see `checkpoint`) after each registration.
+    """
+    # balances, 'saques diários' and 'extrato' of every account;
+    # statements are read back from the journal (see `statement_reader`)
+    # and the daily withdrawals roll over at midnight (see `limits`)
+    limits = LimitsEngine(timezone=zoneinfo.ZoneInfo(TIMEZONE) if TIMEZONE else None)
+    ledger = Ledger(journal, keep_statements=False, limits=limits)
+    ledger.load_journal(journal.path)
+
+    checkpoint = Checkpoint.load(CHECKPOINT_PATH, start_id=max(ledger, default=0) + 1)
+    user_database = checkpoint.users
+    account_database = checkpoint.accounts
+
+    for account in account_database:
+        if account['id'] not in ledger:
+            ledger.open_account(account['id'])
 
     while True:
         options = input(MENU)
@@ -44,46 +110,42 @@ def main():
             match options:
                 case 'd':
                     print('Depósito')
-                    deposit_value = input('Insira o valor que será depositado:')
+                    acc_id = ask_account_id(ledger)
+                    deposit_value = parse_cents(
+                        input('Insira o valor que será depositado:'))
 
-                    if isinstance(deposit_value, str):
-                        deposit_value = convert_str_to_float(deposit_value)
-                    if isinstance(deposit_value, int):
-                        deposit_value = float(deposit_value)
-
-                    acc_balance, acc_statement = deposit_money(acc_balance,
-                                                               deposit_value,
-                                                               acc_statement)
+                    ledger.deposit(acc_id, deposit_value)
+                    print(f'O depósito de R$ {format_cents(deposit_value)} '
+                          'foi realizado com sucesso!')
 
                 case 's':
                     print('Saque')
-                    withdrawal_value = input('Insira o valor que será sacado:')
-
-                    if isinstance(withdrawal_value, str):
-                        withdrawal_value = convert_str_to_float(withdrawal_value)
-                    if isinstance(withdrawal_value, int):
-                        withdrawal_value = float(withdrawal_value)
+                    acc_id = ask_account_id(ledger)
+                    withdrawal_value = parse_cents(
+                        input('Insira o valor que será sacado:'))
 
-                    acc_balance, acc_daily_withdrawals, acc_statement = withdraw_money(
-                        acc_balance,
-                        acc_daily_withdrawals,
-                        withdrawal_value,
-                        acc_statement
-                    )
+                    ledger.withdraw(acc_id, withdrawal_value)
+                    print(f'O saque de R$ {format_cents(withdrawal_value)} '
+                          'foi realizado com sucesso!')
 
                 case 'c':
                     print('Cadastrar conta bancária')
                     account_database = register_account(
                         user_arr=user_database,
                         acc_arr=account_database)
+                    ledger.open_account(account_database.next_id - 1)
+                    checkpoint.save()
 
                 case 'u':
                     print('Cadastrar usuário')
-                    user_database = create_user(user_database)
+                    user_database = register_user(user_database)
+                    checkpoint.save()
 
                 case 'x':
                     print('Extrato')
-                    print_statement(acc_statement)
+                    acc_id = ask_account_id(ledger)
+                    journal.sync()
+                    print_statement_from_journal(journal.path, acc_id)
 
                 case 'lu':
                     print('Lista de usuários')
@@ -94,6 +156,7 @@ def main():
                     print_account_list(account_database, user_database)
 
                 case 'e':
+                    checkpoint.compact()
                     print('Agradecemos a preferência!')
                     break
 
@@ -110,4 +173,6 @@ def main():
             print('Tente novamente:')
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='Sistema bancário')
+    add_profile_arguments(parser)
+    main(**vars(parser.parse_args()))
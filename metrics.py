@@ -0,0 +1,328 @@
+"""
+This module contains the opt-in instrumentation of the hot paths: call
+counts, latency histograms and rejection counters per function, which
+can be dumped as JSON or in the Prometheus text format.
+
+Instrumentation is turned on by the `BANKING_METRICS` environment
+variable, set to the file where `main.main` dumps the metrics on exit
+(`.prom` files get the Prometheus format, any other the JSON one). The
+`instrument` decorator decides when the module is imported: with the
+variable unset, it returns the function itself, so the disabled
+instrumentation costs nothing.
+
+Latencies go to HDR-style histograms: fixed buckets, exact below 16 ns
+and with 8 linear sub-buckets per power of two above it, so every
+bucket is at most 12.5% wide whatever the latency.
+
+Rejections are the exceptions raised by the instrumented functions (and
+the CPFs a validator finds invalid), counted by reason: the `reason` of
+the `errors.RejectedOperation` raised, or 'other' for any other error.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import json
+import os
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable
+
+from errors import InvalidCPFError
+
+METRICS_PATH = os.environ.get('BANKING_METRICS', '')
+ENABLED = METRICS_PATH not in ('', '0')
+
+SUB_BUCKET_BITS = 3
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS # linear sub-buckets per power of two
+MAX_VALUE_BITS = 40 # ~18 minutes in ns; larger values go to the last bucket
+BUCKETS = 2 * SUB_BUCKETS + (MAX_VALUE_BITS - SUB_BUCKET_BITS - 1) * SUB_BUCKETS
+
+INVALID_CPF = InvalidCPFError.reason
+
+def bucket_index(value: int) -> int:
+    """Returns the histogram bucket of a (non-negative) value"""
+    if value < 2 * SUB_BUCKETS:
+        return max(value, 0)
+
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    index = SUB_BUCKETS * (shift + 1) + (value >> shift) - SUB_BUCKETS
+    return min(index, BUCKETS - 1)
+
+def bucket_upper_bound(index: int) -> int:
+    """Returns the highest value counted in the given bucket"""
+    if index < 2 * SUB_BUCKETS:
+        return index
+
+    shift, sub_bucket = divmod(index - SUB_BUCKETS, SUB_BUCKETS)
+    return ((SUB_BUCKETS + sub_bucket + 1) << shift) - 1
+
+def rejection_reason(error: Exception) -> str:
+    """Classifies an error raised by an instrumented function"""
+    return getattr(error, 'reason', 'other')
+
+class Histogram:
+    """Fixed-bucket (HDR-style) histogram of integer values"""
+
+    def __init__(self):
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def record(self, value: int):
+        """Counts a value"""
+        if value < 2 * SUB_BUCKETS:
+            index = max(value, 0)
+        else:
+            shift = value.bit_length() - SUB_BUCKET_BITS - 1
+            index = min(SUB_BUCKETS * (shift + 1) + (value >> shift) - SUB_BUCKETS,
+                        BUCKETS - 1)
+
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if self.max is None:
+            self.min = self.max = value
+        elif value > self.max:
+            self.max = value
+        elif value < self.min:
+            self.min = value
+
+    def percentile(self, percent: float) -> int | None:
+        """
+        Returns the given percentile (the upper bound of its bucket, capped
+        by the highest value seen), or `None` if nothing was recorded
+        """
+        if self.count == 0:
+            return None
+
+        rank = max(1, round(percent / 100 * self.count))
+        seen = 0
+
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bucket_upper_bound(index), self.max)
+
+        return self.max
+
+    def merge(self, other: 'Histogram'):
+        """Adds the values counted by `other`"""
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def count_at_most(self, limit: int) -> int:
+        """
+        Returns how many values up to `limit` (inclusive) were recorded;
+        `limit` must be the upper bound of a bucket, such as a power of two
+        minus one
+        """
+        return sum(self.counts[:bucket_index(limit) + 1])
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary and non-empty buckets (keyed by upper bound) of the histogram"""
+        return {
+            'count': self.count, 'sum': self.total, 'min': self.min, 'max': self.max,
+            'p50': self.percentile(50), 'p90': self.percentile(90),
+            'p99': self.percentile(99), 'p999': self.percentile(99.9),
+            'buckets': {bucket_upper_bound(index): count
+                        for index, count in enumerate(self.counts) if count}
+        }
+
+class Metrics:
+    """
+    Latency histograms (in ns, their counts being the number of calls)
+    and rejections by reason, per function.
+
+    Each thread records into its own histograms (shards), so the calls
+    never wait on a lock; the shards are merged when the metrics are read.
+    """
+
+    def __init__(self):
+        self.rejections: dict[str, dict[str, int]] = {}
+        self._shards: dict[str, list[Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def shard(self, name: str) -> Histogram:
+        """Returns a new histogram of `name`, for the calling thread to record in"""
+        histogram = Histogram()
+
+        with self._lock:
+            self._shards.setdefault(name, []).append(histogram)
+
+        return histogram
+
+    def latency(self, name: str) -> Histogram:
+        """Returns the latency histogram of `name`, merging every thread's"""
+        merged = Histogram()
+
+        with self._lock:
+            shards = list(self._shards.get(name, ()))
+
+        for histogram in shards:
+            merged.merge(histogram)
+
+        return merged
+
+    def names(self) -> list[str]:
+        """Returns the names of the functions called at least once"""
+        with self._lock:
+            return [name for name, shards in self._shards.items()
+                    if any(histogram.count for histogram in shards)]
+
+    def reject(self, name: str, reason: str):
+        """Counts a refused call of `name`"""
+        with self._lock:
+            reasons = self.rejections.setdefault(name, {})
+            reasons[reason] = reasons.get(reason, 0) + 1
+
+    def reset(self):
+        """Forgets everything recorded"""
+        with self._lock:
+            for shards in self._shards.values():
+                for histogram in shards:
+                    histogram.__init__()
+            self.rejections.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns the metrics as a JSON-serializable dict"""
+        functions = {}
+
+        for name in self.names():
+            latency = self.latency(name)
+            with self._lock:
+                rejections = dict(self.rejections.get(name, {}))
+            functions[name] = {'calls': latency.count, 'rejections': rejections,
+                               'latency_ns': latency.to_dict()}
+
+        return {'functions': functions}
+
+    def to_json(self) -> str:
+        """Returns the metrics in JSON"""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Returns the metrics in the Prometheus text format. The histogram
+        buckets go from 1 us to ~17 s, doubling each time; since `le` is
+        inclusive, each bound is a power of two minus 1 ns (the top of an
+        HDR bucket), so a latency of exactly 2^n ns counts in the next one.
+        """
+        latencies = {name: self.latency(name) for name in self.names()}
+        with self._lock:
+            rejections = {name: dict(reasons) for name, reasons in self.rejections.items()}
+
+        lines = ['# HELP banking_calls_total Calls of each instrumented function.',
+                 '# TYPE banking_calls_total counter']
+        for name, histogram in latencies.items():
+            lines.append(f'banking_calls_total{{function="{name}"}} {histogram.count}')
+
+        lines += ['# HELP banking_rejections_total Refused calls, by reason.',
+                  '# TYPE banking_rejections_total counter']
+        for name, reasons in rejections.items():
+            for reason, count in reasons.items():
+                lines.append(f'banking_rejections_total{{function="{name}",'
+                             f'reason="{reason}"}} {count}')
+
+        lines += ['# HELP banking_latency_seconds Latency of each instrumented function.',
+                  '# TYPE banking_latency_seconds histogram']
+        for name, histogram in latencies.items():
+            for bits in range(10, 35):
+                limit = (1 << bits) - 1
+                lines.append(f'banking_latency_seconds_bucket{{function="{name}",'
+                             f'le="{limit / 1e9:.9g}"}} '
+                             f'{histogram.count_at_most(limit)}')
+            lines.append(f'banking_latency_seconds_bucket{{function="{name}",le="+Inf"}} '
+                         f'{histogram.count}')
+            lines.append(f'banking_latency_seconds_sum{{function="{name}"}} '
+                         f'{histogram.total / 1e9:.9g}')
+            lines.append(f'banking_latency_seconds_count{{function="{name}"}} '
+                         f'{histogram.count}')
+
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path: str):
+        """Writes the metrics to `path`, in the Prometheus format for `.prom` files"""
+        text = self.to_prometheus() if path.endswith('.prom') else self.to_json()
+
+        with open(path, 'w', encoding='utf-8') as metrics_file:
+            metrics_file.write(text)
+
+METRICS = Metrics()
+
+class ThreadShard(threading.local):
+    """The histogram of a function the calling thread records in"""
+
+    def __init__(self, metrics: Metrics, name: str):
+        # runs again, with the same arguments, on each thread's first use
+        self.record = metrics.shard(name).record
+
+def instrument(name: str, invalid_result: Any = None, metrics: Metrics | None = None,
+               enabled: bool | None = None) -> Callable:
+    """
+    Decorator counting the calls, latency and rejections of a function.
+    When disabled, the function is returned untouched.
+
+    Params:
+    @name: the function's name in the metrics
+    @invalid_result: a result counted as an invalid CPF rejection (e.g.
+    `False` for a validator), if not `None`
+    @metrics: where to record (the module's `METRICS` if not given)
+    @enabled: overrides the `BANKING_METRICS` environment variable
+    """
+    if enabled is None:
+        enabled = ENABLED
+    if metrics is None:
+        metrics = METRICS
+
+    def decorator(function: Callable) -> Callable:
+        if not enabled:
+            return function
+
+        shard = ThreadShard(metrics, name)
+        reject = metrics.reject
+        clock = time.perf_counter_ns
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                result = function(*args, **kwargs)
+            except Exception as e:
+                elapsed = clock() - start
+                shard.record(elapsed)
+                reject(name, rejection_reason(e))
+                raise
+
+            elapsed = clock() - start
+            shard.record(elapsed)
+            if invalid_result is not None and result is invalid_result:
+                reject(name, INVALID_CPF)
+            return result
+
+        return wrapper
+
+    return decorator
+
+def dump(path: str | None = None):
+    """
+    Writes the recorded metrics to `path` (`BANKING_METRICS` if not given);
+    does nothing while the instrumentation is disabled
+    """
+    if path is None:
+        if not ENABLED:
+            return
+        path = METRICS_PATH
+
+    METRICS.dump(path)
@@ -0,0 +1,99 @@
+"""
+This module contains the fixed-point money helpers: amounts are kept as
+`int` cents, which avoids the rounding drift of `float` without the
+cost of `decimal.Decimal`.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+# amounts are stored as int64 (journal records, compact statements)
+MAX_CENTS = 2 ** 63 - 1
+MIN_CENTS = -2 ** 63
+
+def parse_cents(value: str | int | float) -> int:
+    """
+    Converts a user entry to an amount in cents.
+
+    Both comma and dot are accepted as the decimal separator
+    (`500,50` and `500.50`), with at most two decimal places; floats must
+    also be a whole number of cents. Amounts outside the int64 range of
+    cents are refused.
+
+    Params:
+    @value: the amount, in reais
+
+    Example:
+    >>> parse_cents('500,5')
+    50050
+    """
+    if value.__class__ is str and len(value) > 3 and value[-3] in ',.':
+        # fast path for the common 'reais,cents' entry
+        digits = value[:-3] + value[-2:]
+        if digits.isdecimal() and len(digits) <= 18: # 18 digits always fit in int64
+            return int(digits)
+
+    err_msg = (f'o valor "{value}" não é aceito '
+               'pelo sistema. Insira apenas números, separando '
+               'as casas decimais por vírgula ou ponto.')
+
+    if isinstance(value, bool):
+        raise ValueError(err_msg)
+    if isinstance(value, int):
+        return check_cents_range(value * 100, value)
+    if isinstance(value, float):
+        if value != value or value in (float('inf'), float('-inf')):
+            raise ValueError(err_msg)
+        cents = round(value * 100)
+        # tolerates the binary noise of values such as 0.1 + 0.2, not a
+        # real fraction of a cent such as 10.555
+        if abs(value * 100 - cents) > 1e-6:
+            raise ValueError(f'o valor "{value}" possui mais de duas casas decimais.')
+        return check_cents_range(cents, value)
+    if not isinstance(value, str):
+        raise ValueError(err_msg)
+
+    text = value.strip()
+    negative = text.startswith('-')
+    if negative or text.startswith('+'):
+        text = text[1:]
+
+    whole, _, fraction = text.replace(',', '.', 1).partition('.')
+
+    if not whole and not fraction:
+        raise ValueError(err_msg)
+    if (whole and not whole.isdecimal()) or (fraction and not fraction.isdecimal()):
+        raise ValueError(err_msg)
+    if len(fraction) > 2:
+        raise ValueError(f'o valor "{value}" possui mais de duas casas decimais.')
+
+    cents = int(whole or 0) * 100 + int(fraction.ljust(2, '0'))
+
+    return check_cents_range(-cents if negative else cents, value)
+
+def check_cents_range(cents: int, value=None) -> int:
+    """
+    Returns `cents`, refusing amounts outside the int64 range, which can't
+    be stored in the journal or in a compact statement.
+
+    Params:
+    @cents: the amount, in cents
+    @value: the entry the amount came from, shown in the error message
+    """
+    if not MIN_CENTS <= cents <= MAX_CENTS:
+        raise ValueError(f'o valor "{cents if value is None else value}" excede o '
+                         'limite aceito pelo sistema.')
+    return cents
+
+def format_cents(cents: int) -> str:
+    """
+    Formats an amount in cents with two decimal places, as done with
+    `f'{value:.2f}'` for reais.
+
+    Example:
+    >>> format_cents(50050)
+    '500.50'
+    """
+    sign = '-' if cents < 0 else ''
+    reais, cents = divmod(abs(cents), 100)
+    return f'{sign}{reais}.{cents:02d}'
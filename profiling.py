@@ -0,0 +1,201 @@
+"""
+This module contains the profiling mode of the command-line entry points
+(`main.py`, `batch.py`, `user_import.py`, `replay.py`): with
+`--profile PREFIX`, the whole session runs under `cProfile` while a
+sampler records the main thread's stack every few milliseconds, and
+three files are written at the end:
+- `PREFIX.pstats`: the raw `cProfile` data, for `pstats`, snakeviz etc.;
+- `PREFIX.collapsed`: the sampled stacks in the collapsed format
+  (`frame;frame;frame count` per line), ready for flamegraph.pl or
+  speedscope;
+- `PREFIX.txt`: the top-N summary, also printed to stderr, with the time
+  spent in each of the project's modules (`banking_methods`, `users`,
+  `account`, `cpf_validator`, ...) and their most expensive functions.
+
+Only the calling thread is profiled; the worker processes of
+`batch.py --workers N` and `user_import.py --workers N` are not. The
+samples are wall-clock time, so in the interactive menu the time spent
+waiting for the user's input shows up under `main:run_menu`.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PREFIX = 'banking_profile'
+TOP_N = 20
+SAMPLE_INTERVAL = 0.005 # seconds between stack samples
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    """Adds `--profile [PREFIX]` and `--profile-top N` to a command-line parser"""
+    parser.add_argument('--profile', nargs='?', const=DEFAULT_PREFIX, metavar='PREFIX',
+                        help='grava o perfil da sessão em PREFIX.pstats, '
+                             'PREFIX.collapsed e PREFIX.txt')
+    parser.add_argument('--profile-top', type=int, default=TOP_N, metavar='N',
+                        help='número de funções no resumo do perfil')
+
+@lru_cache(maxsize=None)
+def project_module(filename: str) -> str | None:
+    """Returns the project module a source file belongs to, if any"""
+    if os.path.dirname(os.path.abspath(filename)) != PROJECT_DIR:
+        return None
+
+    return os.path.splitext(os.path.basename(filename))[0]
+
+def frame_label(frame) -> str:
+    """
+    Names a stack frame as `module:function`; project modules are named
+    after their file, so a script run as `__main__` keeps its name.
+    Methods get their class name only on Python 3.11+ (`co_qualname`).
+    """
+    code = frame.f_code
+    module = project_module(code.co_filename) or frame.f_globals.get('__name__', '?')
+    return f'{module}:{getattr(code, "co_qualname", code.co_name)}'
+
+class StackSampler:
+    """
+    Samples a thread's stack at a fixed interval from a background thread,
+    counting each distinct (collapsed) stack.
+
+    Params:
+    @thread_id: the `threading.get_ident()` of the sampled thread
+    @interval: seconds between samples
+    """
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            labels = []
+
+            while frame is not None:
+                labels.append(frame_label(frame))
+                frame = frame.f_back
+
+            if labels:
+                self.stacks[';'.join(reversed(labels))] += 1
+
+    def collapsed(self) -> str:
+        """Returns the samples in the collapsed-stack format"""
+        return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+class Profiler:
+    """
+    Profiles the calling thread with `cProfile` and a `StackSampler`.
+
+    Params:
+    @top: number of functions listed in the summary
+    @interval: seconds between stack samples
+    """
+
+    def __init__(self, top: int = TOP_N, interval: float = SAMPLE_INTERVAL):
+        self.top = top
+        self.profile = cProfile.Profile()
+        self.sampler = StackSampler(threading.get_ident(), interval)
+
+    def start(self):
+        self.sampler.start()
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+        self.sampler.stop()
+
+    def summary(self) -> str:
+        """
+        Returns the top-N summary: the time spent in each project module
+        (own time of its functions) and the project's functions with the
+        highest own and cumulative times.
+        """
+        stats = pstats.Stats(self.profile).stats
+        total = sum(tottime for _, _, tottime, _, _ in stats.values())
+        modules: dict[str, list[float]] = {}
+        functions = []
+
+        for (filename, line, name), (_, calls, tottime, cumtime, _) in stats.items():
+            module = project_module(filename)
+            if module is None or module == __name__:
+                continue
+
+            totals = modules.setdefault(module, [0, 0.0])
+            totals[0] += calls
+            totals[1] += tottime
+            functions.append((f'{module}:{name}:{line}', calls, tottime, cumtime))
+
+        lines = [f'Tempo total:\t{total:.3f} s', '', 'Módulos do projeto (tempo próprio):']
+        lines += [f'{tottime:10.3f} s {100 * tottime / (total or 1):6.1f}%'
+                  f' {calls:>10} chamadas  {module}'
+                  for module, (calls, tottime)
+                  in sorted(modules.items(), key=lambda item: item[1][1], reverse=True)]
+
+        for title, column in (('tempo próprio', 2), ('tempo acumulado', 3)):
+            lines += ['', f'Funções do projeto por {title}:']
+            lines += [f'{function[column]:10.3f} s {function[1]:>10} chamadas  {function[0]}'
+                      for function in sorted(functions, key=lambda function: function[column],
+                                             reverse=True)[:self.top]]
+
+        samples = sum(self.sampler.stacks.values())
+        lines += ['', f'Amostras de pilha:\t{samples}']
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, prefix: str) -> str:
+        """Writes the `.pstats`, `.collapsed` and `.txt` files and returns the summary"""
+        summary = self.summary()
+        self.profile.dump_stats(f'{prefix}.pstats')
+
+        with open(f'{prefix}.collapsed', 'w', encoding='utf-8') as collapsed_file:
+            collapsed_file.write(self.sampler.collapsed())
+        with open(f'{prefix}.txt', 'w', encoding='utf-8') as summary_file:
+            summary_file.write(summary)
+
+        return summary
+
+@contextmanager
+def profile_session(prefix: str | None, top: int = TOP_N,
+                    interval: float = SAMPLE_INTERVAL) -> Iterator[Profiler | None]:
+    """
+    Profiles the block and writes the results (see `Profiler.write`) when
+    it ends, even by an exception; does nothing if `prefix` is `None`.
+
+    Params:
+    @prefix: path prefix of the output files
+    @top: number of functions listed in the summary
+    @interval: seconds between stack samples
+    """
+    if prefix is None:
+        yield None
+        return
+
+    profiler = Profiler(top, interval)
+    profiler.start()
+
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        print(profiler.write(prefix), file=sys.stderr)
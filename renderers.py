@@ -0,0 +1,240 @@
+"""
+This module contains the renderers of the user list, the account list
+and the statement, used by the `print_*` functions and to export them
+to files or pipes.
+
+The rows are written as they are formatted, a chunk at a time, instead
+of joining the whole list in memory first: exporting millions of rows
+runs in bounded memory, and the first chunk is small and flushed right
+away, so the first lines show up immediately.
+
+Each renderer writes one of the `OUTPUT_FORMATS`:
+- `text`: the terminal format;
+- `csv`: a CSV with header;
+- `json`: a JSON array, one object per line.
+
+The `export` module runs them from the command line.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import csv
+import datetime
+import json
+import sys
+from itertools import islice
+from typing import Any, Iterable, Iterator, TextIO
+
+from storage import USER_COLUMNS, ACCOUNT_COLUMNS
+
+OUTPUT_FORMATS = ('text', 'csv', 'json')
+CHUNK_ROWS = 4096 # rows written at a time
+FIRST_CHUNK_ROWS = 64 # rows of the first write, flushed right away
+
+ACCOUNT_EXPORT_COLUMNS = ACCOUNT_COLUMNS + ('name',)
+STATEMENT_COLUMNS = ('operation_type', 'value', 'saldo_after_operation')
+
+NO_USERS_MESSAGE = 'Nenhum usuário cadastrado até o momento'
+NO_ACCOUNTS_MESSAGE = 'Nenhuma conta registrada até o momento'
+NO_OPERATIONS_MESSAGE = 'Nenhuma operação feita até o momento'
+
+PRETTIFY_NAMES = {
+    'withdrawal': 'saque',
+    'deposit': 'depósito'
+}
+
+class _LineBuffer:
+    """File-like object collecting what a `csv.writer` writes"""
+
+    def __init__(self):
+        self.parts: list[str] = []
+        self.write = self.parts.append
+
+    def take(self) -> str:
+        """Returns what was written since the last call"""
+        text = ''.join(self.parts)
+        self.parts.clear()
+        return text
+
+def format_user_entry(user: dict[str, Any]) -> str:
+    """Formats one user the way it is shown on the terminal"""
+    return (f'Nome:\t{user.get("name", "Sem nome")}\n'
+            f'CPF:\t{user.get("cpf", "Sem CPF")}\n'
+            f'Endereço:\t{user.get("full_address", "Sem endereço")}')
+
+def format_account_entry(account: dict[str, Any], user_name: str) -> str:
+    """Formats one account, with its owner's name, the way it is shown on the terminal"""
+    return (f'Identificador único:\t{account.get("id", "ID desconhecido")}\n'
+            f'Agência:\t{account.get("agency", "Agência desconhecida")}\n'
+            f'Nome do usuário:\t{user_name}')
+
+def format_statement_entry(operation_type: str, value: float, balance: float) -> str:
+    """
+    Formats one statement operation the way it is shown on the terminal.
+
+    Params:
+    @operation_type: must be either 'withdrawal' or 'deposit'
+    @value: the amount of money used in the operation
+    @balance: the account's total balance after the operation
+    """
+    return (f'Operação: {PRETTIFY_NAMES.get(operation_type, "N/A")}\n'
+            f'Valor da operação:\tR$ {value:.2f}\n'
+            f'Saldo após a operação:\tR$ {balance:.2f}')
+
+def owner_names(user_database: Iterable[dict[str, Any]]) -> dict[str, str]:
+    """
+    Maps each user's CPF to their name, so the owners of a whole account
+    list are resolved with a single pass over the user database.
+    """
+    return {user.get('cpf', None): user.get('name', 'Usuário desconhecido')
+            for user in user_database}
+
+def _json_default(value: Any) -> str:
+    """Serializes the values `json` doesn't know (the birth dates)"""
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    raise TypeError(f'o tipo {type(value)} não é suportado.')
+
+def _csv_value(value: Any) -> Any:
+    """Writes the dates in ISO format, like in the JSON output"""
+    return value.isoformat() if isinstance(value, datetime.date) else value
+
+def _lines(rows: Iterable[dict[str, Any]], columns: tuple[str, ...], output_format: str,
+           format_entry) -> Iterator[str]:
+    """
+    Yields the output lines (with their line breaks) of the given rows.
+    In the text format, each row is formatted with `format_entry`.
+    """
+    if output_format == 'text':
+        for row in rows:
+            yield format_entry(row) + '\n'
+
+    elif output_format == 'csv':
+        buffer = _LineBuffer()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(columns)
+        yield buffer.take()
+
+        for row in rows:
+            writer.writerow([_csv_value(row.get(column, None)) for column in columns])
+            yield buffer.take()
+
+    elif output_format == 'json':
+        separator = '[\n'
+        for row in rows:
+            yield separator + json.dumps({column: row.get(column, None) for column in columns},
+                                         ensure_ascii=False, default=_json_default)
+            separator = ',\n'
+        yield ('[' if separator == '[\n' else '') + '\n]\n'
+
+    else:
+        raise ValueError(f'o formato de saída "{output_format}" é inválido.')
+
+def _write(lines: Iterator[str], out: TextIO, chunk_rows: int) -> int:
+    """
+    Writes the lines in chunks of `chunk_rows`, flushing the first
+    (smaller) one right away, and returns how many lines were written.
+    """
+    written = 0
+    chunk = list(islice(lines, min(FIRST_CHUNK_ROWS, chunk_rows)))
+
+    if chunk:
+        out.write(''.join(chunk))
+        out.flush()
+        written = len(chunk)
+
+    for chunk in iter(lambda: list(islice(lines, chunk_rows)), []):
+        out.write(''.join(chunk))
+        written += len(chunk)
+
+    return written
+
+def _render(rows: Iterable[dict[str, Any]], columns: tuple[str, ...], format_entry,
+            empty_message: str, out: TextIO | None, output_format: str,
+            chunk_rows: int) -> int:
+    """Renders the rows and returns how many were rendered"""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f'o formato de saída "{output_format}" é inválido.')
+
+    if out is None:
+        out = sys.stdout
+
+    rendered = 0
+
+    def counted(rows):
+        nonlocal rendered
+        for rendered, row in enumerate(rows, start=1):
+            yield row
+
+    _write(_lines(counted(rows), columns, output_format, format_entry), out, chunk_rows)
+
+    if rendered == 0 and output_format == 'text':
+        out.write(empty_message + '\n')
+
+    return rendered
+
+def render_users(user_database: Iterable[dict[str, Any]], out: TextIO | None = None,
+                 output_format: str = 'text', chunk_rows: int = CHUNK_ROWS) -> int:
+    """
+    Writes the user list and returns how many users were written.
+
+    Params:
+    @user_database: the users (any iterable, such as a generator)
+    @out: the output text stream (`sys.stdout` if not given)
+    @output_format: one of `OUTPUT_FORMATS`
+    @chunk_rows: number of rows written at a time
+    """
+    return _render(user_database, USER_COLUMNS, format_user_entry, NO_USERS_MESSAGE,
+                   out, output_format, chunk_rows)
+
+def render_accounts(acc_database: Iterable[dict[str, Any]],
+                    user_database: Iterable[dict[str, Any]], out: TextIO | None = None,
+                    output_format: str = 'text', chunk_rows: int = CHUNK_ROWS) -> int:
+    """
+    Writes the account list, with each owner's name, and returns how many
+    accounts were written. Raises `ValueError` when reaching an account
+    whose owner isn't in the user database.
+
+    Params:
+    @acc_database: the accounts (any iterable, such as a generator)
+    @user_database: the users, read once to build the owner map
+    @out: the output text stream (`sys.stdout` if not given)
+    @output_format: one of `OUTPUT_FORMATS`
+    @chunk_rows: number of rows written at a time
+    """
+    names = None
+
+    def with_owner_names():
+        nonlocal names
+        for account in acc_database:
+            if names is None:
+                names = owner_names(user_database)
+
+            user_name = names.get(account.get('user', None), None)
+            if user_name is None:
+                raise ValueError("Usuário não existe na base de dados!")
+
+            yield {**account, 'name': user_name}
+
+    return _render(with_owner_names(), ACCOUNT_EXPORT_COLUMNS,
+                   lambda account: format_account_entry(account, account['name']),
+                   NO_ACCOUNTS_MESSAGE, out, output_format, chunk_rows)
+
+def render_statement(statement: Iterable[dict[str, Any]], out: TextIO | None = None,
+                     output_format: str = 'text', chunk_rows: int = CHUNK_ROWS) -> int:
+    """
+    Writes the account's statement and returns how many operations were
+    written.
+
+    Params:
+    @statement: the statement dicts (a list, a `StatementStorage`...)
+    @out: the output text stream (`sys.stdout` if not given)
+    @output_format: one of `OUTPUT_FORMATS`
+    @chunk_rows: number of rows written at a time
+    """
+    return _render(statement, STATEMENT_COLUMNS,
+                   lambda ext: format_statement_entry(ext.get("operation_type", None),
+                                                      ext.get("value", 0),
+                                                      ext.get("saldo_after_operation", 0)),
+                   NO_OPERATIONS_MESSAGE, out, output_format, chunk_rows)
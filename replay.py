@@ -0,0 +1,174 @@
+"""
+This module contains the replay harness: it drives a `workload.Workload`
+through the core functions (`users.create_user`, `account.open_account`
+and the `Ledger`'s deposits and withdrawals), optionally at a fixed rate,
+and reports the throughput, the latency percentiles of each kind of
+event and the process's peak RSS.
+
+The latencies go to `metrics.Histogram`s. At a fixed rate, an event that
+runs late (because the previous ones took longer than the interval) is
+timed from the moment it was scheduled, not from when it actually ran,
+so the queueing delay shows up in the percentiles instead of being
+hidden (coordinated omission).
+
+Usage:
+    python replay.py [--rate 0] [--seed 42] [--users 10000] [--operations 1000000]
+                     [--max-accounts-per-user 1] [--skew 1.1]
+                     [--withdrawal-ratio 0.3] [--days 1]
+                     [--profile [PREFIX]] [--profile-top 20]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import argparse
+import sys
+import time
+from typing import Any, Iterator
+
+try:
+    import resource
+except ImportError: # not available on Windows, where the peak RSS isn't reported
+    resource = None
+
+from account import open_account
+from account_registry import AccountRegistry
+from batch import BatchReport
+from ledger import Ledger
+from metrics import Histogram
+from profiling import add_profile_arguments, profile_session
+from user_store import UserStore
+from users import create_user
+from workload import Workload, add_workload_arguments, workload_from_arguments
+
+EVENT_KINDS = ('register_user', 'register_account', 'deposit', 'withdrawal')
+PERCENTILES = (50, 90, 99, 99.9)
+
+def peak_rss() -> int | None:
+    """Returns the process's peak resident set size, in bytes, if known"""
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+class ReplayReport(BatchReport):
+    """Counters, latencies (in ns) per kind of event and peak RSS of a replay"""
+    PROCESSED_LABEL = 'Eventos reproduzidos'
+    RATE_LABEL = 'eventos/s'
+
+    def __init__(self):
+        super().__init__()
+        self.latencies = {kind: Histogram() for kind in EVENT_KINDS}
+        self.peak_rss: int | None = None
+
+    def summary(self) -> str:
+        """Formats the report for the terminal"""
+        lines = [super().summary(), '',
+                 'Latência (us):\t' + '\t'.join(f'p{percent:g}' for percent in PERCENTILES)
+                 + '\tmáx']
+
+        for kind, histogram in self.latencies.items():
+            if histogram.count == 0:
+                continue
+            values = [histogram.percentile(percent) for percent in PERCENTILES]
+            values.append(histogram.max)
+            lines.append(f'{kind} ({histogram.count}):\t'
+                         + '\t'.join(f'{value / 1000:.1f}' for value in values))
+
+        if self.peak_rss is not None:
+            lines += ['', f'Pico de RSS:\t{self.peak_rss / 2 ** 20:.1f} MiB']
+
+        return '\n'.join(lines)
+
+def workload_events(workload: Workload) -> Iterator[tuple[str, int, Any, Any]]:
+    """
+    Yields the workload's events as (kind, day, first argument, second
+    argument): the users' registrations, then the accounts' openings, then
+    the operations.
+    """
+    for user in workload.users:
+        yield 'register_user', 0, user, None
+    for owner_cpf in workload.account_owners:
+        yield 'register_account', 0, owner_cpf, None
+    for operation in workload.operations():
+        yield operation.operation_type, operation.day, operation.acc_id, operation.value
+
+def replay(workload: Workload, rate: float | None = None) -> ReplayReport:
+    """
+    Runs the workload against a new bank (a `UserStore`, an
+    `AccountRegistry` and a `Ledger`) and returns the report. Refused
+    events are counted by reason; the daily withdrawals are reset at
+    each new day of the workload.
+
+    Params:
+    @workload: the events to replay
+    @rate: events per second, or `None` to run as fast as possible
+    """
+    users = UserStore()
+    accounts = AccountRegistry()
+    ledger = Ledger(keep_statements=False)
+    report = ReplayReport()
+    latencies = report.latencies
+    rejections = report.rejections
+    clock = time.perf_counter_ns
+    interval = round(1e9 / rate) if rate else 0
+    today = 0
+
+    start = clock()
+
+    for number, (kind, day, first, second) in enumerate(workload_events(workload)):
+        if day != today:
+            ledger.reset_daily_withdrawals()
+            today = day
+
+        if interval:
+            scheduled = start + number * interval
+            ahead = scheduled - clock()
+            if ahead > 0:
+                time.sleep(ahead / 1e9)
+                scheduled = clock() # sleeping late isn't the bank's latency
+        else:
+            scheduled = clock()
+
+        try:
+            match kind:
+                case 'deposit':
+                    ledger.deposit(first, second)
+                case 'withdrawal':
+                    ledger.withdraw(first, second)
+                case 'register_user':
+                    create_user(users, first)
+                case 'register_account':
+                    ledger.open_account(open_account(users, accounts, first)['id'])
+            report.accepted += 1
+        except (ValueError, TypeError) as e:
+            report.rejected += 1
+            rejections[str(e)] += 1
+
+        latencies[kind].record(clock() - scheduled)
+
+    report.elapsed = (clock() - start) / 1e9
+    report.peak_rss = peak_rss()
+
+    return report
+
+def main(argv: list[str] | None = None):
+    """Replays a workload from the command line, printing the report"""
+    parser = argparse.ArgumentParser(description='Reprodução de carga sintética')
+    parser.add_argument('--rate', type=float, default=0,
+                        help='eventos por segundo (0 = o mais rápido possível)')
+    add_workload_arguments(parser)
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    workload = workload_from_arguments(args)
+
+    with profile_session(args.profile, args.profile_top):
+        report = replay(workload, args.rate or None)
+
+    print(report.summary())
+
+if __name__ == '__main__':
+    main()
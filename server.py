@@ -0,0 +1,252 @@
+"""
+This module contains an asyncio TCP server for the banking operations,
+so many clients can be served at once instead of a single operator at
+the terminal.
+
+The protocol is JSON lines: each request is a JSON object on its own
+line, and each response is written back on its own line, in the same
+order as the requests. Clients may pipeline, i.e. send many requests
+without waiting for the responses.
+
+Request:  {"id": 1, "op": "deposit", "acc_id": 1, "value": "100,00"}
+Response: {"id": 1, "ok": true, "result": {"balance": "100.00"}}
+Error:    {"id": 1, "ok": false, "error": "o valor para depósito ..."}
+
+Operations (besides `op` and the optional `id`, echoed back):
+- `deposit` / `withdraw`: `acc_id`, `value` (in reais, see `money`)
+- `balance` / `statement`: `acc_id`
+- `register_user`: `cpf`, `name`, `birth_date` (dd-mm-aaaa), `address`,
+  `house_number`, `neighbourhood`, `city`, `state_uf`
+- `register_account`: `cpf`, optional `agency`
+- `metrics`: no fields; the instrumentation's counters and histograms
+  (see `metrics`), empty unless `BANKING_METRICS` is set
+
+Backpressure: the server stops reading a connection while its pending
+responses exceed `HIGH_WATER_MARK` bytes, so a client that doesn't read
+its responses is slowed down by TCP instead of growing the server's
+memory. Lines are limited to `MAX_LINE_SIZE` bytes.
+
+Usage:
+    python server.py [--host 127.0.0.1] [--port 8765] [--journal path]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import argparse
+import asyncio
+import json
+from typing import Any
+
+from account import open_account
+from account_registry import AccountRegistry
+from journal import Journal, OPERATION_TYPES
+from ledger import Ledger
+from metrics import METRICS
+from limits import LimitsEngine
+from money import parse_cents, format_cents
+from user_store import UserStore
+from users import create_user
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MAX_LINE_SIZE = 64 * 1024
+HIGH_WATER_MARK = 256 * 1024
+INTERNAL_ERROR = 'erro interno ao processar a requisição.'
+
+class BankingService:
+    """
+    The bank's state (users, accounts and ledger) and the operations the
+    server exposes, independent of the network protocol.
+
+    Params:
+    @journal: optional `Journal` where every operation is recorded
+    """
+
+    def __init__(self, journal: Journal | None = None):
+        self.ledger = Ledger(journal, limits=LimitsEngine())
+        self.users = UserStore()
+        self.accounts = AccountRegistry()
+
+        if journal is not None:
+            self.ledger.load_journal(journal.path)
+            self.accounts = AccountRegistry(start_id=max(self.ledger, default=0) + 1)
+
+        self.handlers = {
+            'deposit': self.deposit,
+            'withdraw': self.withdraw,
+            'balance': self.balance,
+            'statement': self.statement,
+            'register_user': self.register_user,
+            'register_account': self.register_account,
+            'metrics': self.metrics,
+        }
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Runs a request and builds its response; refused operations
+        (including amounts and IDs out of the accepted range) become error
+        responses instead of exceptions.
+        """
+        response = {'id': request.get('id', None)}
+        handler = self.handlers.get(request.get('op', None))
+
+        try:
+            if handler is None:
+                raise ValueError('a operação solicitada não existe.')
+            response['result'] = handler(request)
+            response['ok'] = True
+        except (ValueError, TypeError, KeyError) as e:
+            response['ok'] = False
+            response['error'] = (f'o campo {e} é obrigatório.' if isinstance(e, KeyError)
+                                 else str(e))
+
+        return response
+
+    @staticmethod
+    def _acc_id(request: dict[str, Any]) -> int:
+        """Reads the account ID of a request"""
+        acc_id = request['acc_id']
+
+        if acc_id.__class__ is str and acc_id.isdecimal():
+            return int(acc_id)
+        if acc_id.__class__ is not int:
+            raise ValueError('o ID da conta deve ser um número inteiro.')
+
+        return acc_id
+
+    def deposit(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Deposits `value` into the account `acc_id`"""
+        balance = self.ledger.deposit(self._acc_id(request), parse_cents(request['value']))
+        return {'balance': format_cents(balance)}
+
+    def withdraw(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Withdraws `value` from the account `acc_id`"""
+        balance = self.ledger.withdraw(self._acc_id(request), parse_cents(request['value']))
+        return {'balance': format_cents(balance)}
+
+    def balance(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Returns the balance of the account `acc_id`"""
+        return {'balance': format_cents(self.ledger.balance(self._acc_id(request)))}
+
+    def statement(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Returns the operations and the balance of the account `acc_id`"""
+        acc_id = self._acc_id(request)
+        statement = self.ledger.statement(acc_id)
+
+        return {
+            'operations': [
+                {'operation_type': OPERATION_TYPES[op_code],
+                 'value': format_cents(value),
+                 'balance': format_cents(balance)}
+                for op_code, value, balance in zip(statement.op_codes, statement.values,
+                                                   statement.balances)
+            ],
+            'balance': format_cents(self.ledger.balance(acc_id))
+        }
+
+    def register_user(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Registers a user (see `users.create_user`)"""
+        return {'cpf': create_user(self.users, request)['cpf']}
+
+    def register_account(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Opens an account for the user with the given CPF"""
+        account = open_account(self.users, self.accounts, request['cpf'],
+                               request.get('agency', '0001'))
+        self.ledger.open_account(account['id'])
+
+        return {'id': account['id'], 'agency': account['agency']}
+
+    def metrics(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Returns a snapshot of the instrumentation (see `metrics`)"""
+        return METRICS.snapshot()
+
+async def handle_connection(service: BankingService, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter):
+    """
+    Serves one client: requests are read and answered in order, and
+    reading pauses while the client is behind on its responses.
+    """
+    handle = service.handle
+    transport = writer.transport
+
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError: # line longer than MAX_LINE_SIZE
+                writer.write(b'{"id": null, "ok": false, '
+                             b'"error": "a linha excede o tamanho m\\u00e1ximo."}\n')
+                break
+
+            if not line:
+                break
+            if line.isspace():
+                continue
+
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError
+            except (ValueError, RecursionError):
+                response = {'id': None, 'ok': False,
+                            'error': 'a requisição não é um objeto JSON válido.'}
+            else:
+                try:
+                    response = handle(request)
+                except Exception: # a bug must not drop the requests pipelined behind it
+                    response = {'id': request.get('id', None), 'ok': False,
+                                'error': INTERNAL_ERROR}
+
+            writer.write(json.dumps(response).encode() + b'\n')
+
+            if transport.get_write_buffer_size() > HIGH_WATER_MARK:
+                await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+async def start_server(service: BankingService, host: str = DEFAULT_HOST,
+                       port: int = DEFAULT_PORT) -> asyncio.Server:
+    """
+    Starts serving the given service; `port=0` picks a free port (see
+    `server.sockets[0].getsockname()`).
+    """
+    return await asyncio.start_server(
+        lambda reader, writer: handle_connection(service, reader, writer),
+        host, port, limit=MAX_LINE_SIZE)
+
+async def serve(host: str, port: int, journal_path: str | None = None):
+    """Runs the server until it's cancelled (e.g. by Ctrl+C)"""
+    journal = Journal(journal_path) if journal_path is not None else None
+
+    try:
+        server = await start_server(BankingService(journal), host, port)
+        print(f'Servidor ouvindo em {host}:{server.sockets[0].getsockname()[1]}')
+
+        async with server:
+            await server.serve_forever()
+    finally:
+        if journal is not None:
+            journal.close()
+
+def main(argv: list[str] | None = None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description='Servidor JSON lines das operações bancárias.')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--journal', help='diário onde as operações são gravadas')
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.journal))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,399 @@
+"""
+This module contains the SQLite storage engine: user, account and
+statement databases (see `storage`) kept in a local SQLite file, for
+deployments whose data doesn't fit in memory.
+
+The database runs in WAL mode, so readers don't block the writer, and
+connections come from a small pool (`ConnectionPool`), so threads can
+share it. Every query is a constant SQL string, so `sqlite3` reuses its
+prepared statement from the connection's statement cache, and the bulk
+paths (`extend`, `register_many`, `extend_cents`) insert with a single
+`executemany` per call.
+
+Indexes: users by CPF (primary key), UF and city; accounts by ID
+(primary key) and owner; statements by account and sequence.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import datetime
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator
+
+from journal import OPERATION_CODES, OPERATION_TYPES
+from storage import (UserStorage, AccountStorage, StatementStorage,
+                     USER_COLUMNS, ACCOUNT_COLUMNS)
+
+STATEMENT_CACHE_SIZE = 128
+PAGE_SIZE = 1000 # rows read at a time when iterating over a table
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    cpf TEXT PRIMARY KEY,
+    name TEXT,
+    birth_date TEXT,
+    house_number TEXT,
+    address TEXT,
+    neighbourhood TEXT,
+    city TEXT,
+    state_uf TEXT,
+    full_address TEXT
+);
+CREATE INDEX IF NOT EXISTS users_state_uf ON users (state_uf);
+CREATE INDEX IF NOT EXISTS users_city ON users (city);
+
+CREATE TABLE IF NOT EXISTS accounts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    agency TEXT NOT NULL,
+    user TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS accounts_user ON accounts (user);
+
+CREATE TABLE IF NOT EXISTS statements (
+    seq INTEGER PRIMARY KEY,
+    acc_id INTEGER NOT NULL,
+    operation_code INTEGER NOT NULL,
+    value_cents INTEGER NOT NULL,
+    balance_cents INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS statements_acc_id ON statements (acc_id, seq);
+"""
+
+USER_FIELDS = ', '.join(USER_COLUMNS)
+ACCOUNT_FIELDS = ', '.join(ACCOUNT_COLUMNS)
+
+INSERT_USER = f'INSERT INTO users ({USER_FIELDS}) VALUES ({", ".join("?" * len(USER_COLUMNS))})'
+SELECT_USERS = f'SELECT {USER_FIELDS} FROM users'
+SELECT_USERS_PAGE = (f'SELECT rowid, {USER_FIELDS} FROM users '
+                     'WHERE rowid > ? ORDER BY rowid LIMIT ?')
+
+class ConnectionPool:
+    """
+    A fixed number of connections to one SQLite file, handed out one
+    thread at a time. The schema is created on the first connection.
+
+    Params:
+    @path: the database file (`:memory:` can't be shared, so it isn't
+    accepted)
+    @size: maximum number of open connections
+    """
+
+    def __init__(self, path: str, size: int = 4):
+        if path == ':memory:' or size < 1:
+            raise ValueError('o pool precisa de um arquivo e de ao menos uma conexão.')
+
+        self.path = path
+        self.size = size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._opened: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+        with self.connection() as connection:
+            connection.executescript(SCHEMA)
+
+    def _open(self) -> sqlite3.Connection:
+        """Opens a connection in WAL mode"""
+        connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30,
+                                     cached_statements=STATEMENT_CACHE_SIZE)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute('PRAGMA foreign_keys=ON')
+        return connection
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Lends a connection, opening a new one while the pool isn't full,
+        or waiting for an idle one otherwise.
+        """
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = len(self._opened) < self.size
+                if can_open:
+                    connection = self._open()
+                    self._opened.append(connection)
+            if not can_open:
+                connection = self._idle.get()
+
+        try:
+            yield connection
+        finally:
+            if connection.in_transaction:
+                connection.rollback()
+            self._idle.put(connection)
+
+    def close(self):
+        """Closes every connection of the pool"""
+        with self._lock:
+            for connection in self._opened:
+                connection.close()
+            self._opened.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.close()
+
+def _user_row(user: dict[str, Any]) -> tuple:
+    """Converts a user dict to a row of the `users` table"""
+    birth_date = user.get('birth_date', None)
+    if isinstance(birth_date, datetime.date):
+        birth_date = birth_date.isoformat()
+
+    return (user.get('cpf', None), user.get('name', None), birth_date,
+            user.get('house_number', None), user.get('address', None),
+            user.get('neighbourhood', None), user.get('city', None),
+            user.get('state_uf', None), user.get('full_address', None))
+
+def _user_dict(row: tuple) -> dict[str, Any]:
+    """Converts a row of the `users` table back to a user dict"""
+    user = dict(zip(USER_COLUMNS, row))
+    if user['birth_date'] is not None:
+        user['birth_date'] = datetime.date.fromisoformat(user['birth_date'])
+    return user
+
+class SQLiteUserStore(UserStorage):
+    """
+    User database on SQLite. Reading returns new dicts, so editing a
+    returned user doesn't change the database.
+
+    Params:
+    @pool: the connection pool of the database
+    """
+
+    def __init__(self, pool: ConnectionPool):
+        self.pool = pool
+
+    def __len__(self) -> int:
+        with self.pool.connection() as connection:
+            return connection.execute('SELECT COUNT(*) FROM users').fetchone()[0]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """
+        Yields the users in insertion order, reading `PAGE_SIZE` of them
+        at a time, so neither the whole table is loaded nor a connection is
+        held while the caller goes through them
+        """
+        last_rowid = 0
+
+        while True:
+            with self.pool.connection() as connection:
+                rows = connection.execute(SELECT_USERS_PAGE, (last_rowid, PAGE_SIZE)).fetchall()
+
+            for row in rows:
+                yield _user_dict(row[1:])
+
+            if len(rows) < PAGE_SIZE:
+                return
+            last_rowid = rows[-1][0]
+
+    def append(self, value: dict[str, Any]):
+        self.extend((value,))
+
+    def extend(self, values: Iterable[dict[str, Any]]):
+        """Inserts many users in a single transaction; nothing is inserted on errors"""
+        with self.pool.connection() as connection:
+            try:
+                with connection:
+                    connection.executemany(INSERT_USER, map(_user_row, values))
+            except sqlite3.IntegrityError:
+                raise ValueError('um usuário com este CPF já existe na base de dados.') from None
+
+    def get(self, user_cpf: str) -> dict[str, Any] | None:
+        with self.pool.connection() as connection:
+            row = connection.execute(SELECT_USERS + ' WHERE cpf = ?', (user_cpf,)).fetchone()
+        return _user_dict(row) if row is not None else None
+
+    def has_cpf(self, user_cpf: str) -> bool:
+        with self.pool.connection() as connection:
+            return connection.execute('SELECT 1 FROM users WHERE cpf = ?',
+                                      (user_cpf,)).fetchone() is not None
+
+    def find_by_state_uf(self, state_uf: str) -> list[dict[str, Any]]:
+        with self.pool.connection() as connection:
+            rows = connection.execute(SELECT_USERS + ' WHERE state_uf = ? ORDER BY rowid',
+                                      (state_uf,)).fetchall()
+        return [_user_dict(row) for row in rows]
+
+    def find_by_city(self, city: str) -> list[dict[str, Any]]:
+        with self.pool.connection() as connection:
+            rows = connection.execute(SELECT_USERS + ' WHERE city = ? ORDER BY rowid',
+                                      (city,)).fetchall()
+        return [_user_dict(row) for row in rows]
+
+    def remove(self, user_cpf: str):
+        """Removes the user with the given CPF"""
+        with self.pool.connection() as connection, connection:
+            if connection.execute('DELETE FROM users WHERE cpf = ?', (user_cpf,)).rowcount == 0:
+                raise ValueError('um usuário com este CPF não existe na base de dados.')
+
+class SQLiteAccountRegistry(AccountStorage):
+    """
+    Account database on SQLite. IDs come from an AUTOINCREMENT column, so,
+    like in the `AccountRegistry`, the ID of a removed account is never
+    handed out again.
+
+    Params:
+    @pool: the connection pool of the database
+    @start_id: first ID handed out, if no account was ever registered
+    """
+
+    def __init__(self, pool: ConnectionPool, start_id: int = 1):
+        self.pool = pool
+
+        with pool.connection() as connection, connection:
+            if self._last_id(connection) is None and start_id > 1:
+                connection.execute("INSERT INTO sqlite_sequence (name, seq) "
+                                   "VALUES ('accounts', ?)", (start_id - 1,))
+
+    @staticmethod
+    def _last_id(connection: sqlite3.Connection) -> int | None:
+        """Returns the last ID handed out, or `None` if none was"""
+        row = connection.execute("SELECT seq FROM sqlite_sequence "
+                                 "WHERE name = 'accounts'").fetchone()
+        return row[0] if row is not None else None
+
+    def __len__(self) -> int:
+        with self.pool.connection() as connection:
+            return connection.execute('SELECT COUNT(*) FROM accounts').fetchone()[0]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Yields the accounts in ID order, `PAGE_SIZE` at a time (see `SQLiteUserStore`)"""
+        last_id = 0
+
+        while True:
+            with self.pool.connection() as connection:
+                rows = connection.execute(f'SELECT {ACCOUNT_FIELDS} FROM accounts '
+                                          'WHERE id > ? ORDER BY id LIMIT ?',
+                                          (last_id, PAGE_SIZE)).fetchall()
+
+            for row in rows:
+                yield dict(zip(ACCOUNT_COLUMNS, row))
+
+            if len(rows) < PAGE_SIZE:
+                return
+            last_id = rows[-1][0]
+
+    @property
+    def next_id(self) -> int:
+        with self.pool.connection() as connection:
+            return (self._last_id(connection) or 0) + 1
+
+    def register(self, owner_cpf: str, agency_number: str = "0001") -> dict[str, Any]:
+        with self.pool.connection() as connection, connection:
+            cursor = connection.execute('INSERT INTO accounts (agency, user) VALUES (?, ?)',
+                                        (agency_number, owner_cpf))
+        return {"id": cursor.lastrowid, "agency": agency_number, "user": owner_cpf}
+
+    def register_many(self, owner_cpfs: Iterable[str],
+                      agency_number: str = "0001") -> list[dict[str, Any]]:
+        owner_cpfs = list(owner_cpfs)
+
+        with self.pool.connection() as connection, connection:
+            # the write lock is taken before the last ID is read, so no other
+            # connection can register accounts in between
+            connection.execute('BEGIN IMMEDIATE')
+            first_id = (self._last_id(connection) or 0) + 1
+            connection.executemany('INSERT INTO accounts (agency, user) VALUES (?, ?)',
+                                   ((agency_number, owner_cpf) for owner_cpf in owner_cpfs))
+
+        return [{"id": acc_id, "agency": agency_number, "user": owner_cpf}
+                for acc_id, owner_cpf in enumerate(owner_cpfs, start=first_id)]
+
+    def get(self, acc_id: int) -> dict[str, Any] | None:
+        with self.pool.connection() as connection:
+            row = connection.execute(f'SELECT {ACCOUNT_FIELDS} FROM accounts WHERE id = ?',
+                                     (acc_id,)).fetchone()
+        return dict(zip(ACCOUNT_COLUMNS, row)) if row is not None else None
+
+    def find_by_owner(self, owner_cpf: str) -> list[dict[str, Any]]:
+        with self.pool.connection() as connection:
+            rows = connection.execute(f'SELECT {ACCOUNT_FIELDS} FROM accounts '
+                                      'WHERE user = ? ORDER BY id', (owner_cpf,)).fetchall()
+        return [dict(zip(ACCOUNT_COLUMNS, row)) for row in rows]
+
+    def remove(self, acc_id: int) -> dict[str, Any]:
+        account = self.get(acc_id)
+
+        if account is None:
+            raise ValueError(f'a conta de ID {acc_id} não existe.')
+
+        with self.pool.connection() as connection, connection:
+            connection.execute('DELETE FROM accounts WHERE id = ?', (acc_id,))
+
+        return account
+
+class SQLiteStatement(StatementStorage):
+    """
+    One account's statement on SQLite, with amounts in integer cents.
+
+    Params:
+    @pool: the connection pool of the database
+    @acc_id: the account's ID
+    """
+
+    def __init__(self, pool: ConnectionPool, acc_id: int):
+        self.pool = pool
+        self.acc_id = acc_id
+
+    def __len__(self) -> int:
+        with self.pool.connection() as connection:
+            return connection.execute('SELECT COUNT(*) FROM statements WHERE acc_id = ?',
+                                      (self.acc_id,)).fetchone()[0]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Yields the operations in order, `PAGE_SIZE` at a time (see `SQLiteUserStore`)"""
+        last_seq = 0
+
+        while True:
+            with self.pool.connection() as connection:
+                rows = connection.execute('SELECT seq, operation_code, value_cents, '
+                                          'balance_cents FROM statements '
+                                          'WHERE acc_id = ? AND seq > ? ORDER BY seq LIMIT ?',
+                                          (self.acc_id, last_seq, PAGE_SIZE)).fetchall()
+
+            for _, op_code, value, balance in rows:
+                yield {'operation_type': OPERATION_TYPES[op_code],
+                       'value': value / 100,
+                       'saldo_after_operation': balance / 100}
+
+            if len(rows) < PAGE_SIZE:
+                return
+            last_seq = rows[-1][0]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, StatementStorage)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def append(self, operation: dict[str, Any]):
+        self.append_cents(operation['operation_type'],
+                          round(operation['value'] * 100),
+                          round(operation['saldo_after_operation'] * 100))
+
+    def append_cents(self, operation_type: str, value_cents: int, balance_cents: int):
+        self.extend_cents(((operation_type, value_cents, balance_cents),))
+
+    def extend_cents(self, operations: Iterable[tuple[str, int, int]]):
+        """
+        Appends many (operation type, value, balance) operations, in
+        cents, in a single transaction.
+        """
+        rows = []
+
+        for operation_type, value_cents, balance_cents in operations:
+            op_code = OPERATION_CODES.get(operation_type)
+            if op_code is None:
+                raise ValueError('o tipo de operação é inválido.')
+            rows.append((self.acc_id, op_code, value_cents, balance_cents))
+
+        with self.pool.connection() as connection, connection:
+            connection.executemany('INSERT INTO statements (acc_id, operation_code, '
+                                   'value_cents, balance_cents) VALUES (?, ?, ?, ?)', rows)
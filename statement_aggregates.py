@@ -0,0 +1,227 @@
+"""
+This module contains the `AggregatedStatement`, a `CompactStatement`
+that keeps its aggregates up to date as operations are appended, so
+questions such as "how much was deposited this month?" or "what was the
+balance at a given moment?" don't walk the whole statement.
+
+On each append, it updates:
+- the running total and count of each operation type;
+- the lowest and highest balance;
+- the time of the operation (kept in order, so it can be bisected);
+- every `checkpoint_interval` operations, a checkpoint with the total of
+  each operation type so far.
+
+The total of any range of operations is then the difference of two
+prefix totals, each one a checkpoint plus at most `checkpoint_interval`
+values, and the balance at a moment is a bisection over the times.
+
+`deposit_money`, `withdraw_money` and `add_to_statement` append through
+`append_cents`, so they keep the aggregates current when given an
+`AggregatedStatement`; so does a `ledger.Ledger` created with
+`statement_class=AggregatedStatement`, including the operations merged
+by `merge_account` and those read back by `load_journal`.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import datetime
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Iterable
+
+from compact_statement import CompactStatement
+from journal import OPERATION_CODES
+from statement_reader import to_timestamp
+
+CHECKPOINT_INTERVAL = 64 # operations between prefix-total checkpoints
+
+Moment = datetime.date | datetime.datetime | float
+
+class AggregatedStatement(CompactStatement):
+    """
+    Array-backed account statement with incrementally maintained
+    aggregates.
+
+    Params:
+    @operations: optional iterable of statement dicts to load
+    @checkpoint_interval: operations between prefix-total checkpoints
+    @clock: returns the current time, used as the time of the operations
+    appended without one
+    """
+
+    def __init__(self, operations: Iterable[dict[str, Any]] = (),
+                 checkpoint_interval: int = CHECKPOINT_INTERVAL,
+                 clock: Callable[[], float] = time.time):
+        if checkpoint_interval < 1:
+            raise ValueError('o intervalo entre checkpoints deve ser positivo.')
+
+        self.checkpoint_interval = checkpoint_interval
+        self.clock = clock
+        self.timestamps = array('d')
+        self.totals = dict.fromkeys(OPERATION_CODES.values(), 0)
+        self.counts = dict.fromkeys(OPERATION_CODES.values(), 0)
+        # prefix[code][i]: total of the operations of `code` among the
+        # first i * checkpoint_interval operations
+        self.prefix = {code: array('q', [0]) for code in OPERATION_CODES.values()}
+        self._min_balance = None
+        self._max_balance = None
+
+        super().__init__(operations)
+
+    def append_cents(self, operation_type: str, value_cents: int, balance_cents: int,
+                     timestamp: float | None = None):
+        """
+        Appends an operation with its amounts already in cents.
+
+        Params:
+        @operation_type: must be either 'withdrawal' or 'deposit'
+        @value_cents: the amount of money used in the operation, in cents
+        @balance_cents: the account's balance after the operation, in cents
+        @timestamp: when the operation happened (defaults to now)
+        """
+        self.append_code(self._code(operation_type), value_cents, balance_cents, timestamp)
+
+    def append_code(self, op_code: int, value_cents: int, balance_cents: int,
+                    timestamp: float | None = None):
+        """
+        Appends an operation given by its code and updates the aggregates.
+        Times earlier than the last operation's are moved up to it, so the
+        times stay sorted.
+        """
+        timestamps = self.timestamps
+
+        if timestamp is None:
+            timestamp = self.clock()
+        if timestamps and timestamp < timestamps[-1]:
+            timestamp = timestamps[-1]
+
+        self.op_codes.append(op_code)
+        self.values.append(value_cents)
+        self.balances.append(balance_cents)
+        timestamps.append(timestamp)
+
+        self.totals[op_code] += value_cents
+        self.counts[op_code] += 1
+
+        if self._min_balance is None:
+            self._min_balance = self._max_balance = balance_cents
+        elif balance_cents < self._min_balance:
+            self._min_balance = balance_cents
+        elif balance_cents > self._max_balance:
+            self._max_balance = balance_cents
+
+        if len(timestamps) % self.checkpoint_interval == 0:
+            for code, total in self.totals.items():
+                self.prefix[code].append(total)
+
+    def extend_statement(self, statement: CompactStatement):
+        """
+        Appends every operation of another statement, in order, updating
+        the aggregates; the other statement's times are kept if it has
+        them, otherwise the operations get the current time.
+        """
+        timestamps = getattr(statement, 'timestamps', None)
+
+        for position in range(len(statement)):
+            self.append_code(statement.op_codes[position], statement.values[position],
+                             statement.balances[position],
+                             None if timestamps is None else timestamps[position])
+
+    def _code(self, operation_type: str) -> int:
+        """Returns the code of the operation type, refusing unknown ones"""
+        op_code = OPERATION_CODES.get(operation_type)
+
+        if op_code is None:
+            raise ValueError('o tipo de operação é inválido.')
+
+        return op_code
+
+    def _prefix_total(self, op_code: int, position: int) -> int:
+        """Returns the total of the operations of `op_code` before `position`"""
+        checkpoint = position // self.checkpoint_interval
+        total = self.prefix[op_code][checkpoint]
+
+        for index in range(checkpoint * self.checkpoint_interval, position):
+            if self.op_codes[index] == op_code:
+                total += self.values[index]
+
+        return total
+
+    def total(self, operation_type: str, start: int | None = None,
+              end: int | None = None) -> int:
+        """
+        Returns the sum, in cents, of the operations of the given type,
+        among the operations in positions [`start`, `end`) (every
+        operation by default).
+        """
+        op_code = self._code(operation_type)
+
+        if start is None and end is None:
+            return self.totals[op_code]
+
+        start, end, _ = slice(start, end).indices(len(self))
+
+        if end <= start:
+            return 0
+
+        return self._prefix_total(op_code, end) - self._prefix_total(op_code, start)
+
+    def count(self, operation_type: str) -> int:
+        """Returns how many operations of the given type the statement has"""
+        return self.counts[self._code(operation_type)]
+
+    def positions_between(self, since: Moment | None = None,
+                          until: Moment | None = None) -> range:
+        """
+        Returns the positions of the operations made in [`since`, `until`).
+        Dates count from midnight, local time.
+        """
+        start = 0 if since is None else bisect_left(self.timestamps, to_timestamp(since))
+        end = (len(self) if until is None
+               else bisect_left(self.timestamps, to_timestamp(until), start))
+        return range(start, end)
+
+    def total_between(self, operation_type: str, since: Moment | None = None,
+                      until: Moment | None = None) -> int:
+        """
+        Returns the sum, in cents, of the operations of the given type made
+        in [`since`, `until`), e.g. the deposits of a month.
+        """
+        positions = self.positions_between(since, until)
+        return self.total(operation_type, positions.start, positions.stop)
+
+    def opening_balance(self) -> int:
+        """Returns the balance, in cents, before the first operation"""
+        if len(self) == 0:
+            return 0
+
+        if self.op_codes[0] == OPERATION_CODES['deposit']:
+            return self.balances[0] - self.values[0]
+        return self.balances[0] + self.values[0]
+
+    def balance_after(self, position: int) -> int:
+        """Returns the balance, in cents, right after the operation in `position`"""
+        return self.balances[position]
+
+    def balance_at(self, moment: Moment) -> int:
+        """
+        Returns the balance, in cents, at the given moment: the balance
+        after the last operation made up to it.
+        """
+        position = bisect_right(self.timestamps, to_timestamp(moment))
+
+        if position == 0:
+            return self.opening_balance()
+        return self.balances[position - 1]
+
+    def min_balance(self) -> int | None:
+        return self._min_balance
+
+    def max_balance(self) -> int | None:
+        return self._max_balance
+
+    def __sizeof__(self) -> int:
+        return (super().__sizeof__() + self.timestamps.__sizeof__()
+                + sum(prefix.__sizeof__() for prefix in self.prefix.values()))
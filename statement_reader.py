@@ -0,0 +1,246 @@
+"""
+This module contains the `StatementReader`, which reads an account's
+statement straight from the transaction journal (see `journal`) through
+`mmap`, instead of keeping every operation in memory.
+
+Journal records have a fixed width, so the N-th record is found by
+arithmetic. To read a single account, a compact offset index (one
+integer per operation of that account) is built on first use. Records
+can then be fetched by position, paged, filtered by sequence number or
+date, and streamed as formatted lines.
+
+A reader sees the journal as it was when opened; `refresh` maps the
+records appended since then, scanning only those for the index, so a
+long-lived reader stays current at the cost of the new records alone.
+`print_statement_from_journal` keeps one such reader per account.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import datetime
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from bisect import bisect_left
+from typing import Iterator, Sequence
+
+from renderers import format_statement_entry
+from journal import JOURNAL_MAGIC, RECORD, RECORD_BODY, OPERATION_TYPES, JournalRecord
+
+_ACC_ID = struct.Struct('<I')
+
+def to_timestamp(moment: datetime.date | datetime.datetime | float) -> float:
+    """Converts a date (midnight, local time) or datetime to an epoch timestamp"""
+    if isinstance(moment, datetime.datetime):
+        return moment.timestamp()
+    if isinstance(moment, datetime.date):
+        return datetime.datetime.combine(moment, datetime.time()).timestamp()
+    return float(moment)
+
+class StatementReader:
+    """
+    Random-access, read-only view of the operations in a journal file.
+
+    Params:
+    @path: the journal file
+    @acc_id: if given, only this account's operations are read
+    """
+
+    def __init__(self, path: str, acc_id: int | None = None):
+        self.path = path
+        self.acc_id = acc_id
+        self._index: array | None = None
+        self._mm = None
+        self._count = 0
+
+        self.refresh()
+
+    def refresh(self):
+        """
+        Maps the records appended to the journal since the reader was
+        opened or last refreshed; the account's index, if built, is
+        extended with those records only. A journal that shrank (e.g.
+        truncated by `journal.recover`) is indexed again from the start.
+        """
+        with open(self.path, 'rb') as journal_file:
+            size = os.fstat(journal_file.fileno()).st_size
+            count = max(0, (size - len(JOURNAL_MAGIC)) // RECORD.size)
+            if count == self._count and self._mm is not None:
+                return
+
+            mm = None
+            if size > len(JOURNAL_MAGIC):
+                mm = mmap.mmap(journal_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if mm is not None and mm[:len(JOURNAL_MAGIC)] != JOURNAL_MAGIC:
+            mm.close()
+            self.close()
+            raise ValueError(f'o arquivo {self.path} não é um journal válido.')
+
+        self.close()
+        self._mm = mm
+
+        if count < self._count:
+            self._index = None
+        elif self._index is not None:
+            self._index_records(self._count, count)
+
+        self._count = count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.close()
+
+    def close(self):
+        """Unmaps the journal file"""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def _read(self, position: int) -> JournalRecord:
+        """Reads the record stored at the given position of the journal"""
+        offset = len(JOURNAL_MAGIC) + position * RECORD.size
+        seq, timestamp, acc_id, op_code, value, balance, crc = RECORD.unpack_from(self._mm, offset)
+
+        if zlib.crc32(self._mm[offset:offset + RECORD_BODY.size]) != crc:
+            raise ValueError(f'o registro {position} do journal está corrompido.')
+
+        return JournalRecord(seq, timestamp, acc_id, OPERATION_TYPES.get(op_code, 'N/A'),
+                             value, balance)
+
+    def _index_records(self, start: int, end: int):
+        """Adds the account's records among the positions [`start`, `end`) to the index"""
+        index = self._index
+        acc_id_offset = len(JOURNAL_MAGIC) + start * RECORD.size + 16 # after seq and timestamp
+        unpack_acc_id = _ACC_ID.unpack_from
+
+        for position in range(start, end):
+            if unpack_acc_id(self._mm, acc_id_offset)[0] == self.acc_id:
+                index.append(position)
+            acc_id_offset += RECORD.size
+
+    def _positions(self) -> Sequence[int]:
+        """
+        Returns the journal positions of the records being read: every
+        position, or the account's offset index (built once, lazily).
+        """
+        if self.acc_id is None:
+            return range(self._count)
+
+        if self._index is None:
+            self._index = array('Q')
+            self._index_records(0, self._count)
+
+        return self._index
+
+    def __len__(self) -> int:
+        return len(self._positions())
+
+    def __getitem__(self, item: int) -> JournalRecord:
+        return self._read(self._positions()[item])
+
+    def page(self, page: int = 1, page_size: int = 20) -> list[JournalRecord]:
+        """
+        Returns one page of the statement.
+
+        Params:
+        @page: the page number, starting at 1
+        @page_size: the number of operations per page
+        """
+        if page < 1 or page_size < 1:
+            raise ValueError('a página e o tamanho da página devem ser maiores que zero.')
+
+        positions = self._positions()
+        start = (page - 1) * page_size
+
+        return [self._read(position) for position in positions[start:start + page_size]]
+
+    def iter_records(self, start_seq: int | None = None, end_seq: int | None = None,
+                     since: datetime.date | datetime.datetime | float | None = None,
+                     until: datetime.date | datetime.datetime | float | None = None
+                     ) -> Iterator[JournalRecord]:
+        """
+        Yields the operations in order, optionally restricted to a range of
+        sequence numbers and/or dates. Both ranges are found by binary search,
+        since sequence numbers and timestamps grow along the journal.
+
+        Params:
+        @start_seq: first sequence number (inclusive)
+        @end_seq: last sequence number (exclusive)
+        @since: first date/datetime/timestamp (inclusive)
+        @until: last date/datetime/timestamp (exclusive)
+        """
+        positions = self._positions()
+        low, high = 0, len(positions)
+
+        def seq_at(position):
+            return self._read(position).seq
+
+        def timestamp_at(position):
+            return self._read(position).timestamp
+
+        if start_seq is not None:
+            low = bisect_left(positions, start_seq, low, high, key=seq_at)
+        if end_seq is not None:
+            high = bisect_left(positions, end_seq, low, high, key=seq_at)
+        if since is not None:
+            low = bisect_left(positions, to_timestamp(since), low, high, key=timestamp_at)
+        if until is not None:
+            high = bisect_left(positions, to_timestamp(until), low, high, key=timestamp_at)
+
+        for item in range(low, high):
+            yield self._read(positions[item])
+
+    def stream_statement(self, **filters) -> Iterator[str]:
+        """
+        Yields each operation formatted like `print_statement`. Accepts the
+        same filters as `iter_records`.
+        """
+        for record in self.iter_records(**filters):
+            yield format_statement_entry(record.operation_type, record.value_cents / 100,
+                                         record.balance_cents / 100)
+
+# readers kept open by `print_statement_from_journal`, by (journal, account)
+_readers: dict[tuple[str, int | None], StatementReader] = {}
+
+def print_statement_from_journal(path: str, acc_id: int | None = None, **filters):
+    """
+    Prints the account's statement on the terminal, one operation at a time,
+    reading it from the journal. The account's reader (and its index) is
+    kept between calls and only refreshed, see `close_statement_readers`.
+
+    Params:
+    @path: the journal file
+    @acc_id: the account's ID
+    """
+    if not os.path.exists(path):
+        print('Nenhuma operação feita até o momento')
+        return
+
+    key = (os.path.abspath(path), acc_id)
+    reader = _readers.get(key)
+
+    if reader is None:
+        reader = _readers[key] = StatementReader(path, acc_id)
+    else:
+        reader.refresh()
+
+    printed = False
+
+    for line in reader.stream_statement(**filters):
+        print(line)
+        printed = True
+
+    if not printed:
+        print('Nenhuma operação feita até o momento')
+
+def close_statement_readers():
+    """Closes the readers kept by `print_statement_from_journal`"""
+    for reader in _readers.values():
+        reader.close()
+    _readers.clear()
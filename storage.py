@@ -0,0 +1,118 @@
+"""
+This module contains the storage interfaces of the bank: the abstract
+user, account and statement databases.
+
+The app's functions (`users.find_user_in_database`,
+`account.open_account`, `banking_methods.add_to_statement`...) check
+these interfaces, instead of a concrete class, to know that a database
+has indexed lookups, so the in-memory stores (`UserStore`,
+`AccountRegistry`, `CompactStatement`) and the SQLite ones
+(`sqlite_storage`) can be used interchangeably.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Iterator
+
+# the fields of the user and account dicts (see `users.make_user` and
+# `AccountRegistry.register`)
+USER_COLUMNS = ('cpf', 'name', 'birth_date', 'house_number', 'address',
+                'neighbourhood', 'city', 'state_uf', 'full_address')
+ACCOUNT_COLUMNS = ('id', 'agency', 'user')
+
+class UserStorage(ABC):
+    """User database indexed by CPF"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def append(self, value: dict[str, Any]):
+        """Inserts a user, refusing repeated CPFs with `ValueError`"""
+
+    def extend(self, values: Iterable[dict[str, Any]]):
+        """Inserts many users; databases may batch the insertion"""
+        for value in values:
+            self.append(value)
+
+    @abstractmethod
+    def get(self, user_cpf: str) -> dict[str, Any] | None:
+        """Returns the user with the given CPF (numbers only), or `None`"""
+
+    @abstractmethod
+    def has_cpf(self, user_cpf: str) -> bool:
+        """Checks if a user with the given CPF (numbers only) exists"""
+
+    @abstractmethod
+    def find_by_state_uf(self, state_uf: str) -> list[dict[str, Any]]:
+        """Returns every user living in the given state UF"""
+
+    @abstractmethod
+    def find_by_city(self, city: str) -> list[dict[str, Any]]:
+        """Returns every user living in the given city"""
+
+class AccountStorage(ABC):
+    """Account database handing out collision-free IDs"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        ...
+
+    @property
+    @abstractmethod
+    def next_id(self) -> int:
+        """The ID that the next registered account will receive"""
+
+    @abstractmethod
+    def register(self, owner_cpf: str, agency_number: str = "0001") -> dict[str, Any]:
+        """Creates a new account for the given owner and returns it"""
+
+    @abstractmethod
+    def register_many(self, owner_cpfs: list[str],
+                      agency_number: str = "0001") -> list[dict[str, Any]]:
+        """Creates one account per CPF, in order, and returns them"""
+
+    @abstractmethod
+    def get(self, acc_id: int) -> dict[str, Any] | None:
+        """Returns the account with the given ID, or `None`"""
+
+    @abstractmethod
+    def find_by_owner(self, owner_cpf: str) -> list[dict[str, Any]]:
+        """Returns every account owned by the given CPF, in ID order"""
+
+    @abstractmethod
+    def remove(self, acc_id: int) -> dict[str, Any]:
+        """Removes the account with the given ID and returns it"""
+
+class StatementStorage(ABC):
+    """
+    An account's statement. Reading it yields the statement dicts
+    (`operation_type`, `value` and `saldo_after_operation`, in reais).
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def append(self, operation: dict[str, Any]):
+        """Appends an operation given as a statement dict (values in reais)"""
+
+    @abstractmethod
+    def append_cents(self, operation_type: str, value_cents: int, balance_cents: int):
+        """Appends an operation with its amounts already in cents"""
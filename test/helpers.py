@@ -0,0 +1,27 @@
+"""
+Helpers shared by the tests.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import datetime
+
+def make_user(cpf: int | str, city: str = 'Recife', state_uf: str = 'PE') -> dict:
+    """
+    Builds a user like `users.create_user` does. The CPF's number also
+    numbers the user's name, house and birth date, so different CPFs give
+    different users.
+
+    Params:
+    @cpf: the CPF without punctuation, or its number (zero-padded to 11 digits)
+    @city: the user's city
+    @state_uf: the user's state UF
+    """
+    number = int(cpf)
+
+    return {'cpf': f'{number:011d}', 'name': f'Usuário {number}',
+            'birth_date': datetime.date(1990, 1, 1) + datetime.timedelta(days=number % 10000),
+            'house_number': str(number), 'address': 'Rua A', 'neighbourhood': 'Centro',
+            'city': city, 'state_uf': state_uf,
+            'full_address': f'Rua A - {number} - Centro - {city}/{state_uf}'}
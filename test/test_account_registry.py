@@ -0,0 +1,94 @@
+"""
+Tests for the indexed account database (`account_registry` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from account_registry import AccountRegistry
+from account import register_account
+from user_store import UserStore
+
+class TestAccountRegistry(unittest.TestCase):
+    """Tests the `AccountRegistry` ID sequence and indexes"""
+
+    def test_ids_never_collide(self):
+        """Removing an account must not make its ID available again"""
+        registry = AccountRegistry()
+        first = registry.register('52998224725')
+        second = registry.register('11144477735')
+
+        registry.remove(first['id'])
+        third = registry.register('52998224725')
+
+        self.assertEqual([first['id'], second['id'], third['id']], [1, 2, 3])
+        self.assertEqual([acc['id'] for acc in registry], [2, 3])
+        self.assertIsNone(registry.get(1))
+
+    def test_owner_index(self):
+        """Accounts can be fetched by the owner's CPF"""
+        registry = AccountRegistry()
+        created = registry.register_many(['52998224725', '11144477735', '52998224725'])
+
+        self.assertEqual([acc['id'] for acc in created], [1, 2, 3])
+        self.assertEqual([acc['id'] for acc in registry.find_by_owner('52998224725')],
+                         [1, 3])
+        self.assertEqual(registry.find_by_owner('00000000000'), [])
+
+        registry.remove(2)
+        self.assertEqual(registry.find_by_owner('11144477735'), [])
+        self.assertEqual(registry.next_id, 4)
+
+    def test_load_existing_accounts(self):
+        """The sequence continues after the highest loaded ID"""
+        registry = AccountRegistry([
+            {'id': 7, 'agency': '0001', 'user': '52998224725'},
+        ])
+
+        self.assertEqual(registry.register('52998224725')['id'], 8)
+
+        with self.assertRaises(ValueError):
+            AccountRegistry([{'id': 1, 'user': 'a'}, {'id': 1, 'user': 'b'}])
+
+    def test_id_order(self):
+        """Accounts loaded out of order are still read in ID order"""
+        registry = AccountRegistry([
+            {'id': 5, 'agency': '0001', 'user': '52998224725'},
+            {'id': 2, 'agency': '0001', 'user': '52998224725'},
+        ])
+        registry.register('11144477735')
+        registry.load([{'id': 4, 'agency': '0001', 'user': '11144477735'},
+                       {'id': 1, 'agency': '0001', 'user': '52998224725'}])
+
+        self.assertEqual([acc['id'] for acc in registry], [1, 2, 4, 5, 6])
+        self.assertEqual([acc['id'] for acc in registry.find_by_owner('52998224725')],
+                         [1, 2, 5])
+        self.assertEqual([acc['id'] for acc in registry.find_by_owner('11144477735')],
+                         [4, 6])
+
+    @patch('builtins.print')
+    @patch('builtins.input', return_value='529.982.247-25')
+    def test_register_account(self, _mock_input, _mock_print):
+        """`register_account` allocates the ID through the registry"""
+        users = UserStore([{'cpf': '52998224725', 'name': 'Maria'}])
+        registry = AccountRegistry()
+
+        register_account(users, registry)
+        registry.remove(1)
+        register_account(users, registry)
+
+        self.assertEqual([acc['id'] for acc in registry], [2])
+
+if __name__ == '__main__':
+    unittest.main()
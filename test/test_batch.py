@@ -0,0 +1,153 @@
+"""
+Tests for the batch settlement (`batch` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import csv
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from batch import settle_file, settle_file_sharded
+from journal import Journal, read_records
+from ledger import Ledger
+
+OPERATIONS = [
+    {'acc_id': 1, 'operation_type': 'deposit', 'value': '1000,50'},
+    {'acc_id': 1, 'operation_type': 'withdrawal', 'value': '600'},
+    {'acc_id': 1, 'operation_type': 'withdrawal', 'value': '600'},
+    {'acc_id': 2, 'operation_type': 'deposit', 'value': '0'},
+    {'acc_id': 2, 'operation_type': 'transfer', 'value': '10'},
+    {'acc_id': 'x', 'operation_type': 'deposit', 'value': '10'},
+    {'acc_id': 3, 'operation_type': 'deposit', 'value': '10'},
+]
+
+class TestBatch(unittest.TestCase):
+    """Tests settling CSV and JSONL batch files"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.ledger = Ledger()
+        self.ledger.open_account(1)
+        self.ledger.open_account(2)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_batch(self, extension: str) -> str:
+        """Writes `OPERATIONS` to a batch file with the given extension"""
+        path = os.path.join(self.tmp_dir.name, f'batch.{extension}')
+
+        with open(path, 'w', encoding='utf-8', newline='') as batch_file:
+            if extension == 'jsonl':
+                for operation in OPERATIONS:
+                    batch_file.write(json.dumps(operation) + '\n')
+            else:
+                writer = csv.DictWriter(batch_file, ['acc_id', 'operation_type', 'value'])
+                writer.writeheader()
+                writer.writerows(OPERATIONS)
+
+        return path
+
+    def test_csv_and_jsonl(self):
+        """Both formats produce the same balances and counters"""
+        for extension in ('csv', 'jsonl'):
+            ledger = Ledger()
+            ledger.open_account(1)
+            ledger.open_account(2)
+
+            report = settle_file(self.write_batch(extension), ledger, chunk_size=2)
+
+            self.assertEqual((report.accepted, report.rejected), (2, 5), extension)
+            self.assertEqual(ledger.balances(), {1: 40050, 2: 0})
+            self.assertEqual(report.rejections['o tipo de operação é inválido.'], 1)
+
+    def test_results_file(self):
+        """Every operation gets a result row, in input order"""
+        results_path = os.path.join(self.tmp_dir.name, 'results.csv')
+
+        settle_file(self.write_batch('csv'), self.ledger, results_path, chunk_size=3,
+                    open_accounts=True)
+
+        with open(results_path, encoding='utf-8', newline='') as results_file:
+            rows = list(csv.DictReader(results_file))
+
+        self.assertEqual([row['line'] for row in rows], [str(n) for n in range(2, 9)])
+        self.assertEqual([row['status'] for row in rows],
+                         ['accepted', 'accepted', 'rejected', 'rejected', 'rejected',
+                          'rejected', 'accepted'])
+        self.assertEqual(rows[1]['detail'], '400.50')
+        self.assertIn('insuficiente', rows[2]['detail'])
+        self.assertEqual(self.ledger.balance(3), 1000)
+
+    def test_invalid_operation_opens_no_account(self):
+        """An operation refused for its type doesn't open its account"""
+        path = os.path.join(self.tmp_dir.name, 'batch.csv')
+        with open(path, 'w', encoding='utf-8', newline='') as batch_file:
+            batch_file.write('acc_id,operation_type,value\n9,transfer,10\n')
+
+        report = settle_file(path, self.ledger, open_accounts=True)
+
+        self.assertEqual(report.rejected, 1)
+        self.assertNotIn(9, self.ledger)
+
+    def test_oversized_rows_are_rejected(self):
+        """IDs and amounts too large for the journal are rejected, not fatal"""
+        path = os.path.join(self.tmp_dir.name, 'batch.csv')
+        with open(path, 'w', encoding='utf-8', newline='') as batch_file:
+            batch_file.write('acc_id,operation_type,value\n'
+                             '5,deposit,99999999999999999999\n'
+                             f'{2 ** 32},deposit,10\n'
+                             '5,deposit,10\n')
+
+        with tempfile.TemporaryDirectory() as journal_dir:
+            with Journal(os.path.join(journal_dir, 'journal.bin'), 'close') as journal:
+                ledger = Ledger(journal)
+                report = settle_file(path, ledger, open_accounts=True)
+
+            self.assertEqual(len(list(read_records(journal.path))), 1)
+
+        self.assertEqual((report.accepted, report.rejected), (1, 2))
+        self.assertEqual(ledger.balances(), {5: 1000})
+
+    def test_sharded_matches_sequential(self):
+        """Sharded settlement gives the same balances, statements and results"""
+        batch_path = self.write_batch('csv')
+        outcomes = []
+
+        for workers in (None, 2, 3):
+            ledger = Ledger()
+            ledger.open_account(1)
+            ledger.open_account(2)
+            results_path = os.path.join(self.tmp_dir.name, f'results-{workers}.csv')
+
+            if workers is None:
+                report = settle_file(batch_path, ledger, results_path, chunk_size=2,
+                                     open_accounts=True)
+            else:
+                report = settle_file_sharded(batch_path, ledger, workers, results_path,
+                                             chunk_size=2, open_accounts=True)
+
+            with open(results_path, encoding='utf-8') as results_file:
+                results = results_file.read()
+
+            outcomes.append((report.accepted, report.rejected, report.rejections,
+                             ledger.balances(),
+                             {acc_id: ledger.statement(acc_id) for acc_id in ledger},
+                             results))
+
+        self.assertEqual(outcomes[0], outcomes[1])
+        self.assertEqual(outcomes[0], outcomes[2])
+
+if __name__ == '__main__':
+    unittest.main()
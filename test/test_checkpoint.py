@@ -0,0 +1,116 @@
+"""
+Tests for the snapshot and delta checkpoints (`checkpoint` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from checkpoint import Checkpoint
+from helpers import make_user
+
+class TestCheckpoint(unittest.TestCase):
+    """Tests saving and loading the user and account databases"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'checkpoint.bin')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def assert_same_state(self, checkpoint: Checkpoint):
+        """The checkpoint on disk loads back to the databases in memory"""
+        loaded = Checkpoint.load(self.path)
+
+        self.assertEqual(sorted(loaded.users, key=lambda user: user['cpf']),
+                         sorted(checkpoint.users, key=lambda user: user['cpf']))
+        self.assertEqual(sorted(loaded.accounts, key=lambda account: account['id']),
+                         sorted(checkpoint.accounts, key=lambda account: account['id']))
+        self.assertEqual(loaded.accounts.next_id, checkpoint.accounts.next_id)
+
+        return loaded
+
+    def test_missing_checkpoint(self):
+        """Without files, empty databases are loaded"""
+        checkpoint = Checkpoint.load(self.path, start_id=5)
+
+        self.assertEqual(len(checkpoint.users), 0)
+        self.assertEqual(checkpoint.accounts.next_id, 5)
+
+    def test_snapshot_and_deltas(self):
+        """Saves only write the changes, and loading applies them in order"""
+        checkpoint = Checkpoint(self.path)
+        checkpoint.users.extend(make_user(number) for number in range(100))
+        checkpoint.users.append({'cpf': '99999999999', 'name': 'Sem endereço'})
+        checkpoint.accounts.register_many(f'{number:011d}' for number in range(100))
+        checkpoint.compact()
+
+        checkpoint.users.append(make_user(100))
+        checkpoint.accounts.register('00000000100')
+        self.assertEqual(checkpoint.save(), 2)
+        self.assertEqual(checkpoint.save(), 0)
+
+        checkpoint.users[0] = {**make_user(0), 'name': 'Renomeado'}
+        del checkpoint.users[1]
+        checkpoint.accounts.remove(101)
+        self.assertEqual(checkpoint.save(), 3)
+
+        loaded = self.assert_same_state(checkpoint)
+        self.assertEqual(loaded.users.get('00000000000')['name'], 'Renomeado')
+        self.assertIsNone(loaded.users.get('00000000001'))
+        self.assertEqual(loaded.accounts.register('00000000100')['id'], 102)
+
+        # the loaded databases keep tracking changes
+        self.assertEqual(loaded.save(), 1)
+        loaded.compact()
+        self.assert_same_state(loaded)
+
+    def test_torn_delta(self):
+        """A torn delta frame is dropped, keeping the previous ones"""
+        checkpoint = Checkpoint(self.path)
+        checkpoint.users.append(make_user(1))
+        checkpoint.save()
+        checkpoint.users.append(make_user(2))
+        checkpoint.save()
+
+        with open(self.path + '.delta', 'r+b') as delta_file:
+            delta_file.truncate(os.path.getsize(self.path + '.delta') - 3)
+
+        loaded = Checkpoint.load(self.path)
+        self.assertEqual([user['cpf'] for user in loaded.users], ['00000000001'])
+
+        loaded.users.append(make_user(3))
+        loaded.save()
+        self.assertEqual(len(Checkpoint.load(self.path).users), 2)
+
+    def test_stale_delta(self):
+        """A delta log older than the snapshot isn't replayed"""
+        checkpoint = Checkpoint(self.path)
+        checkpoint.users.append(make_user(1))
+        checkpoint.save()
+
+        with open(self.path + '.delta', 'rb') as delta_file:
+            stale_delta = delta_file.read()
+
+        del checkpoint.users[0]
+        checkpoint.compact()
+
+        # crash between the new snapshot and the new delta log
+        with open(self.path + '.delta', 'wb') as delta_file:
+            delta_file.write(stale_delta)
+
+        self.assertEqual(len(Checkpoint.load(self.path).users), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Tests for the array-backed statement (`compact_statement` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+import compact_statement
+from compact_statement import CompactStatement
+from banking_methods import add_to_statement, deposit_money, withdraw_money
+
+class TestCompactStatement(unittest.TestCase):
+    """Tests the `CompactStatement` against the list of dicts it replaces"""
+
+    def test_list_compatibility(self):
+        """Operations read back as the same dicts `add_to_statement` builds"""
+        expected = []
+        statement = CompactStatement()
+
+        for operation in [('deposit', 500.0, 1500.0), ('withdrawal', 500.5, 999.5)]:
+            expected = add_to_statement(*operation, expected)
+            statement = add_to_statement(*operation, statement)
+
+        self.assertEqual(statement, expected)
+        self.assertEqual(len(statement), 2)
+        self.assertEqual(statement[-1], expected[-1])
+        self.assertEqual(statement[:1], expected[:1])
+        self.assertEqual(list(statement), expected)
+
+    @patch('builtins.print')
+    def test_banking_methods(self, _mock_print):
+        """Deposits and withdrawals can use the compact statement"""
+        balance, statement = deposit_money(0.0, 1000.0, CompactStatement())
+        balance, _, statement = withdraw_money(balance, 0, 600.0, statement)
+
+        self.assertEqual(balance, 400.0)
+        self.assertEqual(list(statement.balances), [100000, 40000])
+
+    def test_aggregates(self):
+        """Totals and min/max balance, with and without NumPy"""
+        statement = CompactStatement()
+        statement.append_cents('deposit', 100000, 100000)
+        statement.append_cents('withdrawal', 60000, 40000)
+        statement.append_cents('deposit', 5050, 45050)
+
+        for numpy_module in (compact_statement.np, None):
+            with patch.object(compact_statement, 'np', numpy_module):
+                self.assertEqual(statement.total('deposit'), 105050)
+                self.assertEqual(statement.total('withdrawal'), 60000)
+                self.assertEqual(statement.min_balance(), 40000)
+                self.assertEqual(statement.max_balance(), 100000)
+
+        self.assertIsNone(CompactStatement().min_balance())
+        self.assertEqual(CompactStatement().total('deposit'), 0)
+
+        with self.assertRaises(ValueError):
+            statement.append_cents('transfer', 1, 1)
+
+if __name__ == '__main__':
+    unittest.main()
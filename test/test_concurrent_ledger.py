@@ -0,0 +1,147 @@
+"""
+Stress test for the thread-safe ledger (`ledger.ConcurrentLedger`).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import random
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from banking_methods import LIMIT_OF_WITHDRAWALS
+from journal import Journal, read_records, replay_balances
+from ledger import ConcurrentLedger, WITHDRAWAL_CODE
+from limits import LimitsEngine, WithdrawalLimits
+
+HOT_ACCOUNTS = [1, 2]
+COLD_ACCOUNTS = list(range(3, 43))
+
+def hammer(ledger: ConcurrentLedger, seed: int, reset_ratio: float = 0.0,
+           operations: int = 2000):
+    """
+    Runs random operations, mostly on the hot accounts; `reset_ratio` of
+    them start a new day, zeroing the withdrawal counters.
+    """
+    rng = random.Random(seed)
+
+    for _ in range(operations):
+        if rng.random() < reset_ratio:
+            ledger.reset_daily_withdrawals()
+
+        if rng.random() < 0.8:
+            acc_id = rng.choice(HOT_ACCOUNTS)
+        else:
+            acc_id = rng.choice(COLD_ACCOUNTS)
+
+        try:
+            if rng.random() < 0.5:
+                ledger.deposit(acc_id, rng.randrange(1, 100000))
+            else:
+                ledger.withdraw(acc_id, rng.randrange(50000, 150000))
+        except ValueError:
+            pass
+
+class TestConcurrentLedger(unittest.TestCase):
+    """Hammers hot and cold accounts from a thread pool"""
+
+    def setUp(self):
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6) # force frequent thread switches
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def run_stress(self, reset_ratio: float) -> tuple:
+        """
+        Hammers a journaled ledger from 8 threads and returns the ledger
+        and the records read back from the journal.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'journal.bin')
+
+            with Journal(path, 'close') as journal:
+                ledger = ConcurrentLedger(journal, stripes=8)
+                for acc_id in HOT_ACCOUNTS + COLD_ACCOUNTS:
+                    ledger.open_account(acc_id)
+
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    list(pool.map(lambda seed: hammer(ledger, seed, reset_ratio), range(16)))
+
+            records = list(read_records(path))
+            journal_balances = replay_balances(path)
+
+        balances = ledger.balances()
+
+        self.assertEqual(balances, {**{acc_id: 0 for acc_id in balances},
+                                    **journal_balances})
+
+        replayed = {}
+        for record in records:
+            balance = replayed.get(record.acc_id, 0)
+            if record.operation_type == 'deposit':
+                balance += record.value_cents
+            else:
+                balance -= record.value_cents
+
+            # no lost update: each record starts from the previous balance
+            self.assertEqual(balance, record.balance_cents, f'record: {record}')
+            self.assertGreaterEqual(balance, 0)
+            replayed[record.acc_id] = balance
+
+        return ledger, records
+
+    def test_daily_limit_holds(self):
+        """No account goes over the daily withdrawal limit"""
+        ledger, records = self.run_stress(reset_ratio=0.0)
+
+        withdrawals = {}
+        for record in records:
+            if record.operation_type == 'withdrawal':
+                withdrawals[record.acc_id] = withdrawals.get(record.acc_id, 0) + 1
+
+        self.assertEqual(max(withdrawals.values()), LIMIT_OF_WITHDRAWALS)
+        for acc_id, count in withdrawals.items():
+            self.assertEqual(ledger.withdrawals(acc_id), count)
+
+    def test_balances_match_journal(self):
+        """With frequent new days, balances still match the journal"""
+        ledger, records = self.run_stress(reset_ratio=0.01)
+
+        withdrawn = sum(1 for record in records if record.operation_type == 'withdrawal')
+        self.assertGreater(withdrawn, LIMIT_OF_WITHDRAWALS * len(HOT_ACCOUNTS + COLD_ACCOUNTS))
+        self.assertEqual(ledger.statement(1).balances[-1], ledger.balance(1))
+
+    def test_limits_engine_holds(self):
+        """The `LimitsEngine`'s daily amount holds, and counts every withdrawal"""
+        limits = LimitsEngine(WithdrawalLimits(max_per_day=None, max_amount_per_day=50_000_000))
+        ledger = ConcurrentLedger(stripes=8, limits=limits)
+        for acc_id in HOT_ACCOUNTS + COLD_ACCOUNTS:
+            ledger.open_account(acc_id, 10 ** 9)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda seed: hammer(ledger, seed), range(16)))
+
+        for acc_id in HOT_ACCOUNTS + COLD_ACCOUNTS:
+            statement = ledger.statement(acc_id)
+            withdrawn = [value for op_code, value in zip(statement.op_codes, statement.values)
+                         if op_code == WITHDRAWAL_CODE]
+
+            self.assertLessEqual(sum(withdrawn), 50_000_000)
+            self.assertEqual(limits.amount_today(acc_id), sum(withdrawn))
+            self.assertEqual(ledger.withdrawals(acc_id), len(withdrawn))
+
+        # the hot accounts did reach the limit
+        self.assertGreater(limits.amount_today(HOT_ACCOUNTS[0]), 50_000_000 - 150000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Tests for the `cpf_validator` module.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import random
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+import cpf_validator
+from cpf_validator import (main as verify_cpf, validate_many, INVALID_DIGITS_REASON,
+                           verify_cpf_fast, verify_cpf_cached, verify_last_digits,
+                           verify_last_digits_fast)
+
+SAMPLE_CPFS = [
+    '529.982.247-25',   # valid
+    '111.444.777-35',   # valid
+    '529.982.247-26',   # wrong last digit
+    '529.982.247-15',   # wrong first check digit
+    '52998224725',      # no punctuation
+    '529.982.247-2',    # too short
+    '529.982.247-25a',  # invalid characters
+    '529 982 247-25',   # invalid characters
+    '',
+    12345678909,        # not a string
+]
+
+def expected_reason(user_cpf, validator=verify_cpf) -> str | None:
+    """Runs a scalar validator, returning the rejection reason"""
+    try:
+        return None if validator(user_cpf) else INVALID_DIGITS_REASON
+    except (TypeError, ValueError) as e:
+        return str(e)
+
+def random_cpf_like(rng: random.Random) -> str:
+    """Builds a random, mostly well-formed, CPF-like string"""
+    digits = ''.join(rng.choice('0123456789') for _ in range(11))
+    cpf = f'{digits[:3]}.{digits[3:6]}.{digits[6:9]}-{digits[9:]}'
+
+    match rng.randrange(6):
+        case 0:
+            position = rng.randrange(len(cpf))
+            cpf = cpf[:position] + rng.choice('x.-9 ١') + cpf[position + 1:]
+        case 1:
+            cpf = cpf[:rng.randrange(len(cpf))]
+        case 2:
+            cpf += rng.choice(['0', '-', 'a', '.', '00'])
+
+    return cpf
+
+class TestValidateMany(unittest.TestCase):
+    """Tests the batch CPF validation against the scalar `main`"""
+
+    def test_matches_scalar_validation(self):
+        """`validate_many` must agree with `main` for every CPF"""
+        expected = [expected_reason(cpf) for cpf in SAMPLE_CPFS]
+
+        self.assertEqual(validate_many(SAMPLE_CPFS, with_reasons=True), expected)
+        self.assertEqual(validate_many(SAMPLE_CPFS), [r is None for r in expected])
+
+    def test_pure_python_fallback(self):
+        """Without NumPy the results must be the same"""
+        expected = validate_many(SAMPLE_CPFS, with_reasons=True)
+
+        with patch.object(cpf_validator, 'np', None):
+            self.assertEqual(validate_many(SAMPLE_CPFS, with_reasons=True), expected)
+
+    def test_chunking(self):
+        """Batches larger than a chunk keep their order"""
+        cpfs = SAMPLE_CPFS * 5
+
+        with patch.object(cpf_validator, 'VALIDATION_CHUNK_SIZE', 3):
+            self.assertEqual(validate_many(cpfs), validate_many(SAMPLE_CPFS) * 5)
+
+class TestFastValidators(unittest.TestCase):
+    """Differential tests of the fast scalar validators against the originals"""
+
+    def test_verify_cpf_fast(self):
+        """`verify_cpf_fast` returns or raises exactly like `main`"""
+        rng = random.Random(2026)
+        cpfs = SAMPLE_CPFS + [random_cpf_like(rng) for _ in range(20000)]
+
+        for cpf in cpfs:
+            self.assertEqual(expected_reason(cpf, verify_cpf_fast),
+                             expected_reason(cpf), f'CPF: {cpf!r}')
+
+    def test_verify_cpf_cached(self):
+        """The memoized validator returns the same results"""
+        verify_cpf_cached.cache_clear()
+
+        for cpf in SAMPLE_CPFS[:4] * 3:
+            self.assertEqual(verify_cpf_cached(cpf), verify_cpf(cpf))
+
+        self.assertEqual(verify_cpf_cached.cache_info().hits, 8)
+
+    def test_verify_last_digits_fast(self):
+        """`verify_last_digits_fast` agrees with `verify_last_digits`"""
+        rng = random.Random(13)
+        cpfs = [''.join(rng.choice('0123456789') for _ in range(11))
+                for _ in range(20000)]
+        cpfs += ['52998224725', '11144477735', '00000000000', 52998224725]
+
+        valid = 0
+        for cpf in cpfs:
+            self.assertEqual(verify_last_digits_fast(cpf), verify_last_digits(cpf),
+                             f'CPF: {cpf!r}')
+            valid += verify_last_digits(cpf)
+
+        self.assertGreater(valid, 0)
+
+if __name__ == '__main__':
+    unittest.main()
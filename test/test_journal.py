@@ -0,0 +1,95 @@
+"""
+Tests for the transaction journal (`journal` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from journal import Journal, RECORD, JOURNAL_MAGIC, read_records, recover, replay_balances
+
+class TestJournal(unittest.TestCase):
+    """Tests writing, reading and recovering the journal"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'journal.bin')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        """Every durability mode must read back the same records"""
+        for durability in ('always', 'interval', 'close'):
+            path = os.path.join(self.tmp_dir.name, f'{durability}.bin')
+
+            with Journal(path, durability) as journal:
+                journal.append(1, 'deposit', 100000, 100000, timestamp=10.0)
+                journal.append(1, 'withdrawal', 50000, 50000, timestamp=11.0)
+                journal.append(2, 'deposit', 5050, 5050, timestamp=12.0)
+
+            records = list(read_records(path))
+
+            self.assertEqual([r.seq for r in records], [1, 2, 3])
+            self.assertEqual(records[1].operation_type, 'withdrawal')
+            self.assertEqual(records[2].value_cents, 5050)
+            self.assertEqual(replay_balances(path), {1: 50000, 2: 5050})
+
+    def test_sequence_continues_after_restart(self):
+        """Reopening the journal keeps appending after the last record"""
+        with Journal(self.path, 'close') as journal:
+            journal.append(1, 'deposit', 100, 100)
+
+        with Journal(self.path, 'close') as journal:
+            self.assertEqual(journal.append(1, 'deposit', 100, 200), 2)
+
+    def test_torn_tail_is_truncated(self):
+        """A half-written record is dropped on recovery"""
+        with Journal(self.path, 'always') as journal:
+            journal.append(1, 'deposit', 100, 100)
+            journal.append(1, 'deposit', 200, 300)
+
+        with open(self.path, 'ab') as journal_file:
+            journal_file.write(b'\x03\x00\x00')
+
+        self.assertEqual(recover(self.path), 2)
+        self.assertEqual(os.path.getsize(self.path), len(JOURNAL_MAGIC) + 2 * RECORD.size)
+
+        with Journal(self.path, 'always') as journal:
+            journal.append(1, 'withdrawal', 300, 0)
+
+        self.assertEqual(replay_balances(self.path), {1: 0})
+
+    def test_corrupted_record_stops_replay(self):
+        """Records after a CRC mismatch are not replayed"""
+        with Journal(self.path, 'always') as journal:
+            journal.append(1, 'deposit', 100, 100)
+            journal.append(1, 'deposit', 200, 300)
+
+        with open(self.path, 'r+b') as journal_file:
+            journal_file.seek(len(JOURNAL_MAGIC) + RECORD.size + 20)
+            journal_file.write(b'\xff')
+
+        self.assertEqual(replay_balances(self.path), {1: 100})
+
+    def test_invalid_arguments(self):
+        """Unknown durability modes and operation types are refused"""
+        with self.assertRaises(ValueError):
+            Journal(self.path, 'sometimes')
+
+        with Journal(self.path, 'close') as journal:
+            with self.assertRaises(ValueError):
+                journal.append(1, 'transfer', 100, 100)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Tests for the multi-account ledger (`ledger` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from journal import Journal
+from ledger import Ledger
+
+class TestLedger(unittest.TestCase):
+    """Tests deposits and withdrawals on many accounts"""
+
+    def setUp(self):
+        self.ledger = Ledger()
+        self.ledger.open_account(1)
+        self.ledger.open_account(2, balance=100000)
+
+    def test_accounts_are_independent(self):
+        """Each account keeps its own balance, counter and statement"""
+        self.assertEqual(self.ledger.deposit(1, 150050), 150050)
+        self.assertEqual(self.ledger.withdraw(2, 50000), 50000)
+
+        self.assertEqual(self.ledger.balances(), {1: 150050, 2: 50000})
+        self.assertEqual(self.ledger.withdrawals(1), 0)
+        self.assertEqual(self.ledger.withdrawals(2), 1)
+        self.assertEqual(len(self.ledger.statement(1)), 1)
+        self.assertEqual(self.ledger.statement(2)[0]['operation_type'], 'withdrawal')
+
+    def test_withdrawal_rules(self):
+        """The ledger applies the same rules as `withdraw_money`"""
+        self.ledger.deposit(1, 1000000)
+
+        with self.assertRaisesRegex(ValueError, 'valor mínimo'):
+            self.ledger.withdraw(1, 49999)
+        with self.assertRaisesRegex(ValueError, 'insuficiente'):
+            self.ledger.withdraw(2, 100001)
+        with self.assertRaisesRegex(ValueError, 'maior que zero'):
+            self.ledger.deposit(1, 0)
+        with self.assertRaisesRegex(ValueError, 'não existe'):
+            self.ledger.deposit(3, 100)
+
+        for _ in range(3):
+            self.ledger.withdraw(1, 50000)
+        with self.assertRaisesRegex(ValueError, 'saques diários'):
+            self.ledger.withdraw(1, 50000)
+
+        self.ledger.reset_daily_withdrawals()
+        self.assertEqual(self.ledger.withdraw(1, 50000), 800000)
+        self.assertEqual(self.ledger.balance(2), 100000)
+
+    def test_out_of_range_values(self):
+        """Amounts and IDs that don't fit in the journal leave the ledger unchanged"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with Journal(os.path.join(tmp_dir, 'journal.bin'), 'close') as journal:
+                ledger = Ledger(journal)
+                ledger.open_account(1, balance=100)
+
+                with self.assertRaisesRegex(ValueError, 'saldo máximo'):
+                    ledger.deposit(1, 10 ** 20)
+                with self.assertRaisesRegex(ValueError, 'saldo máximo'):
+                    ledger.deposit(1, 2 ** 63 - 100)
+                with self.assertRaisesRegex(ValueError, 'fora do intervalo'):
+                    ledger.open_account(2 ** 32)
+                with self.assertRaisesRegex(ValueError, 'fora do intervalo'):
+                    ledger.merge_account(-1, 0, 0)
+
+                self.assertEqual(ledger.balance(1), 100)
+                self.assertEqual(len(ledger.statement(1)), 0)
+                self.assertEqual(list(ledger), [1])
+                self.assertEqual(ledger.deposit(1, 2 ** 63 - 101), 2 ** 63 - 1)
+
+    def test_apply_many(self):
+        """Refused operations are counted and skipped"""
+        accepted, rejected = self.ledger.apply_many([
+            (1, 'deposit', 100000),
+            (1, 'withdrawal', 50000),
+            (1, 'withdrawal', 60000),
+            (3, 'deposit', 100),
+            (2, 'transfer', 100),
+        ])
+
+        self.assertEqual((accepted, rejected), (2, 3))
+        self.assertEqual(self.ledger.balance(1), 50000)
+
+    def test_load_journal(self):
+        """A new ledger restores the balances recorded in the journal"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'journal.bin')
+
+            with Journal(path, 'close') as journal:
+                ledger = Ledger(journal)
+                ledger.open_account(1)
+                ledger.open_account(7)
+                ledger.deposit(1, 100000)
+                ledger.deposit(7, 200000)
+                ledger.withdraw(7, 50000)
+
+            restored = Ledger(keep_statements=False)
+            restored.load_journal(path)
+
+        self.assertEqual(restored.balances(), {1: 100000, 7: 150000})
+        self.assertEqual(restored.withdrawals(7), 1)
+        self.assertIsNone(restored.statement(7))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+Tests for the withdrawal limits engine (`limits` module) and its use by
+the `Ledger`.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import datetime
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from journal import Journal
+from ledger import Ledger
+from limits import LimitsEngine, WithdrawalLimits
+
+BRASILIA = datetime.timezone(datetime.timedelta(hours=-3))
+
+class FakeClock:
+    """Clock that only moves when told to"""
+
+    def __init__(self, when: datetime.datetime):
+        self.now = when.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, **delta):
+        self.now += datetime.timedelta(**delta).total_seconds()
+
+class TestLimitsEngine(unittest.TestCase):
+    """Tests the counters, the rollover and the limits"""
+
+    def setUp(self):
+        # 23:00 in Brasília, already the next day in UTC
+        self.clock = FakeClock(datetime.datetime(2026, 3, 10, 23, tzinfo=BRASILIA))
+
+    def engine(self, **limits) -> LimitsEngine:
+        return LimitsEngine(WithdrawalLimits(**limits), BRASILIA, self.clock)
+
+    def test_day_follows_the_timezone(self):
+        engine = self.engine()
+
+        self.assertEqual(engine.day(), datetime.date(2026, 3, 10).toordinal())
+        self.clock.advance(minutes=59)
+        self.assertEqual(engine.day(), datetime.date(2026, 3, 10).toordinal())
+        self.clock.advance(minutes=1)
+        self.assertEqual(engine.day(), datetime.date(2026, 3, 11).toordinal())
+
+    def test_daily_counter_rolls_over(self):
+        engine = self.engine()
+
+        for _ in range(3):
+            engine.check_withdrawal(1, 50000)
+            engine.record_withdrawal(1, 50000)
+
+        with self.assertRaisesRegex(ValueError, 'saques diários'):
+            engine.check_withdrawal(1, 50000)
+        engine.check_withdrawal(2, 50000)
+
+        self.clock.advance(hours=1)
+        self.assertEqual(engine.withdrawals_today(1), 0)
+        engine.check_withdrawal(1, 50000)
+
+    def test_stale_buckets_are_replaced(self):
+        engine = self.engine(window_days=3)
+        engine.record_withdrawal(1, 50000)
+        self.clock.advance(days=3)
+        engine.record_withdrawal(1, 60000)
+
+        self.assertEqual(engine.withdrawals_today(1), 1)
+        self.assertEqual(engine.window_totals(1), (1, 60000))
+
+    def test_old_withdrawals_are_ignored(self):
+        engine = self.engine(window_days=2)
+        engine.record_withdrawal(1, 50000)
+        engine.record_withdrawal(1, 70000, self.clock.now - 2 * 86400)
+
+        self.assertEqual(engine.window_totals(1), (1, 50000))
+
+    def test_per_transaction_limits(self):
+        engine = self.engine(min_amount=1000, max_amount=100000)
+
+        with self.assertRaisesRegex(ValueError, 'valor mínimo'):
+            engine.check_withdrawal(1, 999)
+        with self.assertRaisesRegex(ValueError, 'valor máximo'):
+            engine.check_withdrawal(1, 100001)
+        engine.check_withdrawal(1, 100000)
+
+    def test_amount_per_day(self):
+        engine = self.engine(max_amount_per_day=150000)
+        engine.record_withdrawal(1, 100000)
+
+        with self.assertRaisesRegex(ValueError, 'limite diário'):
+            engine.check_withdrawal(1, 60000)
+        engine.check_withdrawal(1, 50000)
+
+    def test_rolling_window(self):
+        engine = self.engine(max_per_day=None, window_days=7, max_per_window=4,
+                             max_amount_per_window=300000)
+
+        for _ in range(4):
+            engine.record_withdrawal(1, 50000)
+            self.clock.advance(days=1)
+
+        with self.assertRaisesRegex(ValueError, 'em 7 dias'):
+            engine.check_withdrawal(1, 50000)
+
+        # the first withdrawal leaves the window on the 8th day
+        self.clock.advance(days=3)
+        engine.check_withdrawal(1, 50000)
+        with self.assertRaisesRegex(ValueError, 'R\\$ 3000.00 em 7 dias'):
+            engine.check_withdrawal(1, 160000)
+
+    def test_invalid_window(self):
+        with self.assertRaises(ValueError):
+            self.engine(window_days=0)
+
+class TestLedgerWithLimits(unittest.TestCase):
+    """The `Ledger` uses the engine's counters"""
+
+    def setUp(self):
+        self.clock = FakeClock(datetime.datetime(2026, 3, 10, 12, tzinfo=BRASILIA))
+        self.ledger = Ledger(limits=LimitsEngine(timezone=BRASILIA, clock=self.clock))
+        self.ledger.open_account(1, 500000)
+
+    def test_withdrawals_reset_on_the_next_day(self):
+        for _ in range(3):
+            self.ledger.withdraw(1, 50000)
+
+        with self.assertRaisesRegex(ValueError, 'saques diários'):
+            self.ledger.withdraw(1, 50000)
+        self.assertEqual(self.ledger.withdrawals(1), 3)
+
+        self.clock.advance(hours=12)
+        self.assertEqual(self.ledger.withdrawals(1), 0)
+        self.assertEqual(self.ledger.withdraw(1, 50000), 300000)
+
+    def test_refused_withdrawal_is_not_counted(self):
+        with self.assertRaisesRegex(ValueError, 'insuficiente'):
+            self.ledger.withdraw(1, 600000)
+
+        self.assertEqual(self.ledger.withdrawals(1), 0)
+        self.assertEqual(self.ledger.balance(1), 500000)
+
+    def test_load_journal_counts_by_timestamp(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'journal.bin')
+
+            with Journal(path) as journal:
+                journal.append(1, 'deposit', 500000, 500000, self.clock.now - 86400)
+                journal.append(1, 'withdrawal', 50000, 450000, self.clock.now - 86400)
+                journal.append(1, 'withdrawal', 50000, 400000, self.clock.now - 60)
+
+            restored = Ledger(keep_statements=False,
+                              limits=LimitsEngine(timezone=BRASILIA, clock=self.clock))
+            restored.load_journal(path)
+
+        self.assertEqual(restored.balance(1), 400000)
+        self.assertEqual(restored.withdrawals(1), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,8 @@ made for DIO's Python Developer Bootcamp challenge.
 @date: 2025-04-05
 """
 
+import contextlib
+import io
 import os
 import sys
 import unittest
@@ -17,10 +19,11 @@ sys.path.insert(
     )
 )
 
-from main import convert_str_to_float, add_to_statement, deposit_money, withdraw_money, print_statement
+from banking_methods import (convert_str_to_float, add_to_statement, deposit_money,
+                             withdraw_money, print_statement)
 
 class TestBaseMethods(unittest.TestCase):
-    """Tests the helper methods in the `main` module"""
+    """Tests the helper methods in the `banking_methods` module"""
     def test_convert_str_to_float(self):
         """
         Tests the `convert_str_to_float` method
@@ -172,8 +175,7 @@ class TestBankMethods(unittest.TestCase):
              f"{(test1_expected_balance, test1_expected_withdrawals, test1_expected_statement)}, "
              f"instead, the function returned: {test1}"))
 
-    @patch('builtins.print')  # Substitui a função print
-    def test_print_statement(self, mock_print):
+    def test_print_statement(self):
         """Test the `print_statement` method"""
 
         mock_statement = [
@@ -189,14 +191,15 @@ class TestBankMethods(unittest.TestCase):
             }
         ]
 
-        print_statement(mock_statement)
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            print_statement(mock_statement)
 
-        expected_result = ("Operação: depósito, Valor da operação: R$ 500.00, "
-                           "Saldo após a operação: R$ 1000.00\n"
-                           "Operação: depósito, Valor da operação: R$ 1500.90, "
-                           "Saldo após a operação: R$ 2500.90")
+        expected_result = ("Operação: depósito\nValor da operação:\tR$ 500.00\n"
+                           "Saldo após a operação:\tR$ 1000.00\n"
+                           "Operação: depósito\nValor da operação:\tR$ 1500.90\n"
+                           "Saldo após a operação:\tR$ 2500.90\n")
 
-        mock_print.assert_called_once_with(expected_result)
+        self.assertEqual(stdout.getvalue(), expected_result)
 
 if __name__ == '__main__':
     unittest.main()
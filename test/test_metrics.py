@@ -0,0 +1,263 @@
+"""
+Tests for the opt-in instrumentation (`metrics` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+import cpf_validator
+from banking_methods import deposit_money, withdraw_money
+from errors import DailyLimitError, InsufficientBalanceError, InvalidCPFError, MinimumValueError
+from metrics import (BUCKETS, Histogram, Metrics, bucket_index, bucket_upper_bound,
+                     instrument, rejection_reason)
+
+class TestHistogram(unittest.TestCase):
+    """Tests the fixed-bucket histogram"""
+
+    def test_buckets_cover_values(self):
+        previous = -1
+        for index in range(BUCKETS - 1):
+            upper = bucket_upper_bound(index)
+            self.assertGreater(upper, previous)
+            self.assertEqual(bucket_index(upper), index)
+            self.assertEqual(bucket_index(previous + 1), index)
+            previous = upper
+
+        self.assertEqual(bucket_index(1 << 60), BUCKETS - 1)
+
+    def test_relative_error(self):
+        for value in (17, 100, 999, 12345, 10 ** 6, 987654321):
+            upper = bucket_upper_bound(bucket_index(value))
+            self.assertLessEqual(upper - value, value / 8)
+
+    def test_percentiles(self):
+        histogram = Histogram()
+        for value in range(1, 1001):
+            histogram.record(value)
+
+        self.assertEqual(histogram.count, 1000)
+        self.assertEqual(histogram.min, 1)
+        self.assertEqual(histogram.max, 1000)
+        for percent, exact in ((50, 500), (90, 900), (99, 990)):
+            self.assertGreaterEqual(histogram.percentile(percent), exact)
+            self.assertLessEqual(histogram.percentile(percent), exact * 1.125)
+        self.assertEqual(histogram.percentile(100), 1000)
+        self.assertIsNone(Histogram().percentile(50))
+
+    def test_count_at_most(self):
+        """Values on a bound count in its bucket, powers of two in the next one"""
+        histogram = Histogram()
+        for value in (1023, 1024, 2047, 2048):
+            histogram.record(value)
+
+        self.assertEqual(histogram.count_at_most(959), 0)
+        self.assertEqual(histogram.count_at_most(1023), 1)
+        self.assertEqual(histogram.count_at_most(2047), 3)
+        self.assertEqual(histogram.count_at_most(4095), 4)
+
+class TestInstrument(unittest.TestCase):
+    """Tests the `instrument` decorator"""
+
+    def test_disabled_returns_function(self):
+        def function():
+            return 1
+
+        self.assertIs(instrument('f', enabled=False)(function), function)
+
+    def test_counts_calls_and_rejections(self):
+        metrics = Metrics()
+
+        @instrument('withdraw', metrics=metrics, enabled=True)
+        def withdraw(error):
+            if error:
+                raise error('recusado')
+            return 'ok'
+
+        self.assertEqual(withdraw(None), 'ok')
+        for error in (DailyLimitError, MinimumValueError, InsufficientBalanceError,
+                      InsufficientBalanceError):
+            with self.assertRaises(ValueError):
+                withdraw(error)
+
+        snapshot = metrics.snapshot()['functions']['withdraw']
+        self.assertEqual(snapshot['calls'], 5)
+        self.assertEqual(snapshot['latency_ns']['count'], 5)
+        self.assertEqual(snapshot['rejections'], {'daily_limit': 1, 'min_value': 1,
+                                                  'insufficient_balance': 2})
+
+    def test_threads(self):
+        """Each thread records in its own shard, merged when read"""
+        metrics = Metrics()
+        increment = instrument('increment', metrics=metrics, enabled=True)(lambda: None)
+
+        def run():
+            for _ in range(1000):
+                increment()
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(metrics.latency('increment').count, 4000)
+        self.assertEqual(metrics.snapshot()['functions']['increment']['calls'], 4000)
+
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), {'functions': {}})
+
+    def test_invalid_result(self):
+        """A well-formed CPF with wrong check digits is an invalid_cpf rejection"""
+        metrics = Metrics()
+        validate = instrument('cpf', invalid_result=False, metrics=metrics,
+                              enabled=True)(cpf_validator.verify_cpf_fast)
+
+        self.assertTrue(validate('529.982.247-25'))
+        self.assertFalse(validate('529.982.247-26'))
+        with self.assertRaises(ValueError):
+            validate('52998224725')
+
+        self.assertEqual(metrics.snapshot()['functions']['cpf']['rejections'],
+                         {'invalid_cpf': 2})
+
+    def test_rejection_reasons(self):
+        """Reasons come from the exception's class, not from its message"""
+        self.assertEqual(rejection_reason(DailyLimitError('limite')), 'daily_limit')
+        self.assertEqual(rejection_reason(InvalidCPFError('CPF inválido.')), 'invalid_cpf')
+        self.assertEqual(rejection_reason(
+            ValueError('um usuário com este CPF não existe na base de dados.')), 'other')
+        self.assertEqual(rejection_reason(TypeError('outro erro')), 'other')
+
+    def test_interrupts_are_not_rejections(self):
+        metrics = Metrics()
+
+        @instrument('loop', metrics=metrics, enabled=True)
+        def loop():
+            raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            loop()
+
+        self.assertEqual(metrics.snapshot(), {'functions': {}})
+
+    @patch('builtins.print')
+    def test_banking_methods(self, _mock_print):
+        """The instrumented functions keep their behaviour"""
+        metrics = Metrics()
+        deposit = instrument('deposit_money', metrics=metrics, enabled=True)(deposit_money)
+        withdraw = instrument('withdraw_money', metrics=metrics, enabled=True)(withdraw_money)
+
+        balance, statement = deposit(0.0, 1000.0, [])
+        balance, count, statement = withdraw(balance, 0, 600.0, statement)
+        with self.assertRaises(ValueError):
+            withdraw(balance, count, 600.0, statement)
+
+        self.assertEqual(balance, 400.0)
+        functions = metrics.snapshot()['functions']
+        self.assertEqual(functions['deposit_money']['calls'], 1)
+        self.assertEqual(functions['withdraw_money']['rejections'],
+                         {'insufficient_balance': 1})
+
+class TestEnabled(unittest.TestCase):
+    """Tests the instrumentation wired in the app, with `BANKING_METRICS` set"""
+
+    def test_app_paths(self):
+        """Well-formed CPFs with wrong check digits count as rejections"""
+        script = (
+            'from account import open_account\n'
+            'from metrics import dump\n'
+            'from users import create_user\n'
+            'users = []\n'
+            'for cpf in ("529.982.247-26", "111.444.777-35"):\n'
+            '    try:\n'
+            '        create_user(users, {"cpf": cpf})\n'
+            '    except (ValueError, KeyError):\n'
+            '        pass\n'
+            'for cpf in ("52998224726", "529.982.247-26"):\n'
+            '    try:\n'
+            '        open_account(users, [], cpf)\n'
+            '    except ValueError:\n'
+            '        pass\n'
+            'dump()\n'
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'metrics.json')
+            subprocess.run([sys.executable, '-c', script], check=True,
+                           cwd=os.path.join(os.path.dirname(__file__), '..'),
+                           env={**os.environ, 'BANKING_METRICS': path})
+
+            with open(path, encoding='utf-8') as metrics_file:
+                functions = json.load(metrics_file)['functions']
+
+        validator = functions['cpf_validator.verify_cpf_fast']
+        self.assertEqual(validator['calls'], 4)
+        self.assertEqual(validator['rejections'], {'invalid_cpf': 3})
+        self.assertEqual(functions['find_user_in_database']['calls'], 3)
+        self.assertEqual(functions['open_account']['calls'], 2)
+        self.assertEqual(functions['open_account']['rejections'], {'other': 2})
+
+class TestDump(unittest.TestCase):
+    """Tests the JSON and Prometheus outputs"""
+
+    def setUp(self):
+        self.metrics = Metrics()
+        deposits = self.metrics.shard('deposit_money')
+        for elapsed in (1500, 3000, 2 ** 21):
+            deposits.record(elapsed)
+        self.metrics.shard('withdraw_money').record(800)
+        self.metrics.reject('withdraw_money', 'min_value')
+
+    def test_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'metrics.json')
+            self.metrics.dump(path)
+
+            with open(path, encoding='utf-8') as metrics_file:
+                functions = json.load(metrics_file)['functions']
+
+        self.assertEqual(functions['deposit_money']['calls'], 3)
+        self.assertEqual(functions['deposit_money']['latency_ns']['max'], 2 ** 21)
+        self.assertEqual(functions['withdraw_money']['rejections'], {'min_value': 1})
+
+    def test_prometheus(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'metrics.prom')
+            self.metrics.dump(path)
+
+            with open(path, encoding='utf-8') as metrics_file:
+                lines = metrics_file.read().splitlines()
+
+        self.assertIn('banking_calls_total{function="deposit_money"} 3', lines)
+        self.assertIn('banking_rejections_total{function="withdraw_money",'
+                      'reason="min_value"} 1', lines)
+        self.assertIn('banking_latency_seconds_bucket{function="deposit_money",'
+                      'le="2.047e-06"} 1', lines)
+        self.assertIn('banking_latency_seconds_bucket{function="deposit_money",'
+                      'le="0.002097151"} 2', lines)
+        self.assertIn('banking_latency_seconds_bucket{function="deposit_money",'
+                      'le="0.004194303"} 3', lines)
+        self.assertIn('banking_latency_seconds_bucket{function="deposit_money",'
+                      'le="+Inf"} 3', lines)
+
+        buckets = [int(line.rsplit(' ', 1)[1]) for line in lines
+                   if line.startswith('banking_latency_seconds_bucket{function="deposit_money"')]
+        self.assertEqual(buckets, sorted(buckets))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Tests for the integer-cents money helpers (`money` module) and the
+cents-based banking methods.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from money import parse_cents, format_cents
+from banking_methods import deposit_cents, withdraw_cents
+from compact_statement import CompactStatement
+
+class TestMoney(unittest.TestCase):
+    """Tests parsing and formatting amounts in cents"""
+
+    def test_parse_cents(self):
+        """Comma and dot are both accepted as the decimal separator"""
+        list_tests = [
+            ('500,50', 50050),
+            ('500.50', 50050),
+            ('500,5', 50050),
+            ('5.5', 550),
+            (' 1500 ', 150000),
+            (',99', 99),
+            ('-10', -1000),
+            (500, 50000),
+            (1500.9, 150090),
+            (0.1 + 0.2, 30),
+        ]
+
+        for value, expected in list_tests:
+            self.assertEqual(parse_cents(value), expected, f'value: {value!r}')
+
+    def test_parse_cents_errors(self):
+        """Invalid amounts are refused instead of rounded"""
+        for value in ['', 'abc', '1,000.50', '10.505', '1e3', '.', None, True, float('nan'),
+                      10.555, 0.001]:
+            with self.assertRaises(ValueError, msg=f'value: {value!r}'):
+                parse_cents(value)
+
+    def test_parse_cents_range(self):
+        """Amounts must fit in int64 cents, whatever the entry's type"""
+        self.assertEqual(parse_cents('92233720368547758,07'), 2 ** 63 - 1)
+        self.assertEqual(parse_cents('-92233720368547758,08'), -2 ** 63)
+
+        for value in ['99999999999999999999', '92233720368547758,08', '1' * 30 + ',00',
+                      10 ** 17, 1e20, -10 ** 17]:
+            with self.assertRaisesRegex(ValueError, 'limite', msg=f'value: {value!r}'):
+                parse_cents(value)
+
+    def test_format_cents(self):
+        """Cents are shown with two decimal places"""
+        self.assertEqual(format_cents(50050), '500.50')
+        self.assertEqual(format_cents(5), '0.05')
+        self.assertEqual(format_cents(-105), '-1.05')
+        self.assertEqual(format_cents(0), '0.00')
+
+@patch('builtins.print')
+class TestCentsBankMethods(unittest.TestCase):
+    """Tests the cents-based deposit and withdrawal"""
+
+    def test_no_rounding_drift(self, _mock_print):
+        """A thousand 10-cent deposits add up exactly"""
+        balance, statement = 0, CompactStatement()
+
+        for _ in range(1000):
+            balance, statement = deposit_cents(balance, parse_cents('0,10'), statement)
+
+        self.assertEqual(balance, 10000)
+        self.assertEqual(statement.total('deposit'), 10000)
+
+    def test_withdrawal_rules(self, _mock_print):
+        """The cents withdrawal follows the same rules as `withdraw_money`"""
+        statement = CompactStatement()
+
+        balance, withdrawals, statement = withdraw_cents(100000, 0, 50000, statement)
+        self.assertEqual((balance, withdrawals), (50000, 1))
+        self.assertEqual(statement[0]['saldo_after_operation'], 500.0)
+
+        with self.assertRaisesRegex(ValueError, 'valor mínimo'):
+            withdraw_cents(100000, 0, 49999, statement)
+        with self.assertRaisesRegex(ValueError, 'insuficiente'):
+            withdraw_cents(50000, 0, 50001, statement)
+        with self.assertRaisesRegex(ValueError, 'saques diários'):
+            withdraw_cents(100000, 3, 50000, statement)
+        with self.assertRaises(ValueError):
+            deposit_cents(100000, 0, statement)
+
+if __name__ == '__main__':
+    unittest.main()
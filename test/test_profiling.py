@@ -0,0 +1,118 @@
+"""
+Tests for the profiling mode (`profiling` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import contextlib
+import csv
+import io
+import os
+import pstats
+import sys
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+import batch
+import user_import
+from cpf_validator import main as validate_cpf
+from profiling import frame_label, project_module, profile_session
+
+def busy(seconds: float):
+    """Validates CPFs for about `seconds`, so the sampler sees them"""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        validate_cpf('529.982.247-25')
+
+class TestProfiling(unittest.TestCase):
+    """Tests the files written by a profiled session"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.prefix = os.path.join(self.tmp_dir.name, 'profile')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_project_module(self):
+        self.assertEqual(project_module(batch.__file__), 'batch')
+        self.assertIsNone(project_module(contextlib.__file__))
+
+    def test_frame_label_without_qualname(self):
+        """Before Python 3.11 code objects have no `co_qualname`"""
+        code = SimpleNamespace(co_filename=batch.__file__, co_name='settle_file')
+        frame = SimpleNamespace(f_code=code, f_globals={'__name__': '__main__'})
+
+        self.assertEqual(frame_label(frame), 'batch:settle_file')
+
+    def test_session_files(self):
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            with profile_session(self.prefix, top=5, interval=0.001):
+                busy(0.3)
+
+        with open(f'{self.prefix}.txt', encoding='utf-8') as summary_file:
+            summary = summary_file.read()
+        self.assertEqual(stderr.getvalue().strip(), summary.strip())
+        self.assertIn('cpf_validator', summary)
+        self.assertNotIn(' profiling\n', summary)
+
+        with open(f'{self.prefix}.collapsed', encoding='utf-8') as collapsed_file:
+            lines = collapsed_file.read().splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            stack, count = line.rsplit(' ', 1)
+            self.assertGreater(int(count), 0)
+            self.assertTrue(all(':' in frame for frame in stack.split(';')))
+        self.assertTrue(any('cpf_validator:main' in line for line in lines))
+
+        stats = pstats.Stats(f'{self.prefix}.pstats').stats
+        self.assertTrue(any(name == 'main' and project_module(filename) == 'cpf_validator'
+                            for filename, _, name in stats))
+
+    def test_disabled(self):
+        with profile_session(None) as profiler:
+            busy(0.01)
+
+        self.assertIsNone(profiler)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_batch_profile(self):
+        path = os.path.join(self.tmp_dir.name, 'batch.csv')
+        with open(path, 'w', encoding='utf-8', newline='') as batch_file:
+            writer = csv.writer(batch_file)
+            writer.writerow(('acc_id', 'operation_type', 'value'))
+            writer.writerows((1, 'deposit', '100,00') for _ in range(100))
+
+        with contextlib.redirect_stdout(io.StringIO()), \
+                contextlib.redirect_stderr(io.StringIO()):
+            batch.main([path, '--open-accounts', '--profile', self.prefix,
+                        '--profile-top', '3'])
+
+        for extension in ('pstats', 'collapsed', 'txt'):
+            self.assertTrue(os.path.exists(f'{self.prefix}.{extension}'))
+
+    def test_user_import_profile(self):
+        path = os.path.join(self.tmp_dir.name, 'users.csv')
+        with open(path, 'w', encoding='utf-8', newline='') as users_file:
+            writer = csv.writer(users_file)
+            writer.writerow(('cpf', 'name', 'birth_date', 'state_uf'))
+            writer.writerow(('529.982.247-25', 'Maria', '17-05-1990', 'PE'))
+
+        with contextlib.redirect_stdout(io.StringIO()), \
+                contextlib.redirect_stderr(io.StringIO()):
+            user_import.main([path, '--profile', self.prefix])
+
+        for extension in ('pstats', 'collapsed', 'txt'):
+            self.assertTrue(os.path.exists(f'{self.prefix}.{extension}'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+Tests for the streaming renderers (`renderers` module) and the `print_*`
+functions that use them.
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import contextlib
+import csv
+import io
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from account import print_account_list
+from banking_methods import print_statement
+from renderers import render_users, render_accounts, render_statement
+from user_store import UserStore
+from users import print_user_list
+from helpers import make_user
+
+STATEMENT = [
+    {'operation_type': 'deposit', 'value': 500.0, 'saldo_after_operation': 1000.0},
+    {'operation_type': 'withdrawal', 'value': 1500.9, 'saldo_after_operation': 2500.9}
+]
+
+class RecordingOutput(io.StringIO):
+    """Text stream recording the size of each write and the flushes"""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+        self.flushed_at = []
+
+    def write(self, text):
+        self.writes.append(len(text))
+        return super().write(text)
+
+    def flush(self):
+        self.flushed_at.append(len(self.writes))
+        super().flush()
+
+class CountingUserStore(UserStore):
+    """`UserStore` counting its CPF lookups"""
+    lookups = 0
+
+    def get(self, user_cpf):
+        self.lookups += 1
+        return super().get(user_cpf)
+
+class TestTextOutput(unittest.TestCase):
+    """The `print_*` functions keep their terminal format"""
+
+    def printed(self, function, *args) -> str:
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            function(*args)
+        return out.getvalue()
+
+    def test_print_user_list(self):
+        self.assertEqual(self.printed(print_user_list, [make_user(1), make_user(2)]),
+                         'Nome:\tUsuário 1\nCPF:\t00000000001\n'
+                         'Endereço:\tRua A - 1 - Centro - Recife/PE\n'
+                         'Nome:\tUsuário 2\nCPF:\t00000000002\n'
+                         'Endereço:\tRua A - 2 - Centro - Recife/PE\n')
+        self.assertEqual(self.printed(print_user_list, []),
+                         'Nenhum usuário cadastrado até o momento\n')
+
+    def test_print_account_list(self):
+        accounts = [{'id': 1, 'agency': '0001', 'user': '00000000002'}]
+
+        self.assertEqual(self.printed(print_account_list, accounts,
+                                      [make_user(1), make_user(2)]),
+                         'Identificador único:\t1\nAgência:\t0001\n'
+                         'Nome do usuário:\tUsuário 2\n')
+        self.assertEqual(self.printed(print_account_list, [], []),
+                         'Nenhuma conta registrada até o momento\n')
+
+    def test_unknown_owner(self):
+        with self.assertRaises(ValueError):
+            self.printed(print_account_list,
+                         [{'id': 1, 'agency': '0001', 'user': '00000000003'}],
+                         [make_user(1)])
+
+    def test_print_statement(self):
+        self.assertEqual(self.printed(print_statement, STATEMENT),
+                         'Operação: depósito\nValor da operação:\tR$ 500.00\n'
+                         'Saldo após a operação:\tR$ 1000.00\n'
+                         'Operação: saque\nValor da operação:\tR$ 1500.90\n'
+                         'Saldo após a operação:\tR$ 2500.90\n')
+        self.assertEqual(self.printed(print_statement, []),
+                         'Nenhuma operação feita até o momento\n')
+
+class TestFormats(unittest.TestCase):
+    """Tests the CSV and JSON outputs"""
+
+    def test_users_csv(self):
+        out = io.StringIO()
+        self.assertEqual(render_users([make_user(1), make_user(2)], out, 'csv'), 2)
+
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]['cpf'], '00000000001')
+        self.assertEqual(rows[1]['birth_date'], '1990-01-03')
+
+    def test_users_json(self):
+        out = io.StringIO()
+        render_users([make_user(1)], out, 'json')
+
+        self.assertEqual(json.loads(out.getvalue()),
+                         [{**make_user(1), 'birth_date': '1990-01-02'}])
+
+    def test_empty_json_and_csv(self):
+        out = io.StringIO()
+        render_statement([], out, 'json')
+        self.assertEqual(json.loads(out.getvalue()), [])
+
+        out = io.StringIO()
+        render_statement([], out, 'csv')
+        self.assertEqual(out.getvalue(), 'operation_type,value,saldo_after_operation\n')
+
+    def test_accounts_json(self):
+        out = io.StringIO()
+        render_accounts([{'id': 7, 'agency': '0001', 'user': '00000000001'}],
+                        [make_user(1)], out, 'json')
+
+        self.assertEqual(json.loads(out.getvalue()),
+                         [{'id': 7, 'agency': '0001', 'user': '00000000001',
+                           'name': 'Usuário 1'}])
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            render_statement(STATEMENT, io.StringIO(), 'xml')
+
+class TestStreaming(unittest.TestCase):
+    """Tests the chunked writing"""
+
+    def test_generator_is_written_in_chunks(self):
+        out = RecordingOutput()
+        users = (make_user(number) for number in range(1000))
+
+        self.assertEqual(render_users(users, out, 'csv', chunk_rows=100), 1000)
+
+        # header + 63 users first, then chunks of 100 lines
+        self.assertEqual(len(out.writes), 11)
+        self.assertEqual(out.flushed_at, [1])
+        self.assertEqual(out.getvalue().count('\n'), 1001)
+
+    def test_owner_map_avoids_lookups(self):
+        users = CountingUserStore(make_user(number) for number in range(100))
+        accounts = [{'id': number, 'agency': '0001', 'user': f'{number:011d}'}
+                    for number in range(100)]
+
+        self.assertEqual(render_accounts(accounts, users, io.StringIO()), 100)
+        self.assertEqual(users.lookups, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+Tests for the replay harness (`replay` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from replay import ReplayReport, peak_rss, replay
+from workload import Workload
+
+class TestReplay(unittest.TestCase):
+    """Tests replaying small workloads"""
+
+    def test_replay(self):
+        workload = Workload(seed=4, users=30, operations=1000, max_accounts_per_user=2,
+                            days=2)
+        report = replay(workload)
+        latencies = report.latencies
+
+        self.assertEqual(report.total, 30 + len(workload.account_owners) + 1000)
+        self.assertEqual(latencies['register_user'].count, 30)
+        self.assertEqual(latencies['register_account'].count, len(workload.account_owners))
+        self.assertEqual(latencies['deposit'].count + latencies['withdrawal'].count, 1000)
+        self.assertEqual(report.rejected, sum(report.rejections.values()))
+        self.assertTrue(all('saque' in reason for reason in report.rejections))
+        self.assertGreater(report.ops_per_second, 0)
+
+        summary = report.summary()
+        self.assertIn('p99.9', summary)
+        self.assertIn('deposit (', summary)
+
+    def test_same_results(self):
+        workload = Workload(seed=9, users=20, operations=500)
+
+        self.assertEqual(replay(workload).rejections, replay(workload).rejections)
+
+    def test_rate(self):
+        workload = Workload(seed=1, users=5, operations=95)
+        report = replay(workload, rate=1000)
+
+        self.assertEqual(report.total, 105)
+        self.assertGreaterEqual(report.elapsed, 104 / 1000)
+
+    def test_peak_rss(self):
+        rss = peak_rss()
+        if rss is not None:
+            self.assertGreater(rss, 2 ** 20)
+
+        self.assertNotIn('RSS', ReplayReport().summary())
+
+if __name__ == '__main__':
+    unittest.main()
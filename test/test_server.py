@@ -0,0 +1,152 @@
+"""
+Tests for the asyncio JSON lines server (`server` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import asyncio
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from server import BankingService, INTERNAL_ERROR, start_server
+
+USER = {'op': 'register_user', 'cpf': '529.982.247-25', 'name': 'Fulano de Tal',
+        'birth_date': '01-01-1990', 'address': 'Rua A', 'house_number': '1',
+        'neighbourhood': 'Centro', 'city': 'São Paulo', 'state_uf': 'SP'}
+
+class TestBankingService(unittest.TestCase):
+    """Tests the operations exposed by the server, without the network"""
+
+    def setUp(self):
+        self.service = BankingService()
+
+    def test_register_and_operate(self):
+        """A registered user's account accepts deposits and withdrawals"""
+        self.assertEqual(self.service.handle(USER)['result'], {'cpf': '52998224725'})
+
+        account = self.service.handle({'op': 'register_account', 'cpf': '52998224725'})
+        acc_id = account['result']['id']
+
+        self.service.handle({'op': 'deposit', 'acc_id': acc_id, 'value': '1000,00'})
+        withdrawal = self.service.handle({'op': 'withdraw', 'acc_id': acc_id,
+                                          'value': '600'})
+        statement = self.service.handle({'op': 'statement', 'acc_id': acc_id})['result']
+
+        self.assertEqual(withdrawal['result'], {'balance': '400.00'})
+        self.assertEqual([op['operation_type'] for op in statement['operations']],
+                         ['deposit', 'withdrawal'])
+        self.assertEqual(statement['balance'], '400.00')
+
+    def test_errors(self):
+        """Refused requests become error responses"""
+        self.service.handle(USER)
+
+        for request, error in (
+                ({'op': 'transfer'}, 'a operação solicitada não existe.'),
+                ({'op': 'deposit', 'acc_id': 1}, "o campo 'value' é obrigatório."),
+                ({'op': 'balance', 'acc_id': 7}, 'a conta de ID 7 não existe.'),
+                (USER, 'um usuário com este CPF já existe na base de dados.'),
+                ({**USER, 'cpf': '529.982.247-26'},
+                 'CPF inválido. Os dígitos verificadores não conferem.'),
+                ({'op': 'register_account', 'cpf': '11144477735'},
+                 'um usuário com este CPF não existe na base de dados.'),
+                ({'op': 'deposit', 'acc_id': 1, 'value': '99999999999999999999'},
+                 'o valor "99999999999999999999" excede o limite aceito pelo sistema.'),
+                ({'op': 'deposit', 'acc_id': 1, 'value': 10 ** 20},
+                 f'o valor "{10 ** 20}" excede o limite aceito pelo sistema.')):
+            response = self.service.handle({**request, 'id': 9})
+            self.assertEqual(response, {'id': 9, 'ok': False, 'error': error})
+
+    def test_oversized_deposit_changes_nothing(self):
+        self.service.handle(USER)
+        self.service.handle({'op': 'register_account', 'cpf': '52998224725'})
+        self.service.handle({'op': 'deposit', 'acc_id': 1, 'value': '92233720368547758,00'})
+
+        response = self.service.handle({'op': 'deposit', 'acc_id': 1, 'value': '1,00'})
+        statement = self.service.handle({'op': 'statement', 'acc_id': 1})['result']
+
+        self.assertFalse(response['ok'])
+        self.assertEqual(statement['balance'], '92233720368547758.00')
+        self.assertEqual(len(statement['operations']), 1)
+
+    def test_metrics(self):
+        response = self.service.handle({'op': 'metrics'})
+
+        self.assertTrue(response['ok'])
+        self.assertIn('functions', response['result'])
+
+class TestServer(unittest.TestCase):
+    """Tests the server over a local TCP connection"""
+
+    def test_pipelined_requests(self):
+        """Pipelined requests are answered in order"""
+
+        async def scenario():
+            server = await start_server(BankingService(), '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+            requests = [USER, {'op': 'register_account', 'cpf': USER['cpf']}]
+            requests += [{'op': 'deposit', 'acc_id': 1, 'value': '1,00'}] * 100
+            requests += [{'op': 'balance', 'acc_id': 1}]
+
+            writer.write(b'not json\n' + b''.join(
+                json.dumps({**request, 'id': number}).encode() + b'\n'
+                for number, request in enumerate(requests)))
+            await writer.drain()
+
+            responses = [json.loads(await reader.readline())
+                         for _ in range(len(requests) + 1)]
+
+            writer.close()
+            await writer.wait_closed()
+            server.close()
+            await server.wait_closed()
+
+            return responses
+
+        responses = asyncio.run(scenario())
+
+        self.assertFalse(responses[0]['ok'])
+        self.assertEqual([response['id'] for response in responses[1:]],
+                         list(range(103)))
+        self.assertEqual(responses[-1]['result'], {'balance': '100.00'})
+
+    def test_unexpected_errors_keep_the_connection(self):
+        """A failing request gets an error line, and the next ones are answered"""
+
+        async def scenario():
+            service = BankingService()
+            service.handlers['metrics'] = lambda _request: 1 / 0
+            server = await start_server(service, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+            writer.write(b'{"id": 1, "op": "metrics"}\n'
+                         b'{"id": 2, "op": "balance", "acc_id": 1}\n')
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in range(2)]
+
+            writer.close()
+            await writer.wait_closed()
+            server.close()
+            await server.wait_closed()
+
+            return responses
+
+        responses = asyncio.run(scenario())
+
+        self.assertEqual(responses[0], {'id': 1, 'ok': False, 'error': INTERNAL_ERROR})
+        self.assertEqual(responses[1]['id'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
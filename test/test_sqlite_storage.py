@@ -0,0 +1,244 @@
+"""
+Tests for the SQLite storage engine (`sqlite_storage` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from account import open_account
+from banking_methods import add_to_statement
+from sqlite_storage import (ConnectionPool, SQLiteUserStore, SQLiteAccountRegistry,
+                            SQLiteStatement)
+from storage import UserStorage, AccountStorage, StatementStorage
+from users import find_user_in_database
+from helpers import make_user
+
+class SQLiteTestCase(unittest.TestCase):
+    """Opens a new database file for each test"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'bank.db')
+        self.pool = ConnectionPool(self.path)
+
+    def tearDown(self):
+        self.pool.close()
+        self.tmp_dir.cleanup()
+
+class TestSQLiteUserStore(SQLiteTestCase):
+    """Tests the SQLite user database"""
+
+    def test_is_user_storage(self):
+        self.assertIsInstance(SQLiteUserStore(self.pool), UserStorage)
+
+    def test_append_and_get(self):
+        users = SQLiteUserStore(self.pool)
+        users.append(make_user('52998224725'))
+
+        self.assertEqual(len(users), 1)
+        self.assertTrue(users.has_cpf('52998224725'))
+        self.assertFalse(users.has_cpf('11144477735'))
+        self.assertEqual(users.get('52998224725'), make_user('52998224725'))
+        self.assertIsNone(users.get('11144477735'))
+
+    def test_duplicated_cpf_is_refused(self):
+        users = SQLiteUserStore(self.pool)
+        users.append(make_user('52998224725'))
+
+        with self.assertRaises(ValueError):
+            users.append(make_user('52998224725'))
+
+        self.assertEqual(len(users), 1)
+
+    def test_extend_is_atomic(self):
+        users = SQLiteUserStore(self.pool)
+
+        with self.assertRaises(ValueError):
+            users.extend([make_user('52998224725'), make_user('11144477735'),
+                          make_user('52998224725')])
+
+        self.assertEqual(len(users), 0)
+
+    def test_secondary_indexes_and_order(self):
+        users = SQLiteUserStore(self.pool)
+        users.extend([make_user('52998224725'),
+                      make_user('11144477735', 'São Paulo', 'SP'),
+                      make_user('39053344705')])
+
+        self.assertEqual([user['cpf'] for user in users.find_by_state_uf('PE')],
+                         ['52998224725', '39053344705'])
+        self.assertEqual([user['cpf'] for user in users.find_by_city('São Paulo')],
+                         ['11144477735'])
+        self.assertEqual([user['cpf'] for user in users],
+                         ['52998224725', '11144477735', '39053344705'])
+
+    def test_iteration_reads_pages(self):
+        cpfs = [f'{number:011}' for number in range(7)]
+
+        with ConnectionPool(self.path, size=1) as pool, \
+                patch('sqlite_storage.PAGE_SIZE', 3):
+            users = SQLiteUserStore(pool)
+            users.extend(make_user(cpf) for cpf in cpfs)
+            seen = []
+
+            # the only connection is free between pages, so the loop can use it
+            for user in users:
+                seen.append(users.get(user['cpf'])['cpf'])
+
+        self.assertEqual(seen, cpfs)
+
+    def test_find_user_in_database(self):
+        users = SQLiteUserStore(self.pool)
+        users.append(make_user('52998224725'))
+
+        self.assertEqual(find_user_in_database(users, '52998224725'),
+                         [make_user('52998224725')])
+        self.assertEqual(find_user_in_database(users, '11144477735'), [])
+
+    def test_data_survives_reopening(self):
+        SQLiteUserStore(self.pool).append(make_user('52998224725'))
+        self.pool.close()
+
+        with ConnectionPool(self.path) as pool:
+            self.assertEqual(SQLiteUserStore(pool).get('52998224725'),
+                             make_user('52998224725'))
+
+class TestSQLiteAccountRegistry(SQLiteTestCase):
+    """Tests the SQLite account database"""
+
+    def test_is_account_storage(self):
+        self.assertIsInstance(SQLiteAccountRegistry(self.pool), AccountStorage)
+
+    def test_ids_are_never_reused(self):
+        accounts = SQLiteAccountRegistry(self.pool)
+        first = accounts.register('52998224725')
+        accounts.register('52998224725')
+        accounts.remove(first['id'])
+        accounts.remove(2)
+
+        self.assertEqual(accounts.next_id, 3)
+        self.assertEqual(accounts.register('11144477735')['id'], 3)
+        self.assertEqual(len(accounts), 1)
+
+    def test_remove_missing_account(self):
+        with self.assertRaises(ValueError):
+            SQLiteAccountRegistry(self.pool).remove(1)
+
+    def test_start_id_and_register_many(self):
+        accounts = SQLiteAccountRegistry(self.pool, start_id=100)
+        created = accounts.register_many(['52998224725', '11144477735', '52998224725'])
+
+        self.assertEqual([account['id'] for account in created], [100, 101, 102])
+        self.assertEqual(list(accounts), created)
+        with patch('sqlite_storage.PAGE_SIZE', 2):
+            self.assertEqual(list(accounts), created)
+        self.assertEqual([account['id'] for account in accounts.find_by_owner('52998224725')],
+                         [100, 102])
+        self.assertEqual(accounts.get(101), created[1])
+        self.assertIsNone(accounts.get(1))
+
+    def test_open_account(self):
+        users = SQLiteUserStore(self.pool)
+        accounts = SQLiteAccountRegistry(self.pool)
+        users.append(make_user('52998224725'))
+
+        account = open_account(users, accounts, '529.982.247-25')
+
+        self.assertEqual(account, {'id': 1, 'agency': '0001', 'user': '52998224725'})
+        with self.assertRaises(ValueError):
+            open_account(users, accounts, '111.444.777-35')
+
+    def test_threads_share_the_pool(self):
+        accounts = SQLiteAccountRegistry(self.pool)
+        ids = []
+
+        def register_some():
+            for _ in range(50):
+                ids.append(accounts.register('52998224725')['id'])
+
+        threads = [threading.Thread(target=register_some) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(ids), list(range(1, 401)))
+        self.assertEqual(len(accounts), 400)
+
+    def test_threads_register_many(self):
+        accounts = SQLiteAccountRegistry(self.pool)
+        created = []
+
+        def register_batches(owner_cpf: str):
+            for _ in range(20):
+                created.extend(accounts.register_many([owner_cpf] * 10))
+
+        threads = [threading.Thread(target=register_batches, args=(owner_cpf,))
+                   for owner_cpf in ('52998224725', '11144477735') * 4]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(account['id'] for account in created), list(range(1, 1601)))
+        self.assertEqual(sorted(created, key=lambda account: account['id']), list(accounts))
+
+class TestSQLiteStatement(SQLiteTestCase):
+    """Tests the SQLite statements"""
+
+    def test_is_statement_storage(self):
+        self.assertIsInstance(SQLiteStatement(self.pool, 1), StatementStorage)
+
+    def test_add_to_statement(self):
+        statement = SQLiteStatement(self.pool, 1)
+        add_to_statement('deposit', 100.5, 100.5, statement)
+        add_to_statement('withdrawal', 0.5, 100.0, statement)
+
+        self.assertEqual(list(statement), [
+            {'operation_type': 'deposit', 'value': 100.5, 'saldo_after_operation': 100.5},
+            {'operation_type': 'withdrawal', 'value': 0.5, 'saldo_after_operation': 100.0}
+        ])
+
+    def test_statements_are_per_account(self):
+        first = SQLiteStatement(self.pool, 1)
+        second = SQLiteStatement(self.pool, 2)
+        first.extend_cents([('deposit', 1000, 1000), ('withdrawal', 300, 700)])
+        second.append_cents('deposit', 50, 50)
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 1)
+        self.assertEqual(list(first)[1]['saldo_after_operation'], 7.0)
+
+    def test_iteration_reads_pages(self):
+        statement = SQLiteStatement(self.pool, 1)
+        SQLiteStatement(self.pool, 2).append_cents('deposit', 1, 1)
+        statement.extend_cents(('deposit', 100, 100 * number) for number in range(1, 8))
+
+        with patch('sqlite_storage.PAGE_SIZE', 3):
+            balances = [operation['saldo_after_operation'] for operation in statement]
+
+        self.assertEqual(balances, [float(number) for number in range(1, 8)])
+
+    def test_invalid_operation_type(self):
+        statement = SQLiteStatement(self.pool, 1)
+
+        with self.assertRaises(ValueError):
+            statement.extend_cents([('deposit', 10, 10), ('transfer', 10, 0)])
+
+        self.assertEqual(len(statement), 0)
+
+if __name__ == '__main__':
+    unittest.main()
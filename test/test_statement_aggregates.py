@@ -0,0 +1,181 @@
+"""
+Tests for the statement with incremental aggregates
+(`statement_aggregates` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import datetime
+import os
+import random
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from banking_methods import deposit_money, withdraw_money
+from compact_statement import CompactStatement
+from journal import Journal, read_records
+from ledger import Ledger
+from statement_aggregates import AggregatedStatement
+
+START = datetime.datetime(2026, 1, 1).timestamp()
+
+def random_statement(amount: int, checkpoint_interval: int = 8) -> AggregatedStatement:
+    """Builds a statement of `amount` operations, one hour apart"""
+    rng = random.Random(amount)
+    statement = AggregatedStatement(checkpoint_interval=checkpoint_interval)
+    balance = 100000
+
+    for number in range(amount):
+        value = rng.randrange(1, 50000)
+        if rng.random() < 0.4 and balance >= value:
+            balance -= value
+            statement.append_cents('withdrawal', value, balance, START + number * 3600)
+        else:
+            balance += value
+            statement.append_cents('deposit', value, balance, START + number * 3600)
+
+    return statement
+
+def brute_total(statement: AggregatedStatement, operation_type: str,
+                start: int, end: int) -> int:
+    """Sums the operations by walking the statement"""
+    return sum(round(operation['value'] * 100) for operation in list(statement)[start:end]
+               if operation['operation_type'] == operation_type)
+
+class TestAggregatedStatement(unittest.TestCase):
+    """Tests the aggregates against walking the whole statement"""
+
+    def test_running_totals(self):
+        statement = random_statement(500)
+
+        for operation_type in ('deposit', 'withdrawal'):
+            self.assertEqual(statement.total(operation_type),
+                             brute_total(statement, operation_type, 0, 500))
+
+        self.assertEqual(statement.count('deposit') + statement.count('withdrawal'), 500)
+        self.assertEqual(statement.min_balance(), min(statement.balances))
+        self.assertEqual(statement.max_balance(), max(statement.balances))
+
+    def test_range_totals(self):
+        statement = random_statement(300)
+        rng = random.Random(1)
+
+        for _ in range(200):
+            start, end = sorted(rng.randrange(0, 301) for _ in range(2))
+            self.assertEqual(statement.total('deposit', start, end),
+                             brute_total(statement, 'deposit', start, end))
+
+        self.assertEqual(statement.total('withdrawal', -10),
+                         brute_total(statement, 'withdrawal', 290, 300))
+        self.assertEqual(statement.total('deposit', 200, 100), 0)
+
+    def test_totals_between_moments(self):
+        statement = random_statement(24 * 10)
+        day = datetime.date(2026, 1, 3)
+
+        self.assertEqual(statement.positions_between(day, day + datetime.timedelta(days=1)),
+                         range(48, 72))
+        self.assertEqual(statement.total_between('deposit', day,
+                                                 day + datetime.timedelta(days=1)),
+                         brute_total(statement, 'deposit', 48, 72))
+        self.assertEqual(statement.total_between('deposit'), statement.total('deposit'))
+
+    def test_balance_at(self):
+        statement = random_statement(100)
+
+        self.assertEqual(statement.balance_at(START), statement.balances[0])
+        self.assertEqual(statement.balance_at(START + 3600 * 10 + 1), statement.balances[10])
+        self.assertEqual(statement.balance_at(START - 1), 100000)
+        self.assertEqual(statement.balance_after(-1), statement.balances[-1])
+
+    def test_times_stay_sorted(self):
+        statement = AggregatedStatement()
+        statement.append_cents('deposit', 100, 100, 2000.0)
+        statement.append_cents('deposit', 100, 200, 1000.0)
+
+        self.assertEqual(list(statement.timestamps), [2000.0, 2000.0])
+
+    @patch('builtins.print')
+    def test_banking_methods(self, _mock_print):
+        """Deposits and withdrawals keep the aggregates current"""
+        statement = AggregatedStatement(clock=lambda: START)
+        balance, statement = deposit_money(0.0, 1000.0, statement)
+        balance, _, statement = withdraw_money(balance, 0, 600.0, statement)
+
+        self.assertEqual(statement.total('deposit'), 100000)
+        self.assertEqual(statement.total('withdrawal'), 60000)
+        self.assertEqual(statement.min_balance(), 40000)
+        self.assertEqual(statement.balance_at(START), 40000)
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            AggregatedStatement(checkpoint_interval=0)
+        with self.assertRaises(ValueError):
+            AggregatedStatement().append_cents('transfer', 1, 1)
+        with self.assertRaises(ValueError):
+            AggregatedStatement().total('transfer')
+
+        self.assertIsNone(AggregatedStatement().min_balance())
+        self.assertEqual(AggregatedStatement().opening_balance(), 0)
+
+class TestLedgerStatements(unittest.TestCase):
+    """Tests the aggregated statements kept by a `Ledger`"""
+
+    def setUp(self):
+        self.ledger = Ledger(statement_class=AggregatedStatement)
+        self.ledger.open_account(1)
+
+    def test_operations(self):
+        self.ledger.deposit(1, 100000)
+        self.ledger.withdraw(1, 60000)
+        statement = self.ledger.statement(1)
+
+        self.assertIsInstance(statement, AggregatedStatement)
+        self.assertEqual(statement.total('deposit'), 100000)
+        self.assertEqual(statement.total('withdrawal'), 60000)
+        self.assertEqual(statement.min_balance(), 40000)
+
+    def test_merge_account_updates_checkpoints(self):
+        self.ledger.deposit(1, 100000)
+        merged = CompactStatement()
+        balance = 100000
+        for number in range(200):
+            balance += number
+            merged.append_cents('deposit', number, balance)
+
+        self.ledger.merge_account(1, balance, 0, merged)
+        statement = self.ledger.statement(1)
+
+        self.assertEqual(len(statement.prefix[merged.op_codes[0]]),
+                         201 // statement.checkpoint_interval + 1)
+        self.assertEqual(statement.total('deposit'), 100000 + sum(range(200)))
+        self.assertEqual(statement.total('deposit', 1, 101), sum(range(100)))
+        self.assertEqual(statement.max_balance(), balance)
+
+    def test_load_journal_keeps_times(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'journal.bin')
+            with Journal(path, 'close') as journal:
+                journal.append(1, 'deposit', 1000, 1000, START)
+                journal.append(1, 'withdrawal', 600, 400, START + 3600)
+
+            ledger = Ledger(statement_class=AggregatedStatement)
+            ledger.load_journal(path)
+            records = list(read_records(path))
+
+        statement = ledger.statement(1)
+        self.assertEqual(list(statement.timestamps), [record.timestamp for record in records])
+        self.assertEqual(statement.balance_at(START + 1), 1000)
+        self.assertEqual(statement.total_between('withdrawal', START + 1), 600)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Tests for the memory-mapped statement reader (`statement_reader` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import datetime
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+import statement_reader
+from journal import Journal
+from statement_reader import (StatementReader, print_statement_from_journal,
+                              close_statement_readers)
+
+DAY = 24 * 60 * 60
+START = datetime.datetime(2026, 1, 1).timestamp()
+
+class TestStatementReader(unittest.TestCase):
+    """Tests paging, filtering and streaming statements from the journal"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp_dir.name, 'journal.bin')
+
+        # account 1 deposits R$ 1,00 a day, account 2 deposits R$ 2,00 a day
+        with Journal(cls.path, 'close') as journal:
+            for day in range(30):
+                journal.append(1, 'deposit', 100, 100 * (day + 1), START + day * DAY)
+                journal.append(2, 'deposit', 200, 200 * (day + 1), START + day * DAY)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def test_random_access(self):
+        """Records can be read by position, for one or every account"""
+        with StatementReader(self.path) as reader:
+            self.assertEqual(len(reader), 60)
+            self.assertEqual(reader[1].acc_id, 2)
+            self.assertEqual(reader[-1].seq, 60)
+
+        with StatementReader(self.path, acc_id=2) as reader:
+            self.assertEqual(len(reader), 30)
+            self.assertEqual(reader[9].balance_cents, 2000)
+
+    def test_paging(self):
+        """Pages hold `page_size` operations, the last one may be shorter"""
+        with StatementReader(self.path, acc_id=1) as reader:
+            pages = [reader.page(page, page_size=7) for page in range(1, 6)]
+
+        self.assertEqual([len(page) for page in pages], [7, 7, 7, 7, 2])
+        self.assertEqual(pages[1][0].balance_cents, 800)
+        self.assertEqual(sum(pages, []), list(StatementReader(self.path, acc_id=1)
+                                              .iter_records()))
+
+    def test_range_filters(self):
+        """Sequence and date ranges select the right operations"""
+        with StatementReader(self.path, acc_id=1) as reader:
+            by_seq = list(reader.iter_records(start_seq=11, end_seq=21))
+            by_date = list(reader.iter_records(since=datetime.date(2026, 1, 10),
+                                               until=datetime.date(2026, 1, 13)))
+
+        self.assertEqual([r.seq for r in by_seq], [11, 13, 15, 17, 19])
+        self.assertEqual([r.balance_cents for r in by_date], [1000, 1100, 1200])
+
+    def test_stream_statement(self):
+        """Streamed lines use the same format as `print_statement`"""
+        with StatementReader(self.path, acc_id=2) as reader:
+            first_line = next(reader.stream_statement())
+
+        self.assertEqual(first_line, 'Operação: depósito\n'
+                                     'Valor da operação:\tR$ 2.00\n'
+                                     'Saldo após a operação:\tR$ 2.00')
+
+class TestRefresh(unittest.TestCase):
+    """Tests a reader kept open while the journal grows"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'journal.bin')
+        self.journal = Journal(self.path, 'always')
+
+    def tearDown(self):
+        close_statement_readers()
+        self.journal.close()
+        self.tmp_dir.cleanup()
+
+    def test_refresh_extends_the_index(self):
+        with StatementReader(self.path, acc_id=1) as reader:
+            self.assertEqual(len(reader), 0)
+
+            for day in range(3):
+                self.journal.append(1, 'deposit', 100, 100 * (day + 1), START + day * DAY)
+                self.journal.append(2, 'deposit', 200, 200 * (day + 1), START + day * DAY)
+            reader.refresh()
+            self.assertEqual(len(reader), 3)
+
+            self.journal.append(1, 'withdrawal', 50, 250, START + 3 * DAY)
+            reader.refresh()
+
+            with StatementReader(self.path, acc_id=1) as new_reader:
+                self.assertEqual(list(reader.iter_records()), list(new_reader.iter_records()))
+            self.assertEqual(reader[-1].operation_type, 'withdrawal')
+
+    @patch('builtins.print')
+    def test_print_keeps_the_reader(self, mock_print):
+        self.journal.append(1, 'deposit', 100, 100, START)
+        print_statement_from_journal(self.path, 1)
+        reader = statement_reader._readers[(os.path.abspath(self.path), 1)]
+
+        self.journal.append(1, 'deposit', 200, 300, START + DAY)
+        mock_print.reset_mock()
+        print_statement_from_journal(self.path, 1)
+
+        self.assertIs(statement_reader._readers[(os.path.abspath(self.path), 1)], reader)
+        self.assertEqual(mock_print.call_count, 2)
+        self.assertIn('R$ 3.00', mock_print.call_args.args[0])
+
+if __name__ == '__main__':
+    unittest.main()
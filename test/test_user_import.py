@@ -0,0 +1,100 @@
+"""
+Tests for the bulk user importer (`user_import` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import csv
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from user_import import import_users, DUPLICATED_CPF_REASON, INVALID_DATE_REASON
+from user_store import UserStore
+from users import create_user
+
+FIELDS = ['cpf', 'name', 'birth_date', 'address', 'house_number',
+          'neighbourhood', 'city', 'state_uf']
+
+VALID = {'cpf': '529.982.247-25', 'name': 'Maria da Silva', 'birth_date': '15-03-1990',
+         'address': 'Rua A', 'house_number': '10', 'neighbourhood': 'Centro',
+         'city': 'Recife', 'state_uf': 'PE'}
+
+RECORDS = [
+    VALID,
+    {**VALID, 'cpf': '111.444.777-35', 'name': 'João'},
+    {**VALID, 'name': 'Maria repetida'},
+    {**VALID, 'cpf': '111.444.777-36'},
+    {**VALID, 'cpf': '123.456.789'},
+    {**VALID, 'cpf': '714.602.380-01', 'birth_date': '30-02-1990'},
+    {**VALID, 'cpf': '714.602.380-01', 'state_uf': 'XX'},
+    {**VALID, 'cpf': '714.602.380-01'},
+]
+
+class TestUserImport(unittest.TestCase):
+    """Tests importing CSV and JSONL user files"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_users(self, extension: str) -> str:
+        """Writes `RECORDS` to a users file with the given extension"""
+        path = os.path.join(self.tmp_dir.name, f'users.{extension}')
+
+        with open(path, 'w', encoding='utf-8', newline='') as users_file:
+            if extension == 'jsonl':
+                for record in RECORDS:
+                    users_file.write(json.dumps(record) + '\n')
+            else:
+                writer = csv.DictWriter(users_file, FIELDS)
+                writer.writeheader()
+                writer.writerows(RECORDS)
+
+        return path
+
+    def test_import(self):
+        """Valid users are inserted in order, as `create_user` would do"""
+        for extension in ('csv', 'jsonl'):
+            for workers in (1, 2):
+                users, report = import_users(self.write_users(extension), chunk_size=3,
+                                             workers=workers)
+
+                self.assertEqual((report.accepted, report.rejected), (3, 5))
+                self.assertEqual([user['name'] for user in users],
+                                 ['Maria da Silva', 'João', 'Maria da Silva'])
+                self.assertEqual(users[0], create_user([], VALID))
+                self.assertEqual(report.rejections[DUPLICATED_CPF_REASON], 1)
+                self.assertEqual(report.rejections[INVALID_DATE_REASON], 1)
+
+    def test_dedupe_and_rejects_file(self):
+        """CPFs already in the database are refused and reported"""
+        rejects_path = os.path.join(self.tmp_dir.name, 'rejects.csv')
+
+        for database in ([create_user([], VALID)], UserStore([create_user([], VALID)])):
+            users, report = import_users(self.write_users('csv'), database, rejects_path)
+
+            self.assertIs(users, database)
+            self.assertEqual(len(users), 3)
+            self.assertEqual(report.rejections[DUPLICATED_CPF_REASON], 2)
+
+        with open(rejects_path, encoding='utf-8', newline='') as rejects_file:
+            rejects = list(csv.DictReader(rejects_file))
+
+        self.assertEqual([row['line'] for row in rejects], ['2', '4', '5', '6', '7', '8'])
+        self.assertEqual(rejects[2]['cpf'], '111.444.777-36')
+        self.assertIn('Estado brasileiro', rejects[5]['reason'])
+
+if __name__ == '__main__':
+    unittest.main()
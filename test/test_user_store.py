@@ -0,0 +1,109 @@
+"""
+Tests for the indexed user database (`user_store` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from user_store import UserStore
+from users import find_user_in_database
+from helpers import make_user
+
+class TestUserStore(unittest.TestCase):
+    """Tests the `UserStore` container and its indexes"""
+
+    def test_list_compatibility(self):
+        """The store must behave like the old list of dicts"""
+        users = [make_user('52998224725'), make_user('11144477735')]
+        store = UserStore(users)
+
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store, users)
+        self.assertEqual(store[1], users[1])
+        self.assertEqual(list(store), users)
+
+    def test_cpf_index(self):
+        """Lookups by CPF must match the linear scan"""
+        users = [make_user(f'{i:011d}') for i in range(50)]
+        store = UserStore(users)
+
+        for user in users:
+            self.assertEqual(find_user_in_database(store, user['cpf']),
+                             find_user_in_database(users, user['cpf']))
+
+        self.assertEqual(find_user_in_database(store, '99999999999'), [])
+
+    def test_duplicated_cpf(self):
+        """A CPF can only be registered once"""
+        store = UserStore([make_user('52998224725')])
+
+        with self.assertRaises(ValueError):
+            store.append(make_user('52998224725'))
+
+        self.assertEqual(len(store), 1)
+
+    def test_secondary_indexes(self):
+        """The `state_uf` and `city` indexes follow insertions and removals"""
+        store = UserStore([
+            make_user('00000000001', 'Salvador', 'BA'),
+            make_user('00000000002', 'Recife', 'PE'),
+            make_user('00000000003', 'Salvador', 'BA'),
+        ])
+
+        self.assertEqual([u['cpf'] for u in store.find_by_city('Salvador')],
+                         ['00000000001', '00000000003'])
+        self.assertEqual(len(store.find_by_state_uf('PE')), 1)
+
+        del store[0]
+        store[0] = make_user('00000000004', 'Olinda', 'PE')
+
+        self.assertEqual([u['cpf'] for u in store.find_by_city('Salvador')],
+                         ['00000000003'])
+        self.assertEqual(store.find_by_city('Recife'), [])
+        self.assertEqual(len(store.find_by_state_uf('PE')), 1)
+        self.assertFalse(store.has_cpf('00000000001'))
+        self.assertIsNone(store.get('00000000002'))
+
+    def test_bulk_load(self):
+        """`load` builds the same indexes as `extend` and refuses repeated CPFs"""
+        users = [make_user(f'{i:011d}', f'Cidade {i % 3}') for i in range(30)]
+        loaded = UserStore([users[0]])
+        loaded.load(users[1:])
+
+        self.assertEqual(loaded, UserStore(users))
+        self.assertEqual(loaded.find_by_city('Cidade 1'),
+                         UserStore(users).find_by_city('Cidade 1'))
+
+        with self.assertRaises(ValueError):
+            loaded.load([make_user('99999999999'), make_user('00000000005')])
+
+    def test_take_changes(self):
+        """Tracked changes hold the latest user of each CPF, `None` if removed"""
+        store = UserStore([make_user('00000000001')], track_changes=True)
+        store.append(make_user('00000000002'))
+        self.assertEqual(list(store.take_changes()), ['00000000001', '00000000002'])
+
+        store[0] = make_user('00000000001', 'Olinda', 'PE')
+        del store[1]
+
+        self.assertEqual(store.take_changes(), {
+            '00000000001': make_user('00000000001', 'Olinda', 'PE'),
+            '00000000002': None
+        })
+        self.assertEqual(store.take_changes(), {})
+
+        with self.assertRaises(ValueError):
+            UserStore().take_changes()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+Tests for the non-interactive user and account registration
+(`users.create_user` and `account.open_account`).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import datetime
+import os
+import random
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from account import open_account
+from account_registry import AccountRegistry
+from user_store import UserStore
+from users import (create_user, main as register_user, parse_date, validate_uf,
+                   BRAZIL_UF)
+
+RECORD = {'cpf': '529.982.247-25', 'name': 'Maria da Silva', 'birth_date': '15-03-1990',
+          'address': 'Rua A', 'house_number': '10', 'neighbourhood': 'Centro',
+          'city': 'Recife', 'state_uf': 'PE'}
+
+def strptime_date(date_text: str) -> datetime.date | None:
+    """The reference parser, returning `None` for invalid dates"""
+    try:
+        return datetime.datetime.strptime(date_text, "%d-%m-%Y").date()
+    except ValueError:
+        return None
+
+def fast_date(date_text: str) -> datetime.date | None:
+    """`parse_date`, returning `None` for invalid dates"""
+    try:
+        return parse_date(date_text)
+    except ValueError:
+        return None
+
+class TestValidators(unittest.TestCase):
+    """Tests the UF table and the date parser against `strptime`"""
+
+    def test_validate_uf(self):
+        """Only the 27 UFs are valid, with exact case"""
+        self.assertEqual(len(BRAZIL_UF), 27)
+        self.assertTrue(all(validate_uf(uf) for uf in BRAZIL_UF))
+        for user_uf in ('sp', 'XX', 'S', 'SPP', '', None, 35, ['SP']):
+            self.assertFalse(validate_uf(user_uf), user_uf)
+
+    def test_every_day_and_month(self):
+        """Every dd-mm combination, valid or not, parses like `strptime`"""
+        for year in (1900, 1990, 2000, 2024, 2100, 1, 9999, 0):
+            for month in range(0, 14):
+                for day in range(0, 33):
+                    date_text = f'{day:02d}-{month:02d}-{year:04d}'
+                    self.assertEqual(fast_date(date_text), strptime_date(date_text),
+                                     date_text)
+
+    def test_other_shapes(self):
+        """Dates outside the fast path still match `strptime`"""
+        for date_text in ('1-3-1990', '01-3-1990', '1-03-1990', '15/03/1990', '15-03-90',
+                          '15-03-19900', ' 15-03-1990', '15-03-1990 ', '1a-03-1990',
+                          '+1-03-1990', '15-03-199٠', '１5-03-1990', '', '--------',
+                          '15-03-+990', '15-03- 990', '15--3-1990', '1503-1990'):
+            self.assertEqual(fast_date(date_text), strptime_date(date_text),
+                             repr(date_text))
+
+    def test_random_strings(self):
+        """Random strings over the date's alphabet match `strptime`"""
+        rng = random.Random(7)
+        alphabet = '0123456789-- /'
+
+        for _ in range(20000):
+            date_text = ''.join(rng.choice(alphabet) for _ in range(rng.randrange(6, 12)))
+            self.assertEqual(fast_date(date_text), strptime_date(date_text),
+                             repr(date_text))
+
+class TestCreateUser(unittest.TestCase):
+    """Tests `create_user` and the interactive flow built on it"""
+
+    def test_create_user(self):
+        """A valid record is inserted with the same fields as `users.main`"""
+        for database in ([], UserStore()):
+            user = create_user(database, RECORD)
+
+            self.assertEqual(list(database), [user])
+            self.assertEqual(user['cpf'], '52998224725')
+            self.assertEqual(user['birth_date'], datetime.date(1990, 3, 15))
+            self.assertEqual(user['full_address'], 'Rua A - 10 - Centro - Recife/PE')
+
+    def test_invalid_records(self):
+        """Invalid records are refused and nothing is inserted"""
+        database = [create_user([], RECORD)]
+
+        for field, value in (('cpf', '529.982.247-25'), ('cpf', '529.982.247-26'),
+                             ('cpf', '123'), ('cpf', None), ('cpf', 11144477735),
+                             ('birth_date', '31-02-1990'), ('birth_date', None),
+                             ('state_uf', 'XX'), ('state_uf', 'PER'), ('state_uf', None)):
+            with self.subTest(field=field, value=value):
+                with self.assertRaises(ValueError):
+                    create_user(database, {**RECORD, 'cpf': '111.444.777-35',
+                                           field: value})
+
+        with self.assertRaises(KeyError):
+            create_user(database, {'cpf': '111.444.777-35'})
+
+        self.assertEqual(len(database), 1)
+
+    @patch('builtins.print')
+    @patch('builtins.input', side_effect=['529.982.247-25', 'Maria da Silva', '15-03-1990',
+                                          'Rua A', '10', 'Centro', 'Recife', 'PE'])
+    def test_interactive_flow(self, _mock_input, _mock_print):
+        """`users.main` builds the same user as `create_user`"""
+        self.assertEqual(register_user([]), [create_user([], RECORD)])
+
+class TestOpenAccount(unittest.TestCase):
+    """Tests `open_account`"""
+
+    def test_open_account(self):
+        """Accounts are opened for registered users only"""
+        users = UserStore([create_user([], RECORD)])
+
+        for accounts in ([], AccountRegistry()):
+            account = open_account(users, accounts, '529.982.247-25', '0002')
+
+            self.assertEqual(account, {'id': 1, 'agency': '0002', 'user': '52998224725'})
+            self.assertEqual(open_account(users, accounts, '529.982.247-25')['id'], 2)
+
+            with self.assertRaises(ValueError):
+                open_account(users, accounts, '111.444.777-35')
+
+    def test_cpf_with_or_without_punctuation(self):
+        users = UserStore([create_user([], RECORD)])
+        accounts = AccountRegistry()
+
+        for cpf in ('529.982.247-25', '52998224725'):
+            self.assertEqual(open_account(users, accounts, cpf)['user'], '52998224725')
+
+        for cpf in ('529.982.247-26', '52998224726', '11144477735'):
+            with self.assertRaises(ValueError):
+                open_account(users, accounts, cpf)
+        with self.assertRaises(ValueError):
+            open_account(users, accounts, '5299822472')
+        with self.assertRaises(ValueError):
+            open_account(users, accounts, None)
+
+    def test_create_user_with_bare_cpf(self):
+        """`create_user` accepts the same CPF shapes as `open_account`"""
+        users = UserStore([create_user([], {**RECORD, 'cpf': '52998224725'})])
+
+        self.assertTrue(users.has_cpf('52998224725'))
+        with self.assertRaisesRegex(ValueError, 'já existe'):
+            create_user(users, RECORD)
+
+if __name__ == '__main__':
+    unittest.main()
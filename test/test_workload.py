@@ -0,0 +1,105 @@
+"""
+Tests for the synthetic workload generator (`workload` module).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import os
+import random
+import sys
+import tempfile
+import unittest
+from collections import Counter
+
+sys.path.insert(
+    0, os.path.abspath(
+        os.path.join(os.path.dirname(__file__),'..')
+    )
+)
+
+from batch import settle_file
+from cpf_validator import main as validate_cpf
+from ledger import Ledger
+from user_import import import_users
+from users import create_user
+from workload import Workload, generate_cpf, generate_operations
+
+class TestWorkload(unittest.TestCase):
+    """Tests the generated users, accounts and operations"""
+
+    def test_valid_cpfs(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            self.assertTrue(validate_cpf(generate_cpf(rng)))
+
+    def test_users_are_valid(self):
+        workload = Workload(seed=3, users=300, operations=0)
+        user_arr = []
+
+        for record in workload.users:
+            create_user(user_arr, record)
+
+        self.assertEqual(len(user_arr), 300)
+
+    def test_deterministic(self):
+        first = Workload(seed=7, users=50, operations=2000, max_accounts_per_user=3)
+        second = Workload(seed=7, users=50, operations=2000, max_accounts_per_user=3)
+        other = Workload(seed=8, users=50, operations=2000, max_accounts_per_user=3)
+
+        self.assertEqual(first.users, second.users)
+        self.assertEqual(first.account_owners, second.account_owners)
+        self.assertEqual(list(first.operations()), list(second.operations()))
+        self.assertEqual(list(first.operations()), list(first.operations()))
+        self.assertNotEqual(first.users, other.users)
+
+    def test_accounts_per_user(self):
+        workload = Workload(seed=5, users=200, operations=0, max_accounts_per_user=3)
+        per_user = Counter(workload.account_owners)
+
+        self.assertEqual(set(per_user), {user['cpf'] for user in workload.users})
+        self.assertEqual(set(per_user.values()), {1, 2, 3})
+
+    def test_zipf_skew(self):
+        rng = random.Random(11)
+        operations = list(generate_operations(rng, 1000, 20000, skew=1.1,
+                                              withdrawal_ratio=0.3, days=4))
+        counts = Counter(operation.acc_id for operation in operations)
+
+        self.assertGreater(counts.most_common(1)[0][1], 20 * len(operations) / 1000)
+        self.assertTrue(all(1 <= acc_id <= 1000 for acc_id in counts))
+        self.assertAlmostEqual(sum(operation.operation_type == 'withdrawal'
+                                   for operation in operations) / len(operations), 0.3,
+                               delta=0.02)
+        self.assertEqual([operation.day for operation in operations],
+                         sorted(operation.day for operation in operations))
+        self.assertEqual({operation.day for operation in operations}, {0, 1, 2, 3})
+
+        uniform = Counter(operation.acc_id for operation in
+                          generate_operations(random.Random(11), 1000, 20000, skew=0))
+        self.assertLess(uniform.most_common(1)[0][1], counts.most_common(1)[0][1] / 5)
+
+    def test_write(self):
+        workload = Workload(seed=2, users=40, operations=500, max_accounts_per_user=2)
+
+        with tempfile.TemporaryDirectory() as directory:
+            users_path, operations_path = workload.write(directory)
+
+            user_arr, report = import_users(users_path)
+            ledger = Ledger()
+            for acc_id in range(1, len(workload.account_owners) + 1):
+                ledger.open_account(acc_id)
+            batch_report = settle_file(operations_path, ledger)
+
+        self.assertEqual(report.accepted, 40)
+        self.assertEqual(len(user_arr), 40)
+        self.assertEqual(batch_report.total, 500)
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            list(generate_operations(random.Random(), 0, 10))
+        with self.assertRaises(ValueError):
+            Workload(users=10, operations=10, max_accounts_per_user=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+"""
+This module contains the bulk user importer, used to load the users of
+a partner bank from a CSV (with header) or JSONL file.
+
+The file is streamed in chunks: each chunk's CPFs are validated at once
+with `cpf_validator.validate_many`, then the birth dates and UFs, and
+the valid users are inserted in the user database in input order.
+CPFs already in the database (or repeated in the file) are refused
+through the database's CPF index. Every refused record is written to an
+optional rejects CSV, with the reason, and counted in the report.
+
+With more than one worker, the chunks are validated in a process pool
+while the main process inserts the users of the chunks already done.
+
+Usage:
+    python user_import.py users.csv [--rejects rejects.csv]
+                          [--chunk-size 10000] [--workers 1]
+                          [--profile [PREFIX]] [--profile-top 20]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import argparse
+import csv
+import json
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Iterator
+
+from batch import BatchReport
+from cpf_validator import validate_many, remove_punctuation_from_cpf as format_cpf
+from profiling import add_profile_arguments, profile_session
+from storage import UserStorage
+from user_store import UserStore
+from users import make_user, parse_birth_date, check_state_uf
+
+REJECT_COLUMNS = ['line', 'cpf', 'reason']
+DUPLICATED_CPF_REASON = 'um usuário com este CPF já existe na base de dados.'
+INVALID_DATE_REASON = 'a data de nascimento é inválida.'
+
+class ImportReport(BatchReport):
+    """Counters of a user import; `accepted` is the number of users inserted"""
+    PROCESSED_LABEL = 'Usuários processados'
+    RATE_LABEL = 'usuários/s'
+
+def read_user_records(path: str) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Streams (line number, record) pairs from a CSV (with header) or JSONL
+    file; the format is picked by the file extension. Unreadable JSON
+    lines become empty records, which are then refused.
+
+    Params:
+    @path: the users file
+    """
+    with open(path, encoding='utf-8', newline='') as users_file:
+        if path.endswith(('.jsonl', '.ndjson')):
+            for line, raw in enumerate(users_file, start=1):
+                if not raw.strip():
+                    continue
+                try:
+                    record = json.loads(raw)
+                except json.JSONDecodeError:
+                    record = {}
+                yield line, record if isinstance(record, dict) else {}
+        else:
+            reader = csv.reader(users_file)
+            header = next(reader, [])
+
+            for line, row in enumerate(reader, start=2):
+                if row:
+                    yield line, dict(zip(header, row))
+
+def validate_records(chunk: list[tuple[int, dict[str, Any]]]) -> list[tuple]:
+    """
+    Validates a chunk of records, without looking at the user database.
+
+    Returns one (line, CPF, user, reason) tuple per record: `user` is the
+    dict to be inserted and `reason` is `None` for valid records; invalid
+    ones have `user` set to `None` and the rejection reason instead.
+    """
+    cpf_reasons = validate_many((record.get('cpf', '') for _, record in chunk),
+                                with_reasons=True)
+    results = []
+
+    for (line, record), reason in zip(chunk, cpf_reasons):
+        user = None
+
+        if reason is None:
+            try:
+                user_birth_date = parse_birth_date(record['birth_date'])
+            except KeyError as e:
+                reason = f'o campo {e} é obrigatório.'
+            except (TypeError, ValueError):
+                reason = INVALID_DATE_REASON
+
+        if reason is None:
+            try:
+                user_uf = check_state_uf(record['state_uf'])
+                user = make_user(record, format_cpf(record['cpf']), user_birth_date, user_uf)
+            except KeyError as e:
+                reason = f'o campo {e} é obrigatório.'
+            except (TypeError, ValueError) as e:
+                reason = str(e)
+
+        results.append((line, record.get('cpf', None), user, reason))
+
+    return results
+
+def _validated_chunks(records: Iterator[tuple[int, dict[str, Any]]], chunk_size: int,
+                      workers: int) -> Iterator[list[tuple]]:
+    """
+    Yields the validated chunks in input order, validating up to two
+    chunks per worker ahead in a process pool when `workers` > 1.
+    """
+    chunks = iter(lambda: list(islice(records, chunk_size)), [])
+
+    if workers <= 1:
+        yield from map(validate_records, chunks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque(pool.submit(validate_records, chunk)
+                        for chunk in islice(chunks, workers * 2))
+
+        while pending:
+            validated = pending.popleft().result()
+            for chunk in islice(chunks, 1):
+                pending.append(pool.submit(validate_records, chunk))
+            yield validated
+
+def import_users(input_path: str, user_arr: list | None = None,
+                 rejects_path: str | None = None, chunk_size: int = 10000,
+                 workers: int = 1) -> tuple[list, ImportReport]:
+    """
+    Imports the users of a CSV or JSONL file, returning the user database
+    and the report.
+
+    Params:
+    @input_path: the users file, with the same fields as `users.create_user`
+    @user_arr: the user database (a new `UserStore` if not given)
+    @rejects_path: optional CSV where the refused records are written
+    @chunk_size: number of records validated at a time
+    @workers: number of processes validating the chunks
+    """
+    if user_arr is None:
+        user_arr = UserStore()
+
+    if isinstance(user_arr, UserStorage):
+        has_cpf = user_arr.has_cpf
+        known_cpfs = None
+    else:
+        known_cpfs = {user.get('cpf', None) for user in user_arr}
+        has_cpf = known_cpfs.__contains__
+
+    report = ImportReport()
+    rejects_file = writer = None
+
+    if rejects_path is not None:
+        rejects_file = open(rejects_path, 'w', encoding='utf-8', newline='',
+                            buffering=1024 * 1024)
+        writer = csv.writer(rejects_file)
+        writer.writerow(REJECT_COLUMNS)
+
+    start = time.perf_counter()
+    records = read_user_records(input_path)
+
+    try:
+        for chunk in _validated_chunks(records, chunk_size, workers):
+            accepted = {}
+            rejects = []
+
+            for line, user_cpf, user, reason in chunk:
+                if reason is None and (user['cpf'] in accepted or has_cpf(user['cpf'])):
+                    reason = DUPLICATED_CPF_REASON
+
+                if reason is None:
+                    accepted[user['cpf']] = user
+                else:
+                    report.rejected += 1
+                    report.rejections[reason] += 1
+                    rejects.append((line, user_cpf, reason))
+
+            # one insert per chunk, so databases such as the SQLite one
+            # can batch it
+            user_arr.extend(accepted.values())
+            report.accepted += len(accepted)
+            if known_cpfs is not None:
+                known_cpfs.update(accepted)
+
+            if writer is not None:
+                writer.writerows(rejects)
+    finally:
+        report.elapsed = time.perf_counter() - start
+        if rejects_file is not None:
+            rejects_file.close()
+
+    return user_arr, report
+
+def main(argv: list[str] | None = None):
+    """
+    Runs the import from the command line, printing the report
+    """
+    parser = argparse.ArgumentParser(description='Importação em lote de usuários')
+    parser.add_argument('input', help='arquivo CSV ou JSONL com os usuários')
+    parser.add_argument('--rejects', help='arquivo CSV onde os registros recusados são gravados')
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='número de processos que validam os registros')
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profile_session(args.profile, args.profile_top):
+        _, report = import_users(args.input, rejects_path=args.rejects,
+                                 chunk_size=args.chunk_size, workers=args.workers)
+
+    print(report.summary())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+"""
+This module contains the `UserStore`, an indexed container for the
+bank's users.
+
+It behaves like the plain `list` of user dicts used across the app
+(iteration, `len`, indexing, `append`), but keeps a CPF-keyed index
+and secondary indexes on `state_uf` and `city`, so lookups don't need
+to scan the whole user database.
+
+When change tracking is on, the store also remembers which CPFs were
+added, replaced or removed since the last `take_changes`, so a
+checkpoint only needs to save those (see `checkpoint`).
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+from collections.abc import MutableSequence
+from typing import Any, Iterable
+
+from storage import UserStorage
+
+class UserStore(MutableSequence, UserStorage):
+    """
+    List-compatible user database with hash indexes.
+
+    Users are kept in insertion order, just like the old list, and every
+    mutation keeps the indexes in sync. A CPF can only be stored once.
+
+    Params:
+    @users: optional iterable of user dicts to load into the store
+    @track_changes: if `True`, changes are recorded for `take_changes`
+    """
+
+    def __init__(self, users: Iterable[dict[str, Any]] = (), track_changes: bool = False):
+        self._users: list[dict[str, Any]] = []
+        self._by_cpf: dict[str, dict[str, Any]] = {}
+        self._by_state_uf: dict[str, list[dict[str, Any]]] = {}
+        self._by_city: dict[str, list[dict[str, Any]]] = {}
+        self._changes: dict[str, dict[str, Any] | None] | None = (
+            {} if track_changes else None)
+
+        self.extend(users)
+
+    def _index(self, user: dict[str, Any]):
+        """Adds the user to every index, refusing duplicated CPFs"""
+        cpf = user.get('cpf', None)
+
+        if cpf in self._by_cpf:
+            raise ValueError('um usuário com este CPF já existe na base de dados.')
+
+        self._by_cpf[cpf] = user
+        self._by_state_uf.setdefault(user.get('state_uf', None), []).append(user)
+        self._by_city.setdefault(user.get('city', None), []).append(user)
+
+        if self._changes is not None:
+            self._changes[cpf] = user
+
+    def _unindex(self, user: dict[str, Any]):
+        """Removes the user from every index"""
+        cpf = user.get('cpf', None)
+        del self._by_cpf[cpf]
+
+        if self._changes is not None:
+            self._changes[cpf] = None
+
+        for index, key in ((self._by_state_uf, user.get('state_uf', None)),
+                           (self._by_city, user.get('city', None))):
+            bucket = index[key]
+            bucket.remove(user)
+            if not bucket:
+                del index[key]
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def __getitem__(self, position):
+        return self._users[position]
+
+    def __setitem__(self, position, user):
+        if isinstance(position, slice):
+            raise TypeError('o UserStore não aceita atribuição por fatias.')
+
+        old_user = self._users[position]
+        self._unindex(old_user)
+
+        try:
+            self._index(user)
+        except ValueError:
+            self._index(old_user)
+            raise
+
+        self._users[position] = user
+
+    def __delitem__(self, position):
+        if isinstance(position, slice):
+            for user in self._users[position]:
+                self._unindex(user)
+        else:
+            self._unindex(self._users[position])
+
+        del self._users[position]
+
+    def __iter__(self):
+        return iter(self._users)
+
+    def __contains__(self, user) -> bool:
+        if isinstance(user, dict):
+            return self._by_cpf.get(user.get('cpf', None)) is user
+        return False
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, UserStore):
+            return self._users == other._users
+        if isinstance(other, list):
+            return self._users == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'UserStore({self._users!r})'
+
+    def insert(self, index: int, value: dict[str, Any]):
+        self._index(value)
+        self._users.insert(index, value)
+
+    def append(self, value: dict[str, Any]):
+        self._index(value)
+        self._users.append(value)
+
+    def get(self, user_cpf: str) -> dict[str, Any] | None:
+        """
+        Returns the user with the given CPF (numbers only), or `None`.
+
+        Params:
+        @user_cpf: the CPF, without punctuation
+        """
+        return self._by_cpf.get(user_cpf, None)
+
+    def has_cpf(self, user_cpf: str) -> bool:
+        """Checks if a user with the given CPF (numbers only) exists"""
+        return user_cpf in self._by_cpf
+
+    def find_by_state_uf(self, state_uf: str) -> list[dict[str, Any]]:
+        """Returns every user living in the given state UF"""
+        return list(self._by_state_uf.get(state_uf, []))
+
+    def find_by_city(self, city: str) -> list[dict[str, Any]]:
+        """Returns every user living in the given city"""
+        return list(self._by_city.get(city, []))
+
+    def load(self, users: list[dict[str, Any]]):
+        """
+        Appends many users at once, building the indexes in bulk, which
+        is much faster than `extend` for large loads (e.g. a snapshot).
+        Repeated CPFs are refused, like in `append`.
+
+        Params:
+        @users: list of user dicts
+        """
+        by_cpf = dict(zip([user.get('cpf', None) for user in users], users))
+
+        if len(by_cpf) != len(users) or not self._by_cpf.keys().isdisjoint(by_cpf):
+            # let `extend` raise on the first repeated CPF
+            self.extend(users)
+            return
+
+        self._users.extend(users)
+        self._by_cpf.update(by_cpf)
+
+        for index, key in ((self._by_state_uf, 'state_uf'), (self._by_city, 'city')):
+            for user in users:
+                bucket = index.get(user.get(key, None))
+                if bucket is None:
+                    bucket = index[user.get(key, None)] = []
+                bucket.append(user)
+
+        if self._changes is not None:
+            self._changes.update(by_cpf)
+
+    def take_changes(self) -> dict[str, dict[str, Any] | None]:
+        """
+        Returns the users changed since the last call, keyed by CPF (`None`
+        for removed users), and starts recording again. Changes made by
+        editing a stored user dict in place aren't seen.
+        """
+        if self._changes is None:
+            raise ValueError('o UserStore não está registrando alterações.')
+
+        changes, self._changes = self._changes, {}
+        return changes
@@ -6,24 +6,73 @@ This module contains the methods related to user CRUD
 """
 
 import datetime
-from cpf_validator import main as verify_cpf, remove_punctuation_from_cpf as format_cpf
+from typing import Any
+from cpf_validator import (verify_cpf_fast as verify_cpf, remove_punctuation_from_cpf as format_cpf,
+                           normalize_cpf, INVALID_DIGITS_REASON)
+from errors import InvalidCPFError
+from storage import UserStorage
+from renderers import render_users
+from metrics import instrument
+
+BRAZIL_UF = frozenset({
+    "AC", "AL", "AP", "AM", "BA", "CE", "DF", "ES", "GO", "MA",
+    "MT", "MS", "MG", "PA", "PB", "PR", "PE", "PI", "RJ", "RN",
+    "RS", "RO", "RR", "SC", "SP", "SE", "TO"
+})
 
 def validate_uf(user_uf: str) -> bool:
     """
     Checks if the UF input is valid and returns `True` if yes, `False` if no.
 
     Params:
+    @user_uf: the state UF, such as 'SP'
+    """
+    return isinstance(user_uf, str) and user_uf in BRAZIL_UF
+
+def parse_date(date_text: str) -> datetime.date:
+    """
+    Converts a date in the dd-mm-aaaa format to a `datetime.date`, with
+    the same results as `datetime.datetime.strptime(date_text, "%d-%m-%Y")`,
+    raising `ValueError` for invalid dates.
 
+    Dates with two-digit day and month and a four-digit year are sliced
+    straight into `datetime.date`; anything else (e.g. '1-3-1990') goes
+    through `strptime`.
+
+    Params:
+    @date_text: the date, such as '15-03-1990'
     """
-    brazil_uf = [
-        "AC", "AL", "AP", "AM", "BA", "CE", "DF", "ES", "GO", "MA",
-        "MT", "MS", "MG", "PA", "PB", "PR", "PE", "PI", "RJ", "RN",
-        "RS", "RO", "RR", "SC", "SP", "SE", "TO"
-    ]
+    if (len(date_text) == 10 and date_text[2] == '-' and date_text[5] == '-'
+            and date_text.isascii()):
+        day, month, year = date_text[:2], date_text[3:5], date_text[6:]
 
-    if user_uf in brazil_uf:
-        return True
-    return False
+        if day.isdigit() and month.isdigit() and year.isdigit():
+            return datetime.date(int(year), int(month), int(day))
+
+    return datetime.datetime.strptime(date_text, "%d-%m-%Y").date()
+
+def parse_birth_date(user_birth_date: str | datetime.date) -> datetime.date:
+    """
+    Converts a birth date in the dd-mm-aaaa format to a `datetime.date`,
+    raising `ValueError` if it's invalid.
+    """
+    if isinstance(user_birth_date, datetime.date):
+        return user_birth_date
+    if not isinstance(user_birth_date, str):
+        raise ValueError('a data de nascimento deve estar no formato dd-mm-aaaa.')
+
+    return parse_date(user_birth_date)
+
+def check_state_uf(user_uf: str) -> str:
+    """
+    Returns the state UF if it's valid, raising `ValueError` if not.
+    """
+    if not isinstance(user_uf, str) or len(user_uf) != 2:
+        raise ValueError('UF deve conter dois caracteres')
+    if not validate_uf(user_uf):
+        raise ValueError('os caracteres inseridos não correspondem a nenhum '
+                            'Estado brasileiro')
+    return user_uf
 
 def register_birth_date() -> datetime.date:
     """
@@ -32,9 +81,7 @@ def register_birth_date() -> datetime.date:
     """
     while True:
         try:
-            user_birth_date = input("Informe a data de nascimento (dd-mm-aaaa): ")
-            user_birth_date = datetime.datetime.strptime(user_birth_date, "%d-%m-%Y").date()
-            return user_birth_date
+            return parse_birth_date(input("Informe a data de nascimento (dd-mm-aaaa): "))
 
         except ValueError as e:
             print(f'ValueError: a data inserida é inválida!\n{e}')
@@ -46,26 +93,94 @@ def register_state_uf() -> str:
     """
     while True:
         try:
-            user_uf = input('Informe o Estado de residência (UF, apenas dois caracteres): ')
-            uf_is_valid = validate_uf(user_uf)
-            if len(user_uf) != 2:
-                raise ValueError('UF deve conter dois caracteres')
-            if not uf_is_valid:
-                raise ValueError('os caracteres inseridos não correspondem a nenhum '
-                                    'Estado brasileiro')
-            return user_uf
+            return check_state_uf(
+                input('Informe o Estado de residência (UF, apenas dois caracteres): '))
         except ValueError as e:
             print(f'ValueError: {e}')
 
+@instrument('find_user_in_database')
 def find_user_in_database(user_arr: list, user_cpf: str):
     """
     Finds the user's data in the user list database
+
+    When `user_arr` is a `UserStorage` (such as the `UserStore`), the CPF
+    index is used instead of scanning the whole list.
     """
 
+    if isinstance(user_arr, UserStorage):
+        user = user_arr.get(user_cpf)
+        return [user] if user is not None else []
+
     found_user = [user for user in user_arr if user.get('cpf', None) == user_cpf]
 
     return found_user if found_user else []
 
+def check_new_user_cpf(user_arr: list, user_cpf: str) -> str:
+    """
+    Validates the CPF of a user being registered (with or without
+    punctuation, like `account.open_account`) and returns it without
+    punctuation, raising `ValueError` if it's invalid or already registered.
+    """
+    user_cpf = normalize_cpf(user_cpf)
+
+    if not verify_cpf(user_cpf):
+        raise InvalidCPFError(INVALID_DIGITS_REASON)
+
+    user_cpf = format_cpf(user_cpf)
+
+    if len(find_user_in_database(user_arr, user_cpf)) > 0:
+        # if a list is returned, then, user exists:
+        raise ValueError('um usuário com este CPF já existe na base de dados.')
+
+    return user_cpf
+
+def make_user(record: dict[str, Any], user_cpf: str, user_birth_date: datetime.date,
+              user_uf: str) -> dict[str, Any]:
+    """
+    Builds the user dict stored in the user database from a record whose
+    CPF, birth date and UF were already validated.
+    """
+    user_address = record['address']
+    user_house_number = record['house_number']
+    user_neighbourhood = record['neighbourhood']
+    user_city = record['city']
+
+    return {
+        'cpf': user_cpf,
+        'name': record['name'],
+        'birth_date': user_birth_date,
+        'house_number': user_house_number,
+        'address': user_address,
+        'neighbourhood': user_neighbourhood,
+        'city': user_city,
+        'state_uf': user_uf,
+        'full_address': (f'{user_address} - {user_house_number}'
+                         f' - {user_neighbourhood} - '
+                         f'{user_city}/{user_uf}')
+    }
+
+def create_user(user_arr: list, record: dict[str, Any]) -> dict[str, Any]:
+    """
+    Validates a user record and inserts it in the user database, without
+    any terminal I/O. Returns the inserted user; invalid records raise
+    `ValueError` (a missing field raises `KeyError`).
+
+    Params:
+    @user_arr: the list (or `UserStore`) used as user database
+    @record: the user's `cpf`, `name`, `birth_date` (dd-mm-aaaa or a
+    `datetime.date`), `address`, `house_number`, `neighbourhood`, `city`
+    and `state_uf`
+    """
+    user_cpf = check_new_user_cpf(user_arr, record['cpf'])
+    user_birth_date = parse_birth_date(record['birth_date'])
+    user_uf = check_state_uf(record['state_uf'])
+
+    user = make_user(record, user_cpf, user_birth_date, user_uf)
+
+    user_arr.append(user)
+
+    return user
+
 def main(user_arr: list):
     """
     When triggered, starts the process of banking user creation, asking the user
@@ -78,7 +193,7 @@ def main(user_arr: list):
 
     If the CPF is not in the database, the user can follow the registration flow.
     The function validates the date and UF input to ensure no invalid values are
-    inserted to the database.
+    inserted to the database. The user is inserted by `create_user`.
 
     Params:
     @user_arr: the list used as user database
@@ -88,61 +203,28 @@ def main(user_arr: list):
         try:
             user_cpf = input("Insira o CPF do usuário que deseja cadastrar: ")
             print(user_cpf)
-            is_valid = verify_cpf(user_cpf)
-
-            if is_valid:
-                user_cpf = format_cpf(user_cpf)
-                find_user = find_user_in_database(user_arr, user_cpf)
-
-                if len(find_user) > 0:
-                    # if a list is returned, then, user exists:
-                    raise ValueError('um usuário com este CPF já existe na base de dados.')
-
-                user_name = input("Informe o nome completo: ")
-
-                user_birth_date = register_birth_date()
-
-                user_address = input("informe o logradouro de residência: ")
-                user_house_number = input("Informe o número da casa: ")
-                user_neighbourhood = input("Informe o bairro de residência: ")
-                user_city = input("Informe a cidade de residência: ")
-
-                user_uf = register_state_uf()
-
-                user_arr.append(
-                    {
-                        'cpf': user_cpf,
-                        'name': user_name,
-                        'birth_date': user_birth_date,
-                        'house_number': user_house_number,
-                        'address': user_address,
-                        'neighbourhood': user_neighbourhood,
-                        'city': user_city,
-                        'state_uf': user_uf,
-                        'full_address': (f'{user_address} - {user_house_number}'
-                                         f' - {user_neighbourhood} - '
-                                         f'{user_city}/{user_uf}')
-                    }
-                )
-
-                print("Usuário cadastrado com sucesso!")
-                return user_arr
+            check_new_user_cpf(user_arr, user_cpf)
+
+            create_user(user_arr, {
+                'cpf': user_cpf,
+                'name': input("Informe o nome completo: "),
+                'birth_date': register_birth_date(),
+                'address': input("informe o logradouro de residência: "),
+                'house_number': input("Informe o número da casa: "),
+                'neighbourhood': input("Informe o bairro de residência: "),
+                'city': input("Informe a cidade de residência: "),
+                'state_uf': register_state_uf()
+            })
+
+            print("Usuário cadastrado com sucesso!")
+            return user_arr
 
         except Exception as e:
             print(e)
 
 def print_user_list(user_database: list):
     """
-    Prints the user's data on the terminal with adequate formatting
+    Prints the user's data on the terminal with adequate formatting,
+    streaming it through `renderers.render_users`
     """
-
-    if len(user_database) > 0:
-        formatted_user_database = [
-            f'Nome:\t{ext.get("name", "Sem nome")}\n'
-            f'CPF:\t{ext.get("cpf", "Sem CPF")}\n'
-            f'Endereço:\t{ext.get("full_address", "Sem endereço")}'
-            for ext in user_database
-        ]
-        print('\n'.join(formatted_user_database))
-    else:
-        print('Nenhum usuário cadastrado até o momento')
+    render_users(user_database)
@@ -0,0 +1,264 @@
+"""
+This module contains the synthetic workload generator: from a seed, it
+builds the same users, accounts and stream of deposits and withdrawals
+every time, so scaling tests can be repeated and compared.
+
+- Users have valid CPFs (check digits computed with the `cpf_validator`
+  functions, and no CPF repeated), valid UFs and birth dates, in the
+  records `users.create_user` takes.
+- Each user opens one to `max_accounts_per_user` accounts; the accounts
+  get the IDs 1, 2, ... in the order they are opened, as handed out by
+  the `AccountRegistry`.
+- The operations pick their account from a Zipf distribution (the
+  k-th most active account is chosen with weight 1 / k ** skew), so a few
+  accounts concentrate most of the traffic; which accounts are the most
+  active is itself random. Amounts are log-normal, and some withdrawals
+  fall below the minimum, as they would at a real counter.
+
+The workload can be written as a users CSV (for `user_import.py`) and an
+operations CSV (for `batch.py`), or replayed in memory (see `replay`).
+
+Usage:
+    python workload.py output_dir [--seed 42] [--users 10000] [--operations 1000000]
+                       [--max-accounts-per-user 1] [--skew 1.1]
+                       [--withdrawal-ratio 0.3] [--days 1]
+
+@author: Beatriz (beabea)
+@date: 2026-10-18
+"""
+
+import argparse
+import csv
+import datetime
+import math
+import os
+import random
+from itertools import accumulate
+from typing import Any, Iterator, NamedTuple
+
+from cpf_validator import multiply_from_arr, generate_verification_digit
+from money import format_cents
+from users import BRAZIL_UF
+
+DEFAULT_SEED = 42
+DEFAULT_SKEW = 1.1
+DEFAULT_WITHDRAWAL_RATIO = 0.3
+SAMPLE_CHUNK = 65536 # accounts drawn at once from the Zipf distribution
+
+FIRST_NAMES = ('Ana', 'Beatriz', 'Carlos', 'Daniela', 'Eduardo', 'Fernanda', 'Gabriel',
+               'Helena', 'Igor', 'Joana', 'Lucas', 'Mariana', 'Pedro', 'Rafaela', 'Tiago')
+LAST_NAMES = ('Almeida', 'Barbosa', 'Carvalho', 'Costa', 'Ferreira', 'Gomes', 'Lima',
+              'Oliveira', 'Pereira', 'Ribeiro', 'Rodrigues', 'Santos', 'Silva', 'Souza')
+STREETS = ('Rua das Flores', 'Avenida Brasil', 'Rua São João', 'Avenida Paulista',
+           'Rua XV de Novembro', 'Rua da Aurora', 'Avenida Sete de Setembro')
+NEIGHBOURHOODS = ('Centro', 'Boa Vista', 'Jardim América', 'Vila Nova', 'Santa Cecília')
+STATE_UFS = tuple(sorted(BRAZIL_UF))
+FIRST_BIRTH_DAY = datetime.date(1940, 1, 1).toordinal()
+LAST_BIRTH_DAY = datetime.date(2008, 12, 31).toordinal()
+
+# medians of the log-normal amounts, in cents, and their spread
+DEPOSIT_MEDIAN = 20000
+WITHDRAWAL_MEDIAN = 80000
+AMOUNT_SIGMA = 0.9
+
+class Operation(NamedTuple):
+    """A deposit or withdrawal of the workload; `day` starts at 0"""
+    day: int
+    acc_id: int
+    operation_type: str
+    value: int
+
+def generate_cpf(rng: random.Random) -> str:
+    """Returns a random CPF with valid check digits, in the XXX.XXX.XXX-XX format"""
+    digits = [rng.randrange(10) for _ in range(9)]
+    digits.append(generate_verification_digit(multiply_from_arr(digits)))
+    digits.append(generate_verification_digit(multiply_from_arr(digits)))
+
+    cpf = ''.join(map(str, digits))
+    return f'{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}'
+
+def generate_users(rng: random.Random, amount: int) -> list[dict[str, Any]]:
+    """
+    Returns `amount` user records, with distinct CPFs, as taken by
+    `users.create_user`.
+
+    Params:
+    @rng: the seeded random generator
+    @amount: number of users
+    """
+    cpfs = set()
+    users = []
+
+    while len(users) < amount:
+        cpf = generate_cpf(rng)
+        if cpf in cpfs:
+            continue
+        cpfs.add(cpf)
+
+        birth_date = datetime.date.fromordinal(rng.randint(FIRST_BIRTH_DAY, LAST_BIRTH_DAY))
+        users.append({
+            'cpf': cpf,
+            'name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'birth_date': birth_date.strftime('%d-%m-%Y'),
+            'address': rng.choice(STREETS),
+            'house_number': str(rng.randint(1, 3000)),
+            'neighbourhood': rng.choice(NEIGHBOURHOODS),
+            'city': 'Cidade',
+            'state_uf': rng.choice(STATE_UFS),
+        })
+
+    return users
+
+def generate_account_owners(rng: random.Random, users: list[dict[str, Any]],
+                            max_accounts_per_user: int = 1) -> list[str]:
+    """
+    Returns the owner CPF of each account to open, in opening order: every
+    user opens between one and `max_accounts_per_user` accounts.
+    """
+    if max_accounts_per_user < 1:
+        raise ValueError('cada usuário deve abrir ao menos uma conta.')
+
+    return [user['cpf'] for user in users
+            for _ in range(rng.randint(1, max_accounts_per_user))]
+
+def zipf_cum_weights(amount: int, skew: float) -> list[float]:
+    """Returns the cumulative Zipf weights of the ranks 1 to `amount`"""
+    return list(accumulate(1 / rank ** skew for rank in range(1, amount + 1)))
+
+def generate_operations(rng: random.Random, accounts: int, amount: int,
+                        skew: float = DEFAULT_SKEW,
+                        withdrawal_ratio: float = DEFAULT_WITHDRAWAL_RATIO,
+                        days: int = 1) -> Iterator[Operation]:
+    """
+    Yields `amount` deposits and withdrawals over the accounts 1 to
+    `accounts`, spread evenly over `days` days.
+
+    Params:
+    @rng: the seeded random generator
+    @accounts: number of accounts
+    @amount: number of operations
+    @skew: exponent of the Zipf distribution of the accounts (0 is uniform)
+    @withdrawal_ratio: fraction of the operations that are withdrawals
+    @days: number of days the operations are spread over
+    """
+    if accounts < 1:
+        raise ValueError('a carga deve ter ao menos uma conta.')
+    if days < 1:
+        raise ValueError('a carga deve ter ao menos um dia.')
+
+    acc_ids = list(range(1, accounts + 1))
+    rng.shuffle(acc_ids) # acc_ids[k]: the account of rank k + 1
+    cum_weights = zipf_cum_weights(accounts, skew)
+    deposit_mu = math.log(DEPOSIT_MEDIAN)
+    withdrawal_mu = math.log(WITHDRAWAL_MEDIAN)
+    per_day = math.ceil(amount / days)
+    number = 0
+
+    while number < amount:
+        chunk = rng.choices(acc_ids, cum_weights=cum_weights,
+                            k=min(SAMPLE_CHUNK, amount - number))
+
+        for acc_id in chunk:
+            if rng.random() < withdrawal_ratio:
+                yield Operation(number // per_day, acc_id, 'withdrawal',
+                                max(1, round(rng.lognormvariate(withdrawal_mu, AMOUNT_SIGMA))))
+            else:
+                yield Operation(number // per_day, acc_id, 'deposit',
+                                max(1, round(rng.lognormvariate(deposit_mu, AMOUNT_SIGMA))))
+            number += 1
+
+class Workload:
+    """
+    A seeded workload: its users and account owners are built at once,
+    and its operations are generated again on each iteration of
+    `operations()`, always the same for the same parameters.
+
+    Params:
+    @seed: seed of the random generator
+    @users: number of users
+    @operations: number of deposits and withdrawals
+    @max_accounts_per_user: each user opens one to this many accounts
+    @skew: exponent of the Zipf distribution of the accounts
+    @withdrawal_ratio: fraction of the operations that are withdrawals
+    @days: number of days the operations are spread over
+    """
+
+    def __init__(self, seed: int = DEFAULT_SEED, users: int = 10000,
+                 operations: int = 1_000_000, max_accounts_per_user: int = 1,
+                 skew: float = DEFAULT_SKEW,
+                 withdrawal_ratio: float = DEFAULT_WITHDRAWAL_RATIO, days: int = 1):
+        rng = random.Random(seed)
+
+        self.seed = seed
+        self.operation_count = operations
+        self.skew = skew
+        self.withdrawal_ratio = withdrawal_ratio
+        self.days = days
+        self.users = generate_users(rng, users)
+        self.account_owners = generate_account_owners(rng, self.users, max_accounts_per_user)
+
+    def operations(self) -> Iterator[Operation]:
+        """Yields the workload's deposits and withdrawals"""
+        rng = random.Random(f'{self.seed}-operations')
+        return generate_operations(rng, len(self.account_owners), self.operation_count,
+                                   self.skew, self.withdrawal_ratio, self.days)
+
+    def write(self, directory: str) -> tuple[str, str]:
+        """
+        Writes `users.csv` (for `user_import.py`) and `operations.csv` (for
+        `batch.py`, with the values in reais) to `directory`, and returns
+        their paths. The accounts must be opened, in `account_owners`
+        order, before the operations are settled.
+        """
+        os.makedirs(directory, exist_ok=True)
+        users_path = os.path.join(directory, 'users.csv')
+        operations_path = os.path.join(directory, 'operations.csv')
+
+        with open(users_path, 'w', encoding='utf-8', newline='') as users_file:
+            writer = csv.DictWriter(users_file, fieldnames=list(self.users[0]) if self.users
+                                    else ['cpf'])
+            writer.writeheader()
+            writer.writerows(self.users)
+
+        with open(operations_path, 'w', encoding='utf-8', newline='') as operations_file:
+            writer = csv.writer(operations_file)
+            writer.writerow(('acc_id', 'operation_type', 'value'))
+            writer.writerows((operation.acc_id, operation.operation_type,
+                              format_cents(operation.value))
+                             for operation in self.operations())
+
+        return users_path, operations_path
+
+def add_workload_arguments(parser: argparse.ArgumentParser):
+    """Adds the workload's parameters to a command-line parser"""
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--users', type=int, default=10000, help='número de usuários')
+    parser.add_argument('--operations', type=int, default=1_000_000,
+                        help='número de depósitos e saques')
+    parser.add_argument('--max-accounts-per-user', type=int, default=1,
+                        help='cada usuário abre de uma a este número de contas')
+    parser.add_argument('--skew', type=float, default=DEFAULT_SKEW,
+                        help='expoente da distribuição de Zipf das contas (0 = uniforme)')
+    parser.add_argument('--withdrawal-ratio', type=float, default=DEFAULT_WITHDRAWAL_RATIO,
+                        help='fração das operações que são saques')
+    parser.add_argument('--days', type=int, default=1,
+                        help='número de dias em que as operações se distribuem')
+
+def workload_from_arguments(args: argparse.Namespace) -> Workload:
+    """Builds the workload described by the parsed `add_workload_arguments`"""
+    return Workload(args.seed, args.users, args.operations, args.max_accounts_per_user,
+                    args.skew, args.withdrawal_ratio, args.days)
+
+def main(argv: list[str] | None = None):
+    """Writes a workload from the command line"""
+    parser = argparse.ArgumentParser(description='Gerador de carga sintética')
+    parser.add_argument('output_dir', help='diretório onde os CSVs são gravados')
+    add_workload_arguments(parser)
+    args = parser.parse_args(argv)
+
+    users_path, operations_path = workload_from_arguments(args).write(args.output_dir)
+    print(f'Usuários:\t{users_path}')
+    print(f'Operações:\t{operations_path}')
+
+if __name__ == '__main__':
+    main()